@@ -4,49 +4,112 @@ msi_ec_helper.py - Helper privilegiado para escribir fan_mode, shift_mode, coole
 
 Se ejecuta con pkexec:
   pkexec python3 scripts/msi_ec_helper.py --fan_mode auto
+
+Con --serve queda en ejecución leyendo comandos JSON por stdin (uno por línea,
+p. ej. {"target": "fan_mode", "value": "auto"}) y respondiendo
+{"success": ..., "message": ...} por stdout.
 """
 
 from __future__ import annotations
 
 import argparse
-from pathlib import Path
+import contextlib
+import io
+import json
+import os
 import sys
 
-BASE = Path("/sys/devices/platform/msi-ec")
-BRIGHTNESS_PATH = Path("/sys/class/leds/msiacpi::kbd_backlight/brightness")
+BASE = "/sys/devices/platform/msi-ec"
+FAN_MODE_PATH = f"{BASE}/fan_mode"
+SHIFT_MODE_PATH = f"{BASE}/shift_mode"
+COOLER_BOOST_PATH = f"{BASE}/cooler_boost"
+BRIGHTNESS_PATH = "/sys/class/leds/msiacpi::kbd_backlight/brightness"
+
+# Destinos aceptados en modo --serve (mismos que las opciones de línea de comandos)
+TARGETS = {
+    "fan_mode": FAN_MODE_PATH,
+    "shift_mode": SHIFT_MODE_PATH,
+    "cooler_boost": COOLER_BOOST_PATH,
+    "brightness": BRIGHTNESS_PATH,
+}
 
 
-def write_value(path: Path, value: str) -> bool:
+def write_value(path: str, value: str) -> bool:
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(str(value))
+        fd = os.open(path, os.O_WRONLY)
+        try:
+            os.write(fd, str(value).encode("ascii"))
+        finally:
+            os.close(fd)
         return True
     except Exception as exc:
         print(f"Error escribiendo {path}: {exc}", file=sys.stderr)
         return False
 
 
+def _handle_command(command: dict) -> dict:
+    target = command.get("target")
+    value = command.get("value")
+    path = TARGETS.get(target)
+    if path is None:
+        return {"success": False, "message": f"Destino no soportado: {target}"}
+    if value is None or value == "":
+        return {"success": False, "message": "Nada que aplicar"}
+    captured = io.StringIO()
+    with contextlib.redirect_stderr(captured):
+        ok = write_value(path, str(value))
+    if ok:
+        return {"success": True, "message": f"{target} aplicado"}
+    return {"success": False, "message": captured.getvalue().strip() or f"No se pudo ajustar {target}"}
+
+
+def serve() -> int:
+    """
+    Bucle de comandos JSON por stdin hasta EOF.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            command = json.loads(line)
+            reply = _handle_command(command) if isinstance(command, dict) else {
+                "success": False,
+                "message": "Comando inválido",
+            }
+        except ValueError:
+            reply = {"success": False, "message": "JSON inválido"}
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(description="Helper msi-ec (requiere root).")
     parser.add_argument("--fan_mode", type=str, help="Modo de ventilador (auto/silent/basic/advanced)")
     parser.add_argument("--shift_mode", type=str, help="Modo shift (eco/comfort/sport/turbo, según soporte)")
     parser.add_argument("--cooler_boost", type=str, help="0/1 o on/off para cooler_boost")
     parser.add_argument("--brightness", type=int, help="0-3 brillo teclado (msi backlight)")
+    parser.add_argument("--serve", action="store_true", help="Leer comandos JSON por stdin hasta EOF")
     args = parser.parse_args()
 
-    if not (args.fan_mode or args.shift_mode or args.cooler_boost or args.brightness is not None):
+    if args.serve:
+        return serve()
+
+    attrs = [
+        (FAN_MODE_PATH, args.fan_mode or None),
+        (SHIFT_MODE_PATH, args.shift_mode or None),
+        (COOLER_BOOST_PATH, args.cooler_boost),
+        (BRIGHTNESS_PATH, None if args.brightness is None else int(args.brightness)),
+    ]
+    pending = [(path, value) for path, value in attrs if value is not None]
+    if not pending:
         print("Nada que aplicar", file=sys.stderr)
         return 1
 
     ok = True
-    if args.fan_mode:
-        ok = write_value(BASE / "fan_mode", args.fan_mode) and ok
-    if args.shift_mode:
-        ok = write_value(BASE / "shift_mode", args.shift_mode) and ok
-    if args.cooler_boost is not None:
-        ok = write_value(BASE / "cooler_boost", args.cooler_boost) and ok
-    if args.brightness is not None:
-        ok = write_value(BRIGHTNESS_PATH, str(int(args.brightness))) and ok
+    for path, value in pending:
+        ok = write_value(path, str(value)) and ok
 
     return 0 if ok else 1
 
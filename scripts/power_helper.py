@@ -4,76 +4,198 @@ power_helper.py - Helper privilegiado para ajustar gobernador/frecuencia.
 
 Se espera ser invocado con pkexec:
   pkexec python3 scripts/power_helper.py --governor performance
+
+Con --serve queda en ejecución leyendo comandos JSON por stdin (uno por línea,
+p. ej. {"governor": "performance", "max_freq_khz": 3200000}) y respondiendo
+{"success": ..., "message": ...} por stdout, para no pagar pkexec en cada escritura.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
 import glob
+import io
+import json
+import os
 import sys
+from typing import Dict, List, Optional, Set, Tuple
 
 
-def write_governor(governor: str) -> bool:
-    cpu_paths = glob.glob("/sys/devices/system/cpu/cpu[0-9]*/cpufreq")
-    if not cpu_paths:
-        print("No se encontraron rutas cpufreq", file=sys.stderr)
-        return False
-    success = 0
-    for path in cpu_paths:
-        gov_path = f"{path}/scaling_governor"
-        try:
-            with open(gov_path, "w", encoding="utf-8") as f:
-                f.write(governor)
-            success += 1
-        except Exception as exc:
-            print(f"Fallo escribiendo {gov_path}: {exc}", file=sys.stderr)
+def _online_cpus() -> Optional[Set[int]]:
+    """
+    CPUs en línea según /sys/devices/system/cpu/online (formato "0-3,6,8-11").
+    None si no se puede leer.
+    """
+    try:
+        with open("/sys/devices/system/cpu/online", "r", encoding="utf-8") as f:
+            spec = f.read().strip()
+    except OSError:
+        return None
+    cpus: Set[int] = set()
+    for part in spec.split(","):
+        if not part:
             continue
-    return success > 0
+        start, _, end = part.partition("-")
+        cpus.update(range(int(start), int(end or start) + 1))
+    return cpus
+
+
+@functools.lru_cache(maxsize=1)
+def _cpufreq_paths() -> tuple:
+    """
+    Rutas cpufreq a escribir: una por policy (kernels modernos) o, si no hay,
+    una por CPU en línea.
+    """
+    policies = glob.glob("/sys/devices/system/cpu/cpufreq/policy*")
+    if policies:
+        return tuple(policies)
+    paths = glob.glob("/sys/devices/system/cpu/cpu[0-9]*/cpufreq")
+    online = _online_cpus()
+    if online is not None:
+        # .../cpuN/cpufreq -> N
+        paths = [p for p in paths if int(os.path.basename(os.path.dirname(p))[3:]) in online]
+    return tuple(paths)
+
 
+def _write_sysfs(path: str, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
-def write_max_freq(khz: int) -> bool:
-    cpu_paths = glob.glob("/sys/devices/system/cpu/cpu[0-9]*/cpufreq")
+
+def _read_sysfs(path: str) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_if_changed(path: str, value: str, data: bytes) -> bool:
+    if _read_sysfs(path) == value:
+        # Ya aplicado: evitar una escritura innecesaria
+        return True
+    try:
+        _write_sysfs(path, data)
+        return True
+    except Exception as exc:
+        print(f"Fallo escribiendo {path}: {exc}", file=sys.stderr)
+        return False
+
+
+def apply_settings(governor: Optional[str] = None, khz: Optional[int] = None) -> Dict[str, bool]:
+    """
+    Aplica gobernador y/o frecuencia máxima en una única pasada por las rutas cpufreq.
+
+    Devuelve, por cada ajuste solicitado ("governor", "max_freq"), si se pudo
+    escribir en al menos una ruta.
+    """
+    targets = []
+    if governor:
+        targets.append(("governor", "scaling_governor", governor))
+    if khz:
+        targets.append(("max_freq", "scaling_max_freq", str(int(khz))))
+    if not targets:
+        return {}
+
+    cpu_paths = _cpufreq_paths()
     if not cpu_paths:
         print("No se encontraron rutas cpufreq", file=sys.stderr)
-        return False
-    success = 0
+        return {key: False for key, _, _ in targets}
+
+    payloads = [(key, attr, value, value.encode("ascii")) for key, attr, value in targets]
+    results = {key: False for key, _, _ in targets}
     for path in cpu_paths:
-        freq_path = f"{path}/scaling_max_freq"
-        try:
-            with open(freq_path, "w", encoding="utf-8") as f:
-                f.write(str(int(khz)))
-            success += 1
-        except Exception as exc:
-            print(f"Fallo escribiendo {freq_path}: {exc}", file=sys.stderr)
+        for key, attr, value, data in payloads:
+            if _write_if_changed(f"{path}/{attr}", value, data):
+                results[key] = True
+    return results
+
+
+def _summarize(results: Dict[str, bool], governor: Optional[str], khz: Optional[int]) -> Tuple[bool, List[str]]:
+    """
+    Traduce el resultado de apply_settings a (éxito, mensajes).
+    """
+    ok = True
+    messages: List[str] = []
+    if governor:
+        if results.get("governor"):
+            messages.append(f"Gobernador establecido a {governor}")
+        else:
+            ok = False
+            messages.append("No se pudo escribir gobernador (revisar permisos o cpufreq)")
+    if khz:
+        if results.get("max_freq"):
+            messages.append(f"Frecuencia máxima fijada a {khz} kHz")
+        else:
+            ok = False
+            messages.append("No se pudo escribir frecuencia máxima (revisar permisos o cpufreq)")
+    return ok, messages
+
+
+def _handle_command(command: Dict) -> Dict:
+    governor = command.get("governor") or None
+    khz = command.get("max_freq_khz") or None
+    if not governor and not khz:
+        return {"success": False, "message": "Nada que aplicar"}
+    try:
+        khz = int(khz) if khz else None
+    except (TypeError, ValueError):
+        return {"success": False, "message": "Frecuencia inválida"}
+    # Capturar los avisos por archivo para devolverlos en la respuesta
+    captured = io.StringIO()
+    with contextlib.redirect_stderr(captured):
+        results = apply_settings(governor=governor, khz=khz)
+    ok, messages = _summarize(results, governor, khz)
+    details = captured.getvalue().strip()
+    if not ok and details:
+        messages.append(details)
+    return {"success": ok, "message": " | ".join(messages)}
+
+
+def serve() -> int:
+    """
+    Bucle de comandos JSON por stdin hasta EOF.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
             continue
-    return success > 0
+        try:
+            command = json.loads(line)
+            reply = _handle_command(command) if isinstance(command, dict) else {
+                "success": False,
+                "message": "Comando inválido",
+            }
+        except ValueError:
+            reply = {"success": False, "message": "JSON inválido"}
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+    return 0
 
 
 def main():
     parser = argparse.ArgumentParser(description="Helper para ajustar gobernador/frecuencia (requiere root).")
     parser.add_argument("--governor", type=str, help="Gobernador a aplicar (performance, powersave, etc.)")
     parser.add_argument("--max-freq-khz", type=int, help="Frecuencia máxima en kHz")
+    parser.add_argument("--serve", action="store_true", help="Leer comandos JSON por stdin hasta EOF")
     args = parser.parse_args()
 
+    if args.serve:
+        return serve()
+
     if not args.governor and not args.max_freq_khz:
         print("Nada que aplicar", file=sys.stderr)
         return 1
 
-    if args.governor:
-        if write_governor(args.governor):
-            print(f"Gobernador establecido a {args.governor}")
-        else:
-            print("No se pudo escribir gobernador (revisar permisos o cpufreq)", file=sys.stderr)
-            return 1
-
-    if args.max_freq_khz:
-        if write_max_freq(args.max_freq_khz):
-            print(f"Frecuencia máxima fijada a {args.max_freq_khz} kHz")
-        else:
-            print("No se pudo escribir frecuencia máxima (revisar permisos o cpufreq)", file=sys.stderr)
-            return 1
-
-    return 0
+    results = apply_settings(governor=args.governor, khz=args.max_freq_khz)
+    ok, messages = _summarize(results, args.governor, args.max_freq_khz)
+    print("\n".join(messages), file=sys.stdout if ok else sys.stderr)
+    return 0 if ok else 1
 
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ sobrescribe los valores por defecto.
 
 from __future__ import annotations
 
+import copy
 import json
 from pathlib import Path
 from typing import Any, Dict
@@ -17,6 +18,15 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "history_duration": 3600,
     "process_refresh_interval": 5.0,
     "process_list_limit": 50,
+    # Segundos entre refrescos de cada panel auxiliar de la GUI
+    "aux_refresh_intervals": {
+        "thermals": 1.0,
+        "gpu": 10.0,
+        "power": 5.0,
+        "rgb": 30.0,
+        "fan_pwm": 30.0,
+        "msi_ec": 2.0,
+    },
     "use_pkexec": False,
     "alerts": {
         "cpu_warn": 85.0,
@@ -38,30 +48,36 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 }
 
 
+_CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.json"
+
+
 def load_config() -> Dict[str, Any]:
     """
     Carga config.json si existe en la raíz del proyecto, fusionando con defaults.
-    """
-    base_dir = Path(__file__).resolve().parent.parent
-    config_path = base_dir / "config.json"
-    config = DEFAULT_CONFIG.copy()
 
-    if config_path.exists():
-        try:
-            with config_path.open("r", encoding="utf-8") as f:
-                user_cfg = json.load(f)
-                _deep_update(config, user_cfg)
-        except Exception:
-            # Si falla, usamos los defaults y seguimos.
-            pass
+    Cada llamada devuelve un diccionario nuevo (los defaults se copian en
+    profundidad), así que modificarlo no afecta a otros llamadores.
+    """
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    try:
+        with _CONFIG_PATH.open("r", encoding="utf-8") as f:
+            user_cfg = json.load(f)
+            _deep_update(config, user_cfg)
+    except Exception:
+        # Sin archivo o si falla, usamos los defaults y seguimos.
+        pass
 
     return config
 
 
 def _deep_update(target: Dict[str, Any], source: Dict[str, Any]) -> None:
-    """Actualiza recursivamente un diccionario destino con valores de otro."""
-    for key, value in source.items():
-        if isinstance(value, dict) and isinstance(target.get(key), dict):
-            _deep_update(target[key], value)
-        else:
-            target[key] = value
+    """Actualiza un diccionario destino con valores de otro, fusionando subdiccionarios."""
+    stack = [(target, source)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                stack.append((current, value))
+            else:
+                dst[key] = value
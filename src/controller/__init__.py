@@ -4,9 +4,11 @@ controller - Módulo de Control de la Aplicación
 Este paquete contiene las clases del Controlador en el patrón MVC:
 - AppController: Controlador principal de la aplicación
 - ThreadManager: Gestión de hilos para tareas asíncronas
+- HistoryBuffer: Buffer circular del historial de métricas
 """
 
 from .app_controller import AppController
 from .thread_manager import ThreadManager
+from .history_buffer import HistoryBuffer
 
-__all__ = ['AppController', 'ThreadManager']
+__all__ = ['AppController', 'ThreadManager', 'HistoryBuffer']
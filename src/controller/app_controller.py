@@ -7,15 +7,38 @@ central del patrón MVC, coordinando el Modelo y la Vista.
 Autor: Project Monitor Team
 """
 
+import logging
 import time
 import os
+import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable
-from collections import deque
 
+import psutil
+
+from config import DEFAULT_CONFIG
+from formatting import format_bytes
 from model.system_data import SystemData
 from model.process_manager import ProcessManager
+from model.process_table import ProcessTable
+from model.sensors import SensorsReader
+from model.gpu_manager import GPUManager
+from model.power_manager import PowerManager
+from model.fan_manager import FanManager
+from model.rgb_manager import RGBManager
+from model.app_profiles import AppProfiles
+from model.msi_ec_manager import MsiEcManager
 from controller.thread_manager import ThreadManager
+from controller.history_buffer import HistoryBuffer
+
+logger = logging.getLogger(__name__)
+
+# Secuencia ANSI: cursor al inicio + borrar pantalla (evita fork/exec de `clear`)
+_CLEAR_SCREEN = "\x1b[H\x1b[2J"
+# Muestras extra que conserva el historial además de history_duration / update_interval
+_HISTORY_MARGIN = 16
+# Segundos durante los que se reutiliza la última lectura de batería
+_BATTERY_TTL = 5.0
 
 
 class AppController:
@@ -28,10 +51,6 @@ class AppController:
     - Controller: Esta clase, que orquesta la lógica de la aplicación
     """
     
-    # Constantes
-    DEFAULT_UPDATE_INTERVAL = 2.0  # Intervalo de actualización en segundos
-    DEFAULT_HISTORY_DURATION = 3600  # Duración del historial en segundos (1 hora)
-    
     def __init__(self, update_interval: Optional[float] = None, history_duration: Optional[int] = None, config: Optional[Dict[str, Any]] = None):
         """
         Inicializa el controlador de la aplicación.
@@ -39,49 +58,46 @@ class AppController:
         Instancia los componentes del modelo y el gestor de hilos.
         """
         self._config = config or {}
-        self.UPDATE_INTERVAL = update_interval or self.DEFAULT_UPDATE_INTERVAL
-        self.HISTORY_DURATION = history_duration or self.DEFAULT_HISTORY_DURATION
-        self.MAX_HISTORY_ENTRIES = max(1, int(self.HISTORY_DURATION // max(0.5, self.UPDATE_INTERVAL)))
+        # Intervalo (s) y duración del historial (s); los defaults vienen de config.py
+        self._update_interval = float(update_interval or DEFAULT_CONFIG["update_interval"])
+        self._history_duration = int(history_duration or DEFAULT_CONFIG["history_duration"])
+        # Capacidad fija del historial: la ventana completa más un pequeño margen, para que
+        # el jitter del intervalo no deje la ventana más larga (60 min) sin su extremo antiguo
+        self._maxlen = max(1, int(self._history_duration // max(0.5, self._update_interval))) + _HISTORY_MARGIN
 
         # Instanciar componentes del Modelo
         self._system_data = SystemData()
         self._process_manager = ProcessManager()
         # Módulos extendidos
-        from model.sensors import SensorsReader
-        from model.gpu_manager import GPUManager
-        from model.power_manager import PowerManager
-        from model.fan_manager import FanManager
-        from model.rgb_manager import RGBManager
-        from model.app_profiles import AppProfiles
-
         self._sensors = SensorsReader()
         self._gpu_manager = GPUManager()
         self._power_manager = PowerManager(config=self._config)
-        self._fan_manager = FanManager()
+        self._fan_manager = FanManager(self._sensors)
         self._rgb_manager = RGBManager()
         self._profiles = AppProfiles(self._power_manager, self._fan_manager, self._config.get("profiles", {}))
-        from model.msi_ec_manager import MsiEcManager
         self._msi_ec_manager = MsiEcManager(use_pkexec=self._config.get("use_pkexec", False))
         
         # Instanciar el gestor de hilos
         self._thread_manager = ThreadManager()
         
         # Estructura para almacenar el historial de métricas (últimas 1 hora)
-        # Usamos deque con maxlen para que automáticamente descarte los más antiguos
-        self._metrics_history: deque = deque(maxlen=int(self.MAX_HISTORY_ENTRIES))
+        # Buffer circular por columnas: descarta automáticamente los más antiguos
+        self._metrics_history = HistoryBuffer(self._maxlen)
         
         # Datos actuales (última lectura)
         self._current_metrics: Optional[Dict[str, Any]] = None
+        # (instante monotónico, resultado) de la última lectura de batería
+        self._battery_cache: Optional[tuple] = None
         
         # Flag para controlar si el monitoreo está activo
         self._is_monitoring = False
         
-        # Callback opcional para notificar a la Vista de actualizaciones
-        # En una implementación real con GUI, aquí se conectaría el callback
-        # que actualiza los widgets de la interfaz
-        self._view_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+        # Destino de las notificaciones a la Vista. Por defecto imprime por
+        # consola; set_view_callback lo reemplaza directamente por el callback
+        # de la GUI para no evaluar condiciones en cada tick
+        self._notify: Callable[[Dict[str, Any]], None] = self._print_metrics_to_console
         
-        print("[AppController] Controller initialized.")
+        logger.debug("Controller initialized.")
     
     def set_view_callback(self, callback: Callable[[Dict[str, Any]], None]) -> None:
         """
@@ -92,8 +108,8 @@ class AppController:
         Args:
             callback: Función que recibe los datos actualizados.
         """
-        self._view_callback = callback
-        print("[AppController] View callback registered.")
+        self._notify = callback
+        logger.debug("View callback registered.")
     
     def update_metrics(self) -> None:
         """
@@ -108,65 +124,53 @@ class AppController:
         """
         try:
             # Obtener todas las métricas del sistema
-            self._current_metrics = self._system_data.get_all_metrics()
+            metrics = self._system_data.get_all_metrics()
             
             # Agregar timestamp de lectura
-            self._current_metrics['read_time'] = datetime.now().isoformat()
+            metrics['read_time'] = datetime.now().isoformat()
+            self._current_metrics = metrics
             
-            # Almacenar en el historial (deque maneja automáticamente el límite)
-            self._metrics_history.append({
-                'timestamp': self._current_metrics['timestamp'],
-                'cpu_percent': self._current_metrics['cpu']['total_percent'],
-                'ram_percent': self._current_metrics['ram']['percent'],
-                'network_upload': self._current_metrics['network']['upload_speed'],
-                'network_download': self._current_metrics['network']['download_speed']
-            })
+            # Almacenar en el historial (el buffer circular maneja el límite);
+            # se escriben escalares en columnas, sin crear un dict por muestra
+            network = metrics['network']
+            self._metrics_history.append(
+                metrics['timestamp'],
+                metrics['cpu']['total_percent'],
+                metrics['ram']['percent'],
+                network['upload_speed'],
+                network['download_speed'],
+            )
             
             # Notificar a la Vista
-            self._notify_view()
+            self._notify(metrics)
             
         except Exception as e:
-            print(f"[AppController] Error updating metrics: {e}")
-    
-    def _notify_view(self) -> None:
-        """
-        Notifica a la Vista que hay nuevos datos disponibles.
-        
-        Por defecto, imprime los datos por consola.
-        Si hay un callback registrado, lo llama con los datos.
-        """
-        if self._current_metrics is None:
-            return
-        
-        # Si hay un callback de Vista registrado, usarlo
-        if self._view_callback:
-            self._view_callback(self._current_metrics)
-            return
-        
-        # Comportamiento por defecto: imprimir por consola
-        self._print_metrics_to_console()
+            logger.error("Error updating metrics: %s", e)
     
-    def _print_metrics_to_console(self) -> None:
+    def _print_metrics_to_console(self, metrics: Dict[str, Any]) -> None:
         """
         Imprime las métricas actuales por consola (Vista simulada).
         
         Este método actúa como un placeholder para la Vista real.
         En producción, sería reemplazado por la actualización de widgets GUI.
-        """
-        if self._current_metrics is None:
-            return
         
+        Args:
+            metrics: Métricas a mostrar.
+        """
         # Limpiar consola (multiplataforma)
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            sys.stdout.write(_CLEAR_SCREEN)
         
         print("=" * 60)
         print(" PROJECT MONITOR - System Resource Monitor")
         print("=" * 60)
-        print(f" Last Update: {self._current_metrics['read_time']}")
+        print(f" Last Update: {metrics['read_time']}")
         print("-" * 60)
         
         # CPU Info
-        cpu = self._current_metrics['cpu']
+        cpu = metrics['cpu']
         print(f"\n [CPU]")
         print(f"   Total Usage: {cpu['total_percent']:.1f}%")
         print(f"   Cores: {cpu['core_count']} physical, {cpu['logical_count']} logical")
@@ -180,7 +184,7 @@ class AppController:
         print(f"   Per Core: {core_usage}")
         
         # RAM Info
-        ram = self._current_metrics['ram']
+        ram = metrics['ram']
         print(f"\n [RAM]")
         print(f"   Used: {self._format_bytes(ram['used'])} / {self._format_bytes(ram['total'])}")
         print(f"   Available: {self._format_bytes(ram['available'])}")
@@ -188,7 +192,7 @@ class AppController:
         print(f"   Fragmentation: {ram['fragmentation']*100:.1f}% (simulated)")
         
         # Storage Info
-        storage = self._current_metrics['storage']
+        storage = metrics['storage']
         print(f"\n [STORAGE]")
         for partition in storage['partitions'][:3]:  # Mostrar primeras 3 particiones
             print(f"   {partition['mountpoint']}: {partition['percent']:.1f}% used "
@@ -196,7 +200,7 @@ class AppController:
             print(f"      Fragmentation: {partition['fragmentation']*100:.1f}% (simulated)")
         
         # Network Info
-        network = self._current_metrics['network']
+        network = metrics['network']
         print(f"\n [NETWORK]")
         print(f"   Upload Speed: {self._format_bytes(network['upload_speed'])}/s")
         print(f"   Download Speed: {self._format_bytes(network['download_speed'])}/s")
@@ -206,7 +210,7 @@ class AppController:
         # History Info
         print(f"\n [HISTORY]")
         print(f"   Data points stored: {len(self._metrics_history)}")
-        print(f"   History duration: {len(self._metrics_history) * self.UPDATE_INTERVAL:.0f}s")
+        print(f"   History duration: {len(self._metrics_history) * self._update_interval:.0f}s")
         
         print("\n" + "=" * 60)
         print(" Press Ctrl+C to stop monitoring")
@@ -214,55 +218,43 @@ class AppController:
     
     @staticmethod
     def _format_bytes(bytes_value: float) -> str:
-        """
-        Formatea un valor en bytes a una representación legible.
-        
-        Args:
-            bytes_value: Valor en bytes.
-        
-        Returns:
-            String formateado (ej: "1.5 GB", "256 MB").
-        """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if abs(bytes_value) < 1024.0:
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.2f} PB"
+        """Formatea bytes para la consola (ver formatting.format_bytes)."""
+        return format_bytes(bytes_value, precision=2)
     
     def start_monitoring(self) -> None:
         """
         Inicia el monitoreo del sistema.
         
         Utiliza el ThreadManager para ejecutar update_metrics()
-        cada UPDATE_INTERVAL segundos.
+        cada intervalo de actualización configurado.
         """
         if self._is_monitoring:
-            print("[AppController] Monitoring already active.")
+            logger.debug("Monitoring already active.")
             return
         
         # Iniciar el hilo de recolección de datos
         success = self._thread_manager.start_data_collection_thread(
             callback=self.update_metrics,
-            interval=self.UPDATE_INTERVAL,
+            interval=self._update_interval,
             thread_name="system_monitor"
         )
         
         if success:
             self._is_monitoring = True
-            print("[AppController] Monitoring started.")
+            logger.debug("Monitoring started.")
     
     def stop_monitoring(self) -> None:
         """
         Detiene el monitoreo del sistema.
         """
         if not self._is_monitoring:
-            print("[AppController] Monitoring is not active.")
+            logger.debug("Monitoring is not active.")
             return
         
         # Detener el hilo de recolección
         self._thread_manager.stop_thread("system_monitor")
         self._is_monitoring = False
-        print("[AppController] Monitoring stopped.")
+        logger.debug("Monitoring stopped.")
     
     def get_current_metrics(self) -> Optional[Dict[str, Any]]:
         """
@@ -280,7 +272,26 @@ class AppController:
         Returns:
             Lista con el historial de métricas (hasta 1 hora).
         """
-        return list(self._metrics_history)
+        return self._metrics_history.to_dicts()
+
+    def get_metrics_history_columns(self, window: Optional[float] = None) -> Dict[str, List[float]]:
+        """
+        Obtiene el historial de métricas en formato columnar.
+        
+        Args:
+            window: Si se indica, solo los últimos ``window`` segundos.
+        
+        Returns:
+            Diccionario campo -> lista de valores en orden cronológico
+            (timestamp, cpu_percent, ram_percent, network_upload, network_download).
+        """
+        return self._metrics_history.columns(window)
+
+    def get_history_size(self) -> int:
+        """
+        Obtiene el número de muestras almacenadas en el historial.
+        """
+        return len(self._metrics_history)
 
     def get_storage_snapshot(self) -> Dict[str, Any]:
         """
@@ -301,6 +312,18 @@ class AppController:
         """
         return self._process_manager.get_process_list(**kwargs)
 
+    def get_process_table(self, **kwargs) -> ProcessTable:
+        """
+        Obtiene los procesos del sistema en formato de columnas.
+        
+        Args:
+            **kwargs: Argumentos para ProcessManager.get_process_table()
+        
+        Returns:
+            ProcessTable con los procesos.
+        """
+        return self._process_manager.get_process_table(**kwargs)
+
     # ---- Extensiones estilo Dragon Center ----
     def get_temperatures(self) -> Dict[str, Any]:
         return self._sensors.get_temperatures()
@@ -312,6 +335,7 @@ class AppController:
         return self._fan_manager.set_pwm(pwm_path, value)
 
     def get_gpu_info(self) -> List[Dict[str, Any]]:
+        # Puede lanzar nvidia-smi/rocm-smi: la vista la llama desde el QThreadPool
         return self._gpu_manager.get_gpu_info()
 
     def get_power_state(self) -> Dict[str, Any]:
@@ -337,18 +361,27 @@ class AppController:
         return {"success": success, "message": " | ".join([m for m in messages if m])}
 
     def get_battery_info(self) -> Dict[str, Any]:
+        """
+        Estado de la batería; la lectura se reutiliza durante _BATTERY_TTL segundos.
+
+        psutil.sensors_battery() recorre /sys/class/power_supply en cada llamada
+        y el panel térmico la consulta cada segundo.
+        """
+        cached = self._battery_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < _BATTERY_TTL:
+            return cached[1]
         try:
-            import psutil
             bat = psutil.sensors_battery()
-            if not bat:
-                return {}
-            return {
+            info = {
                 "percent": bat.percent,
                 "plugged": bat.power_plugged,
                 "secs_left": bat.secsleft,
-            }
+            } if bat else {}
         except Exception:
-            return {}
+            info = {}
+        self._battery_cache = (now, info)
+        return info
 
     def rgb_available(self) -> bool:
         return self._config.get("rgb_enabled", False) and self._rgb_manager.is_available()
@@ -368,6 +401,10 @@ class AppController:
     def get_msi_ec_info(self) -> Dict[str, Any]:
         return self._msi_ec_manager.get_info()
 
+    def get_msi_ec_snapshot(self) -> Dict[str, Any]:
+        """Estado MSI-EC, webcam, backlight y umbrales de batería en una sola llamada."""
+        return self._msi_ec_manager.get_snapshot()
+
     def set_msi_fan_mode(self, mode: str) -> Dict[str, Any]:
         return self._msi_ec_manager.set_fan_mode(mode)
 
@@ -408,6 +445,21 @@ class AppController:
         """
         return self._process_manager.kill_process(pid, force)
     
+    def kill_process_async(self, pid: int, force: bool = False,
+                           on_done: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Envía la señal de terminación sin bloquear; el resultado final llega a on_done.
+        
+        Args:
+            pid: ID del proceso a terminar.
+            force: Si True, usa terminación forzada.
+            on_done: Callback con el resultado (invocado desde otro hilo).
+        
+        Returns:
+            Resultado inmediato (success=None si queda pendiente).
+        """
+        return self._process_manager.kill_process_async(pid, force, on_done)
+    
     def search_process(self, name: str) -> List[Dict[str, Any]]:
         """
         Busca procesos por nombre.
@@ -435,7 +487,10 @@ class AppController:
         
         Debe llamarse antes de cerrar la aplicación.
         """
-        print("[AppController] Cleaning up...")
+        logger.debug("Cleaning up...")
         self.stop_monitoring()
         self._thread_manager.stop_all_threads()
-        print("[AppController] Cleanup complete.")
+        self._power_manager.close()
+        self._sensors.close()
+        self._system_data.close()
+        logger.debug("Cleanup complete.")
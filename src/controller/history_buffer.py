@@ -0,0 +1,113 @@
+"""
+history_buffer.py - Buffer circular del historial de métricas
+
+Este módulo contiene la clase HistoryBuffer, que almacena el historial en
+columnas preasignadas (una por campo) en lugar de un diccionario por muestra.
+
+Autor: Project Monitor Team
+"""
+
+import threading
+from array import array
+from typing import Dict, List, Any, Optional
+
+
+class HistoryBuffer:
+    """
+    Buffer circular de tamaño fijo con layout por columnas (SoA).
+
+    Cada campo se guarda en un ``array('d')`` preasignado; al llenarse,
+    las nuevas muestras sobrescriben a las más antiguas.
+    """
+
+    FIELDS = ('timestamp', 'cpu_percent', 'ram_percent', 'network_upload', 'network_download')
+
+    def __init__(self, capacity: int):
+        """
+        Inicializa el buffer.
+
+        Args:
+            capacity: Número máximo de muestras a conservar.
+        """
+        self._capacity = max(1, int(capacity))
+        self._columns: Dict[str, array] = {
+            field: array('d', bytes(8 * self._capacity)) for field in self.FIELDS
+        }
+        self._index = 0  # Próxima posición a escribir
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, cpu_percent: float, ram_percent: float,
+               network_upload: float, network_download: float) -> None:
+        """Agrega una muestra, descartando la más antigua si el buffer está lleno."""
+        cols = self._columns
+        with self._lock:
+            i = self._index
+            cols['timestamp'][i] = timestamp
+            cols['cpu_percent'][i] = cpu_percent
+            cols['ram_percent'][i] = ram_percent
+            cols['network_upload'][i] = network_upload
+            cols['network_download'][i] = network_download
+            self._index = (i + 1) % self._capacity
+            if self._size < self._capacity:
+                self._size += 1
+
+    def columns(self, window: Optional[float] = None) -> Dict[str, List[float]]:
+        """
+        Devuelve cada campo como lista en orden cronológico.
+
+        Args:
+            window: Si se indica, solo las muestras de los últimos ``window``
+                    segundos respecto a la más reciente. El inicio se busca por
+                    bisección y solo se copia esa ventana.
+
+        Returns:
+            Diccionario campo -> lista de valores (de la más antigua a la más reciente).
+        """
+        with self._lock:
+            skip = 0 if window is None else self._window_start(window)
+            return {field: self._ordered(col, skip) for field, col in self._columns.items()}
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Devuelve el historial como lista de diccionarios (formato clásico)."""
+        cols = self.columns()
+        return [dict(zip(self.FIELDS, row)) for row in zip(*(cols[f] for f in self.FIELDS))]
+
+    def _window_start(self, window: float) -> int:
+        """
+        Posición cronológica de la primera muestra con timestamp >= último - window.
+
+        Los timestamps se escriben en orden creciente, así que el anillo leído
+        desde la muestra más antigua está ordenado y admite búsqueda binaria.
+        """
+        if not self._size:
+            return 0
+        ts = self._columns['timestamp']
+        first = self._index if self._size == self._capacity else 0
+        cap = self._capacity
+        cutoff = ts[(first + self._size - 1) % cap] - window
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if ts[(first + mid) % cap] < cutoff:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _ordered(self, col: array, skip: int = 0) -> List[float]:
+        """Copia cronológica de una columna, omitiendo las ``skip`` muestras más antiguas."""
+        if self._size < self._capacity:
+            return col[skip:self._size].tolist()
+        start = self._index + skip
+        if start >= self._capacity:
+            start -= self._capacity
+            return col[start:self._index].tolist()
+        return col[start:].tolist() + col[:self._index].tolist()
@@ -7,10 +7,13 @@ asíncrona de tareas de recolección de datos utilizando threading.
 Autor: Project Monitor Team
 """
 
+import logging
 import threading
 import time
 from typing import Callable, Optional
 
+logger = logging.getLogger(__name__)
+
 
 class ThreadManager:
     """
@@ -26,7 +29,9 @@ class ThreadManager:
         """
         self._threads = {}  # Diccionario de hilos activos
         self._stop_events = {}  # Eventos para detener hilos
-        self._lock = threading.Lock()  # Lock para operaciones thread-safe
+        # Lock reentrante para operaciones de escritura (restart anida stop/start).
+        # Las lecturas no lo toman: las consultas de dict son atómicas con el GIL.
+        self._lock = threading.RLock()
     
     def start_data_collection_thread(self, 
                                       callback: Callable[[], None],
@@ -47,7 +52,7 @@ class ThreadManager:
         with self._lock:
             # Verificar si ya existe un hilo con ese nombre
             if thread_name in self._threads and self._threads[thread_name].is_alive():
-                print(f"[ThreadManager] Thread '{thread_name}' already running.")
+                logger.warning("Thread '%s' already running.", thread_name)
                 return False
             
             # Crear evento de parada para este hilo
@@ -65,7 +70,7 @@ class ThreadManager:
             self._threads[thread_name] = thread
             thread.start()
             
-            print(f"[ThreadManager] Thread '{thread_name}' started with interval {interval}s.")
+            logger.debug("Thread '%s' started with interval %ss.", thread_name, interval)
             return True
     
     def _collection_worker(self, 
@@ -80,16 +85,30 @@ class ThreadManager:
             interval: Intervalo entre ejecuciones.
             stop_event: Evento para señalar la parada del hilo.
         """
-        while not stop_event.is_set():
+        # Programar por deadline monotónico: el periodo no deriva con la
+        # duración del callback
+        next_run = time.monotonic()
+        while True:
             try:
                 # Ejecutar el callback
                 callback()
-            except Exception as e:
-                print(f"[ThreadManager] Error in callback: {e}")
+            except Exception:
+                logger.exception("Error in callback")
+            
+            next_run += interval
+            now = time.monotonic()
+            if next_run <= now:
+                # El callback tardó más que el intervalo: no intentar recuperar
+                # las ejecuciones perdidas, reprogramar desde ahora con un
+                # intervalo completo (un callback siempre lento no encadena
+                # ejecuciones sin pausa)
+                next_run = now + interval
+            remaining = next_run - now
             
-            # Esperar el intervalo o hasta que se señale la parada
-            # Usar wait() permite responder rápidamente a la señal de parada
-            stop_event.wait(timeout=interval)
+            # Esperar hasta el siguiente deadline o hasta que se señale la parada;
+            # wait() devuelve True en cuanto el evento está activo
+            if stop_event.wait(timeout=remaining):
+                break
     
     def stop_thread(self, thread_name: str, timeout: float = 5.0) -> bool:
         """
@@ -104,14 +123,14 @@ class ThreadManager:
         """
         with self._lock:
             if thread_name not in self._threads:
-                print(f"[ThreadManager] Thread '{thread_name}' not found.")
+                logger.warning("Thread '%s' not found.", thread_name)
                 return False
             
             thread = self._threads[thread_name]
             stop_event = self._stop_events.get(thread_name)
             
             if not thread.is_alive():
-                print(f"[ThreadManager] Thread '{thread_name}' is not running.")
+                logger.debug("Thread '%s' is not running.", thread_name)
                 return True
             
             # Señalar al hilo que debe detenerse
@@ -122,10 +141,10 @@ class ThreadManager:
             thread.join(timeout=timeout)
             
             if thread.is_alive():
-                print(f"[ThreadManager] Thread '{thread_name}' did not stop within timeout.")
+                logger.warning("Thread '%s' did not stop within timeout.", thread_name)
                 return False
             
-            print(f"[ThreadManager] Thread '{thread_name}' stopped successfully.")
+            logger.debug("Thread '%s' stopped successfully.", thread_name)
             return True
     
     def stop_all_threads(self, timeout: float = 5.0) -> None:
@@ -140,6 +159,16 @@ class ThreadManager:
         for thread_name in thread_names:
             self.stop_thread(thread_name, timeout)
     
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Detiene todos los hilos. Debe llamarse explícitamente al cerrar
+        (no hay finalizador: los hilos son daemon y mueren con el proceso).
+        
+        Args:
+            timeout: Tiempo máximo de espera para que cada hilo termine.
+        """
+        self.stop_all_threads(timeout)
+    
     def is_thread_running(self, thread_name: str) -> bool:
         """
         Verifica si un hilo está actualmente en ejecución.
@@ -150,10 +179,8 @@ class ThreadManager:
         Returns:
             True si el hilo está activo, False en caso contrario.
         """
-        with self._lock:
-            if thread_name not in self._threads:
-                return False
-            return self._threads[thread_name].is_alive()
+        thread = self._threads.get(thread_name)
+        return bool(thread and thread.is_alive())
     
     def get_active_threads(self) -> list:
         """
@@ -162,8 +189,8 @@ class ThreadManager:
         Returns:
             Lista de nombres de hilos que están actualmente ejecutándose.
         """
-        with self._lock:
-            return [name for name, thread in self._threads.items() if thread.is_alive()]
+        # Copia del dict para iterar sin riesgo si otro hilo lo modifica
+        return [name for name, thread in list(self._threads.items()) if thread.is_alive()]
     
     def restart_thread(self, 
                        thread_name: str,
@@ -180,14 +207,9 @@ class ThreadManager:
         Returns:
             True si el hilo se reinició exitosamente.
         """
-        # Primero detener el hilo si está corriendo
-        self.stop_thread(thread_name)
-        
-        # Iniciar nuevo hilo
-        return self.start_data_collection_thread(callback, interval, thread_name)
-    
-    def __del__(self):
-        """
-        Destructor que asegura que todos los hilos se detengan.
-        """
-        self.stop_all_threads()
+        with self._lock:
+            # Primero detener el hilo si está corriendo
+            self.stop_thread(thread_name)
+            
+            # Iniciar nuevo hilo
+            return self.start_data_collection_thread(callback, interval, thread_name)
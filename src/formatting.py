@@ -0,0 +1,32 @@
+"""
+formatting.py - Formateo de magnitudes compartido por consola y GUI.
+
+Un único formateador de bytes para que el controlador y la vista redondeen
+igual el mismo valor.
+"""
+
+from __future__ import annotations
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+def format_bytes(value: float, precision: int = 1, suffix: str = "") -> str:
+    """
+    Formatea un valor en bytes a una representación legible.
+
+    Bucle de divisiones: la mayoría de valores (B-GB) sale en una a cuatro
+    iteraciones y medido resulta más rápido que la variante con log2/bit_length.
+
+    Args:
+        value: Valor en bytes.
+        precision: Decimales a mostrar.
+        suffix: Texto añadido a la unidad (p. ej. "/s" para velocidades).
+
+    Returns:
+        String formateado (ej: "1.5 GB", "256.0 KB/s").
+    """
+    for unit in _BYTE_UNITS:
+        if abs(value) < 1024.0:
+            return f"{value:.{precision}f} {unit}{suffix}"
+        value /= 1024.0
+    return f"{value:.{precision}f} PB{suffix}"
@@ -5,6 +5,7 @@ Lanza la ventana principal y conecta el AppController a través de señales Qt
 para recibir métricas desde el hilo de monitoreo sin bloquear la UI.
 """
 
+import logging
 import sys
 
 from PySide6 import QtCore, QtWidgets
@@ -21,6 +22,7 @@ class MetricsBridge(QtCore.QObject):
 
 
 def main():
+    logging.basicConfig(level=logging.WARNING, format="[%(name)s] %(levelname)s: %(message)s")
     app = QtWidgets.QApplication(sys.argv)
 
     config = load_config()
@@ -7,31 +7,26 @@ Inicializa el controlador y comienza el ciclo de monitoreo.
 Autor: Project Monitor Team
 """
 
-import sys
+import functools
+import logging
 import signal
-import time
+import threading
 
 # Importar el controlador principal
 from controller.app_controller import AppController
 
 
-def signal_handler(signum, frame):
+def signal_handler(stop_event: threading.Event, signum, frame):
     """
     Manejador de señales para cierre limpio de la aplicación.
     
     Args:
+        stop_event: Evento que despierta al hilo principal para cerrar.
         signum: Número de señal recibida.
         frame: Frame de ejecución actual.
     """
     print("\n\n[Main] Interrupt signal received. Shutting down...")
-    global controller
-    if controller:
-        controller.cleanup()
-    sys.exit(0)
-
-
-# Variable global para el controlador (necesaria para el signal handler)
-controller = None
+    stop_event.set()
 
 
 def main():
@@ -40,17 +35,21 @@ def main():
     
     Inicializa el controlador y ejecuta el ciclo de monitoreo.
     """
-    global controller
+    logging.basicConfig(level=logging.WARNING, format="[%(name)s] %(levelname)s: %(message)s")
     
     print("=" * 60)
     print(" PROJECT MONITOR - System Resource Monitor")
     print(" Initializing...")
     print("=" * 60)
     
-    # Registrar manejadores de señales para cierre limpio
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Registrar manejadores de señales para cierre limpio: solo marcan el
+    # evento; la limpieza se hace una única vez en el bloque finally
+    stop_event = threading.Event()
+    handler = functools.partial(signal_handler, stop_event)
+    signal.signal(signal.SIGINT, handler)
+    signal.signal(signal.SIGTERM, handler)
     
+    controller = None
     try:
         # Crear instancia del controlador
         controller = AppController()
@@ -59,14 +58,12 @@ def main():
         controller.start_monitoring()
         
         # Mantener el programa en ejecución
-        # En una implementación con GUI, aquí se iniciaría el main loop de la GUI
-        # Por ahora, simplemente esperamos indefinidamente
+        # El hilo de monitoreo se ejecuta en background; el hilo principal
+        # espera la señal en tramos de 1 s: en Windows (Python < 3.14) una
+        # espera sin timeout no se interrumpe con Ctrl+C
         print("[Main] Monitoring active. Press Ctrl+C to stop.\n")
-        
-        while True:
-            # El hilo de monitoreo se ejecuta en background
-            # Este loop mantiene vivo el programa principal
-            time.sleep(1)
+        while not stop_event.wait(1.0):
+            pass
             
     except KeyboardInterrupt:
         print("\n\n[Main] Keyboard interrupt received.")
@@ -35,23 +35,38 @@ class AppProfiles:
         messages = []
         success = True
 
+        # Leer el estado actual para omitir escrituras que no cambian nada
+        # (cada escritura puede costar N syscalls o un diálogo de pkexec).
+        # get_governors compara todas las policies: si difieren ("mixto" /
+        # max_freq None) nunca coincide con el objetivo y se escribe
         governor = cfg.get("governor")
+        max_freq = cfg.get("max_freq_khz")
+        current = self.power.get_governors() if (governor or max_freq) else {}
+
         if governor:
-            res = self.power.set_governor(governor)
-            messages.append(res.get("message", ""))
-            success = success and res.get("success", False)
+            if current.get("current") == governor:
+                messages.append(f"Gobernador ya en '{governor}'")
+            else:
+                res = self.power.set_governor(governor)
+                messages.append(res.get("message", ""))
+                success = success and res.get("success", False)
 
-        max_freq = cfg.get("max_freq_khz")
         if max_freq:
-            res = self.power.set_max_freq(int(max_freq))
-            messages.append(res.get("message", ""))
-            success = success and res.get("success", False)
+            if current.get("max_freq") == int(max_freq):
+                messages.append(f"Frecuencia máxima ya en {int(max_freq)} kHz")
+            else:
+                res = self.power.set_max_freq(int(max_freq))
+                messages.append(res.get("message", ""))
+                success = success and res.get("success", False)
 
         pwm = cfg.get("pwm")
         pwm_path = cfg.get("pwm_path")
         if pwm is not None and pwm_path:
-            res = self.fans.set_pwm(pwm_path, int(pwm))
-            messages.append(res.get("message", ""))
-            success = success and res.get("success", False)
+            if self.fans.get_pwm(pwm_path) == int(pwm):
+                messages.append(f"PWM ya en {int(pwm)}")
+            else:
+                res = self.fans.set_pwm(pwm_path, int(pwm))
+                messages.append(res.get("message", ""))
+                success = success and res.get("success", False)
 
         return {"success": success, "message": " | ".join(m for m in messages if m)}
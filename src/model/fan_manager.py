@@ -7,7 +7,7 @@ Se basa en hwmon ya detectado por SensorsReader; este módulo añade escritura s
 
 from __future__ import annotations
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from model.sensors import SensorsReader
 
@@ -17,11 +17,21 @@ class FanManager:
     Gestiona lectura y ajuste de ventiladores usando SensorsReader.
     """
 
-    def __init__(self):
-        self._sensors = SensorsReader()
+    def __init__(self, sensors: Optional[SensorsReader] = None):
+        # Se puede compartir el SensorsReader del controlador; si no, se crea al primer uso
+        self._sensors = sensors
+
+    @property
+    def sensors(self) -> SensorsReader:
+        if self._sensors is None:
+            self._sensors = SensorsReader()
+        return self._sensors
 
     def list_fans(self):
-        return self._sensors.get_fans()
+        return self.sensors.get_fans()
+
+    def get_pwm(self, pwm_path: str) -> Optional[int]:
+        return self.sensors.get_pwm(pwm_path)
 
     def set_pwm(self, pwm_path: str, value: int) -> Dict[str, Any]:
-        return self._sensors.set_pwm(pwm_path, value)
+        return self.sensors.set_pwm(pwm_path, value)
@@ -1,29 +1,54 @@
 """
 gpu_manager.py - Detección básica de GPU (NVIDIA/AMD) y métricas.
 
-Usa nvidia-smi o rocm-smi si están disponibles para obtener uso, temperatura y VRAM.
+Para NVIDIA usa NVML en proceso (pynvml / nvidia-ml-py) si está instalado y,
+si no, nvidia-smi. Para AMD usa rocm-smi/amd-smi si están disponibles (con orjson,
+si está instalado, para decodificar su salida JSON).
 Best-effort: si no hay comandos o permisos, devuelve None.
+
+Las lecturas se hacen bajo demanda: la GUI las lanza fuera de su hilo y solo
+cuando el panel de GPU está visible y le toca refrescarse.
 """
 
 from __future__ import annotations
 
+import atexit
+import csv
+import io
 import json
 import shutil
 import subprocess
 from typing import Dict, Any, List, Optional
 
+try:  # Dependencia opcional: bindings NVML (paquete nvidia-ml-py)
+    import pynvml
+except ImportError:
+    pynvml = None
+
+try:  # Dependencia opcional: decodificador JSON nativo más rápido
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class GPUManager:
     """
     Lee métricas de GPU si el sistema lo permite.
     """
 
+    def __init__(self):
+        self._nvml_handles = self._init_nvml()
+        # Resolver herramientas una sola vez (evita recorrer $PATH en cada lectura)
+        self._nvidia_smi = shutil.which("nvidia-smi")
+        self._rocm_smi = shutil.which("rocm-smi") or shutil.which("amd-smi")
+
     def get_gpu_info(self) -> List[Dict[str, Any]]:
         """
         Devuelve lista de GPUs detectadas con métricas comunes.
         """
-        # Prioridad: NVIDIA -> AMD (ROC)
-        nvidia = self._get_nvidia_smi()
+        # Prioridad: NVIDIA (NVML -> nvidia-smi) -> AMD (ROC)
+        nvidia = self._get_nvml() or self._get_nvidia_smi()
         if nvidia:
             return nvidia
         amd = self._get_rocm_smi()
@@ -31,8 +56,55 @@ class GPUManager:
             return amd
         return []
 
+    @staticmethod
+    def _init_nvml() -> List[Any]:
+        """
+        Inicializa NVML una sola vez y cachea los handles de cada GPU.
+        """
+        if pynvml is None:
+            return []
+        try:
+            pynvml.nvmlInit()
+        except Exception:
+            return []
+        atexit.register(_nvml_shutdown)
+        try:
+            count = pynvml.nvmlDeviceGetCount()
+            return [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(count)]
+        except Exception:
+            return []
+
+    def _get_nvml(self) -> List[Dict[str, Any]]:
+        gpus = []
+        for index, handle in enumerate(self._nvml_handles):
+            try:
+                name = pynvml.nvmlDeviceGetName(handle)
+                util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+            except Exception:
+                continue
+            try:
+                power_w = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # mW -> W
+            except Exception:
+                power_w = 0.0
+            gpus.append(
+                {
+                    "vendor": "NVIDIA",
+                    "name": name.decode() if isinstance(name, bytes) else name,
+                    "index": index,
+                    "utilization": float(util.gpu),
+                    "mem_util": float(util.memory),
+                    "mem_total_mb": mem.total / (1024 * 1024),
+                    "mem_used_mb": mem.used / (1024 * 1024),
+                    "temperature": float(temp),
+                    "power_w": power_w,
+                }
+            )
+        return gpus
+
     def _get_nvidia_smi(self) -> List[Dict[str, Any]]:
-        if not shutil.which("nvidia-smi"):
+        if not self._nvidia_smi:
             return []
         query = [
             "--query-gpu=name,index,utilization.gpu,utilization.memory,memory.total,memory.used,temperature.gpu,power.draw",
@@ -40,7 +112,7 @@ class GPUManager:
         ]
         try:
             result = subprocess.run(
-                ["nvidia-smi"] + query,
+                [self._nvidia_smi] + query,
                 capture_output=True,
                 text=True,
                 timeout=2,
@@ -49,21 +121,24 @@ class GPUManager:
             if result.returncode != 0:
                 return []
             gpus = []
-            for line in result.stdout.strip().splitlines():
-                parts = [p.strip() for p in line.split(",")]
-                if len(parts) < 8:
+            # csv.reader divide en C; skipinitialspace elimina el espacio tras
+            # cada coma y float()/int() toleran el resto de espacios
+            to_float = float
+            for row in csv.reader(io.StringIO(result.stdout), skipinitialspace=True):
+                if len(row) < 8:
                     continue
+                name, index, util, mem_util, mem_total, mem_used, temp, power = row[:8]
                 gpus.append(
                     {
                         "vendor": "NVIDIA",
-                        "name": parts[0],
-                        "index": int(parts[1]),
-                        "utilization": float(parts[2]),
-                        "mem_util": float(parts[3]),
-                        "mem_total_mb": float(parts[4]),
-                        "mem_used_mb": float(parts[5]),
-                        "temperature": float(parts[6]),
-                        "power_w": float(parts[7]),
+                        "name": name.strip(),
+                        "index": int(index),
+                        "utilization": to_float(util),
+                        "mem_util": to_float(mem_util),
+                        "mem_total_mb": to_float(mem_total),
+                        "mem_used_mb": to_float(mem_used),
+                        "temperature": to_float(temp),
+                        "power_w": to_float(power),
                     }
                 )
             return gpus
@@ -71,9 +146,9 @@ class GPUManager:
             return []
 
     def _get_rocm_smi(self) -> List[Dict[str, Any]]:
-        if not shutil.which("rocm-smi") and not shutil.which("amd-smi"):
+        cmd = self._rocm_smi
+        if not cmd:
             return []
-        cmd = shutil.which("rocm-smi") or shutil.which("amd-smi")
         try:
             result = subprocess.run(
                 [cmd, "--showtemp", "--showuse", "--showmeminfo", "vram", "--json"],
@@ -82,27 +157,36 @@ class GPUManager:
                 timeout=2,
                 check=False,
             )
-            data = json.loads(result.stdout or "{}")
-            gpus = []
-            for key, info in data.get("card", {}).items():
-                gpus.append(
-                    {
-                        "vendor": "AMD",
-                        "name": info.get("Card series") or key,
-                        "index": int(key.replace("card", "")) if key.startswith("card") else len(gpus),
-                        "utilization": _safe_float(info.get("GPU use (%)")),
-                        "mem_util": _safe_float(info.get("GPU memory use (%)")),
-                        "mem_total_mb": _safe_float(info.get("VRAM Total Memory (B)")) / (1024 * 1024),
-                        "mem_used_mb": _safe_float(info.get("VRAM Used Memory (B)")) / (1024 * 1024),
-                        "temperature": _safe_float(info.get("Temperature (Sensor edge) (C)")),
-                        "power_w": _safe_float(info.get("Average Graphics Package Power (W)")),
-                    }
-                )
-            return gpus
+            stdout = result.stdout
+            if not stdout or not stdout.strip():
+                # Sin salida no hay nada que decodificar
+                return []
+            cards = _json_loads(stdout).get("card", {})
+            return [
+                {
+                    "vendor": "AMD",
+                    "name": info.get("Card series") or key,
+                    "index": int(key.replace("card", "")) if key.startswith("card") else position,
+                    "utilization": _safe_float(info.get("GPU use (%)")),
+                    "mem_util": _safe_float(info.get("GPU memory use (%)")),
+                    "mem_total_mb": _safe_float(info.get("VRAM Total Memory (B)")) / (1024 * 1024),
+                    "mem_used_mb": _safe_float(info.get("VRAM Used Memory (B)")) / (1024 * 1024),
+                    "temperature": _safe_float(info.get("Temperature (Sensor edge) (C)")),
+                    "power_w": _safe_float(info.get("Average Graphics Package Power (W)")),
+                }
+                for position, (key, info) in enumerate(cards.items())
+            ]
         except Exception:
             return []
 
 
+def _nvml_shutdown() -> None:
+    try:
+        pynvml.nvmlShutdown()
+    except Exception:
+        pass
+
+
 def _safe_float(val: Optional[Any]) -> float:
     try:
         return float(val)
@@ -8,12 +8,12 @@ Es best-effort: si no existe el driver o faltan permisos, devuelve mensajes clar
 from __future__ import annotations
 
 import os
-import subprocess
-import sys
 import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from model.privileged_helper import PrivilegedHelper
+
 
 class MsiEcManager:
     """
@@ -25,6 +25,28 @@ class MsiEcManager:
     def __init__(self, use_pkexec: bool = False):
         self.use_pkexec = use_pkexec
         self.helper_path = Path(__file__).resolve().parents[2] / "scripts" / "msi_ec_helper.py"
+        self._pkexec_path = shutil.which("pkexec")
+        # Proceso helper persistente: se lanza con pkexec en la primera escritura privilegiada
+        self._helper = PrivilegedHelper(self.helper_path, self._pkexec_path)
+        # Modos disponibles (available_*_modes) leídos una sola vez por archivo
+        self._available_cache: Dict[Path, List[str]] = {}
+
+        # Rutas sysfs precalculadas (get_info se consulta periódicamente)
+        base = self.BASE
+        self._p_fan_mode = base / "fan_mode"
+        self._p_shift_mode = base / "shift_mode"
+        self._p_cooler_boost = base / "cooler_boost"
+        self._p_available_fan_modes = base / "available_fan_modes"
+        self._p_available_shift_modes = base / "available_shift_modes"
+        self._p_webcam = base / "webcam"
+        self._p_webcam_block = base / "webcam_block"
+        self._p_kbd_brightness = Path("/sys/class/leds/msiacpi::kbd_backlight/brightness")
+        bat = Path("/sys/class/power_supply/BAT1")
+        self._p_bat = bat
+        self._p_bat_capacity = bat / "capacity"
+        self._p_bat_status = bat / "status"
+        self._p_bat_start_threshold = bat / "charge_control_start_threshold"
+        self._p_bat_end_threshold = bat / "charge_control_end_threshold"
 
     def is_available(self) -> bool:
         return self.BASE.exists()
@@ -34,24 +56,44 @@ class MsiEcManager:
             return {"available": False}
         return {
             "available": True,
-            "fan_mode": self._safe_read_str(self.BASE / "fan_mode"),
-            "shift_mode": self._safe_read_str(self.BASE / "shift_mode"),
-            "available_fan_modes": self._read_list(self.BASE / "available_fan_modes"),
-            "available_shift_modes": self._read_list(self.BASE / "available_shift_modes"),
-            "cooler_boost": self._safe_read_str(self.BASE / "cooler_boost"),
+            "fan_mode": self._safe_read_str(self._p_fan_mode),
+            "shift_mode": self._safe_read_str(self._p_shift_mode),
+            "available_fan_modes": self._available_modes(self._p_available_fan_modes),
+            "available_shift_modes": self._available_modes(self._p_available_shift_modes),
+            "cooler_boost": self._safe_read_str(self._p_cooler_boost),
         }
 
+    def get_snapshot(self) -> Dict[str, Any]:
+        """
+        Estado completo del panel MSI-EC en una sola pasada por sysfs.
+
+        Reúne get_info, webcam, backlight del teclado y umbrales de carga con
+        una comprobación de existencia por directorio; solo se leen los nodos
+        que muestra la GUI (ni capacity ni status de la batería).
+        """
+        info = self.get_info()
+        if not info["available"]:
+            return info
+        info["webcam"] = self._safe_read_str(self._p_webcam)
+        info["webcam_block"] = self._safe_read_str(self._p_webcam_block)
+        info["kbd_backlight"] = self._safe_read_str(self._p_kbd_brightness)
+        info["battery"] = {
+            "start_threshold": self._safe_read_str(self._p_bat_start_threshold),
+            "end_threshold": self._safe_read_str(self._p_bat_end_threshold),
+        } if self._p_bat.exists() else {}
+        return info
+
     def set_fan_mode(self, mode: str) -> Dict[str, Any]:
-        return self._write_mode("fan_mode", mode, self.BASE / "available_fan_modes")
+        return self._write_mode(self._p_fan_mode, mode, self._p_available_fan_modes)
 
     def set_shift_mode(self, mode: str) -> Dict[str, Any]:
-        return self._write_mode("shift_mode", mode, self.BASE / "available_shift_modes")
+        return self._write_mode(self._p_shift_mode, mode, self._p_available_shift_modes)
 
     def set_cooler_boost(self, value: str) -> Dict[str, Any]:
         """
         Ajusta cooler_boost. Acepta "on"/"off" o "1"/"0".
         """
-        path = self.BASE / "cooler_boost"
+        path = self._p_cooler_boost
         if not path.exists():
             return {"success": False, "message": "cooler_boost no soportado"}
         norm = value
@@ -63,70 +105,79 @@ class MsiEcManager:
 
     # ----- Batería -----
     def get_battery_info(self) -> Dict[str, Any]:
-        bat_path = Path("/sys/class/power_supply/BAT1")
-        if not bat_path.exists():
+        if not self._p_bat.exists():
             return {}
         return {
-            "capacity": self._safe_read_str(bat_path / "capacity"),
-            "status": self._safe_read_str(bat_path / "status"),
-            "start_threshold": self._safe_read_str(bat_path / "charge_control_start_threshold"),
-            "end_threshold": self._safe_read_str(bat_path / "charge_control_end_threshold"),
+            "capacity": self._safe_read_str(self._p_bat_capacity),
+            "status": self._safe_read_str(self._p_bat_status),
+            "start_threshold": self._safe_read_str(self._p_bat_start_threshold),
+            "end_threshold": self._safe_read_str(self._p_bat_end_threshold),
         }
 
     def set_battery_thresholds(self, start: Optional[int] = None, end: Optional[int] = None) -> Dict[str, Any]:
-        bat_path = Path("/sys/class/power_supply/BAT1")
-        if not bat_path.exists():
+        if not self._p_bat.exists():
             return {"success": False, "message": "BAT1 no encontrada"}
         msgs = []
         success = True
         if start is not None:
-            res = self._write_value(bat_path / "charge_control_start_threshold", str(int(start)))
+            res = self._write_value(self._p_bat_start_threshold, str(int(start)))
             success = success and res.get("success", False)
             msgs.append(res.get("message", ""))
         if end is not None:
-            res = self._write_value(bat_path / "charge_control_end_threshold", str(int(end)))
+            res = self._write_value(self._p_bat_end_threshold, str(int(end)))
             success = success and res.get("success", False)
             msgs.append(res.get("message", ""))
         return {"success": success, "message": " | ".join([m for m in msgs if m]) or "OK"}
 
     # ----- Webcam -----
     def set_webcam(self, enable: bool) -> Dict[str, Any]:
-        path = self.BASE / "webcam"
+        path = self._p_webcam
         if not path.exists():
             return {"success": False, "message": "webcam no soportada"}
         return self._write_value(path, "on" if enable else "off")
 
     def set_webcam_block(self, enable: bool) -> Dict[str, Any]:
-        path = self.BASE / "webcam_block"
+        path = self._p_webcam_block
         if not path.exists():
             return {"success": False, "message": "webcam_block no soportada"}
         return self._write_value(path, "on" if enable else "off")
 
     # ----- Backlight teclado -----
     def set_keyboard_backlight(self, level: int) -> Dict[str, Any]:
-        path = Path("/sys/class/leds/msiacpi::kbd_backlight/brightness")
+        path = self._p_kbd_brightness
         if not path.exists():
             return {"success": False, "message": "Backlight no soportado"}
         return self._write_value(path, str(int(level)))
 
     def get_keyboard_backlight(self) -> str:
-        path = Path("/sys/class/leds/msiacpi::kbd_backlight/brightness")
-        return self._safe_read_str(path)
+        return self._safe_read_str(self._p_kbd_brightness)
 
     # Internos
-    def _write_mode(self, filename: str, value: str, available_path: Path) -> Dict[str, Any]:
-        path = self.BASE / filename
+    def _available_modes(self, path: Path) -> List[str]:
+        """Devuelve (y cachea) la lista de modos soportados de un nodo available_*."""
+        modes = self._available_cache.get(path)
+        if modes is None:
+            modes = self._read_list(path)
+            if modes:
+                # Solo se cachea una lectura válida (el driver puede cargarse después)
+                self._available_cache[path] = modes
+        return modes
+
+    def _write_mode(self, path: Path, value: str, available_path: Path) -> Dict[str, Any]:
         if not path.exists():
-            return {"success": False, "message": f"{filename} no soportado en este equipo"}
-        available = self._read_list(available_path)
+            return {"success": False, "message": f"{path.name} no soportado en este equipo"}
+        available = self._available_modes(available_path)
         if available and value not in available:
             return {"success": False, "message": f"Valor '{value}' no soportado. Disponibles: {', '.join(available)}"}
         return self._write_value(path, value)
 
     def _write_value(self, path: Path, value: str) -> Dict[str, Any]:
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(str(value))
+            fd = os.open(path, os.O_WRONLY)
+            try:
+                os.write(fd, str(value).encode())
+            finally:
+                os.close(fd)
             return {"success": True, "message": f"{path.name} ajustado a {value}"}
         except PermissionError:
             if self.use_pkexec:
@@ -136,32 +187,29 @@ class MsiEcManager:
             return {"success": False, "message": f"Error escribiendo {path.name}: {exc}"}
 
     def _run_helper(self, target: str, value: str) -> Dict[str, Any]:
-        if not self.helper_path.exists():
-            return {"success": False, "message": "Helper msi-ec no encontrado"}
-        if not shutil.which("pkexec"):
-            return {"success": False, "message": "pkexec no disponible"}
-        python_bin = sys.executable or "/usr/bin/python3"
-        cmd = ["pkexec", python_bin, str(self.helper_path), f"--{target}", str(value)]
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                return {"success": True, "message": result.stdout.strip() or f"{target} aplicado"}
-            return {"success": False, "message": result.stderr.strip() or f"pkexec falló ajustando {target}"}
-        except subprocess.SubprocessError as exc:
-            return {"success": False, "message": f"Error ejecutando pkexec: {exc}"}
+        return self._helper.request({"target": target, "value": str(value)})
 
     @staticmethod
     def _read_list(path: Path) -> List[str]:
+        # Nodos ASCII diminutos: lectura directa sin TextIOWrapper y un único decode
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return f.read().strip().split()
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                data = os.read(fd, 4096)
+            finally:
+                os.close(fd)
+            return data.decode("ascii", "ignore").split()
         except Exception:
             return []
 
     @staticmethod
     def _safe_read_str(path: Path) -> str:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return f.read().strip()
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                data = os.read(fd, 4096)
+            finally:
+                os.close(fd)
+            return data.decode("utf-8", "replace").strip()
         except Exception:
             return ""
@@ -8,11 +8,12 @@ Las escrituras requieren permisos; se maneja fallback con pkexec si está habili
 from __future__ import annotations
 
 import glob
-import subprocess
-import sys
+import os
 import shutil
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+from model.privileged_helper import PrivilegedHelper
 
 
 class PowerManager:
@@ -21,30 +22,54 @@ class PowerManager:
     """
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        self.cpu_paths = glob.glob("/sys/devices/system/cpu/cpu[0-9]*/cpufreq")
+        # Preferir las policies de cpufreq (una por grupo de CPUs que comparten
+        # frecuencia) sobre las rutas por CPU: en equipos modernos son 1-4
+        # archivos en lugar de N
+        policies = sorted(glob.glob("/sys/devices/system/cpu/cpufreq/policy*"))
+        self.cpu_paths = policies or glob.glob("/sys/devices/system/cpu/cpu[0-9]*/cpufreq")
+        # Qué cuenta cada ruta en los mensajes de error
+        self._path_unit = "policy(s) cpufreq" if policies else "CPU(s)"
         self.use_pkexec = bool((config or {}).get("use_pkexec", False))
         # helper en la raíz del proyecto (../.. /scripts/power_helper.py)
         self.helper_path = Path(__file__).resolve().parents[2] / "scripts" / "power_helper.py"
+        self._pkexec_path = shutil.which("pkexec")
+        # Proceso helper persistente: se lanza con pkexec en la primera escritura privilegiada
+        self._helper = PrivilegedHelper(self.helper_path, self._pkexec_path)
+        # Los gobernadores disponibles no cambian en ejecución: se leen una vez
+        self._available_governors: Optional[List[str]] = None
+        # Descriptores de escritura abiertos por ruta de atributo (se reescriben con pwrite)
+        self._write_fds: Dict[str, int] = {}
 
     def get_governors(self) -> Dict[str, Any]:
         """
-        Obtiene el gobernador actual y los disponibles (primer CPU como referencia).
+        Obtiene el gobernador actual y los disponibles.
+
+        Se leen todas las policies: en CPUs híbridas pueden tener gobernadores
+        distintos. Si no coinciden, "current" vale "mixto" y "mixed" es True;
+        max_freq/min_freq son None cuando difieren entre policies.
         """
         if not self.cpu_paths:
-            return {"current": None, "available": []}
-        path = self.cpu_paths[0]
-        current = _safe_read_str(f"{path}/scaling_governor")
-        available = _safe_read_str(f"{path}/scaling_available_governors")
-        available_list = available.split() if available else []
-        max_freq = _safe_read_str(f"{path}/scaling_max_freq")
-        min_freq = _safe_read_str(f"{path}/scaling_min_freq")
+            return {"current": None, "available": [], "mixed": False}
+        governors = {_safe_read_str(f"{path}/scaling_governor") for path in self.cpu_paths}
+        max_freqs = {_safe_int(_safe_read_str(f"{path}/scaling_max_freq")) for path in self.cpu_paths}
+        min_freqs = {_safe_int(_safe_read_str(f"{path}/scaling_min_freq")) for path in self.cpu_paths}
+        mixed = len(governors) > 1
         return {
-            "current": current,
-            "available": available_list,
-            "max_freq": _safe_int(max_freq),
-            "min_freq": _safe_int(min_freq),
+            "current": "mixto" if mixed else governors.pop(),
+            "available": self._get_available_governors(),
+            "mixed": mixed,
+            "max_freq": max_freqs.pop() if len(max_freqs) == 1 else None,
+            "min_freq": min_freqs.pop() if len(min_freqs) == 1 else None,
         }
 
+    def _get_available_governors(self) -> List[str]:
+        if self._available_governors is None:
+            if not self.cpu_paths:
+                return []
+            available = _safe_read_str(f"{self.cpu_paths[0]}/scaling_available_governors")
+            self._available_governors = available.split() if available else []
+        return self._available_governors
+
     def set_governor(self, governor: str) -> Dict[str, Any]:
         """
         Intenta establecer un gobernador en todos los CPUs.
@@ -54,24 +79,20 @@ class PowerManager:
         if not self.cpu_paths:
             return {"success": False, "message": "No se encontró ruta cpufreq"}
         # Verificar soporte del gobernador
-        available = self.get_governors().get("available") or []
+        available = self._get_available_governors()
         if available and governor not in available:
             return {
                 "success": False,
                 "message": f"Gobernador '{governor}' no soportado. Disponibles: {', '.join(available)}",
             }
 
-        errors = []
-        for path in self.cpu_paths:
-            ok = _safe_write_str(f"{path}/scaling_governor", governor)
-            if not ok:
-                errors.append(path)
+        errors = self._write_all("scaling_governor", governor)
         if errors:
             # Intentar pkexec helper si está habilitado
             if self.use_pkexec:
                 res = self._run_helper(governor=governor)
                 return res
-            return {"success": False, "message": f"No se pudo escribir en {len(errors)} CPU(s). Requiere permisos."}
+            return {"success": False, "message": f"No se pudo escribir en {errors} {self._path_unit}. Requiere permisos."}
         return {"success": True, "message": f"Gobernador establecido en '{governor}'"}
 
     def set_max_freq(self, khz: int) -> Dict[str, Any]:
@@ -82,60 +103,103 @@ class PowerManager:
             return {"success": False, "message": "Frecuencia inválida"}
         if not self.cpu_paths:
             return {"success": False, "message": "No se encontró ruta cpufreq"}
-        errors = []
-        for path in self.cpu_paths:
-            ok = _safe_write_str(f"{path}/scaling_max_freq", str(int(khz)))
-            if not ok:
-                errors.append(path)
+        errors = self._write_all("scaling_max_freq", str(int(khz)))
         if errors:
             if self.use_pkexec:
                 res = self._run_helper(max_freq_khz=int(khz))
                 return res
-            return {"success": False, "message": f"No se pudo escribir en {len(errors)} CPU(s). Requiere permisos."}
+            return {"success": False, "message": f"No se pudo escribir en {errors} {self._path_unit}. Requiere permisos."}
         return {"success": True, "message": f"Frecuencia máxima ajustada a {khz} kHz"}
 
-    def _run_helper(self, governor: Optional[str] = None, max_freq_khz: Optional[int] = None) -> Dict[str, Any]:
+    def _write_all(self, attr: str, value: str) -> int:
+        """
+        Escribe un atributo en todas las rutas cpufreq y devuelve el número de fallos.
+
+        Ante un PermissionError se detiene: el resto fallaría igual y el
+        llamador recurrirá a una única invocación del helper con pkexec.
         """
-        Ejecuta el helper con pkexec para aplicar cambios con privilegios.
+        data = value.encode()
+        failures = 0
+        for idx, path in enumerate(self.cpu_paths):
+            try:
+                self._pwrite_attr(f"{path}/{attr}", data)
+            except PermissionError:
+                return failures + len(self.cpu_paths) - idx
+            except Exception:
+                failures += 1
+        return failures
+
+    def _pwrite_attr(self, attr_path: str, data: bytes) -> None:
         """
-        if not self.helper_path.exists():
-            return {"success": False, "message": "Helper de energía no encontrado"}
-        if not shutil.which("pkexec"):
-            return {"success": False, "message": "pkexec no disponible para elevar privilegios"}
+        Escribe en un atributo sysfs reutilizando su descriptor abierto.
 
-        python_bin = sys.executable or "/usr/bin/python3"
-        cmd = ["pkexec", python_bin, str(self.helper_path)]
+        pwrite en el offset 0 evita resolver la ruta y abrir/cerrar el archivo
+        en cada cambio. Si el descriptor quedó inválido (p. ej. CPU desconectada
+        y reconectada) se reabre una vez.
+        """
+        fd = self._write_fds.get(attr_path)
+        if fd is not None:
+            try:
+                os.pwrite(fd, data, 0)
+                return
+            except PermissionError:
+                raise
+            except OSError:
+                self._close_fd(attr_path)
+        fd = os.open(attr_path, os.O_WRONLY)
+        self._write_fds[attr_path] = fd
+        try:
+            os.pwrite(fd, data, 0)
+        except OSError:
+            # Un valor rechazado (EINVAL) no invalida el descriptor, pero
+            # otros errores sí: no conservar uno que falló recién abierto
+            self._close_fd(attr_path)
+            raise
+
+    def _close_fd(self, attr_path: str) -> None:
+        fd = self._write_fds.pop(attr_path, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Cierra los descriptores sysfs y el helper privilegiado."""
+        for attr_path in list(self._write_fds):
+            self._close_fd(attr_path)
+        self._helper.close()
+
+    def _run_helper(self, governor: Optional[str] = None, max_freq_khz: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Envía los cambios al helper privilegiado (pkexec) persistente.
+        """
+        command: Dict[str, Any] = {}
         if governor:
-            cmd += ["--governor", str(governor)]
+            command["governor"] = str(governor)
         if max_freq_khz:
-            cmd += ["--max-freq-khz", str(int(max_freq_khz))]
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                return {"success": True, "message": result.stdout.strip() or "Perfil aplicado con pkexec"}
-            else:
-                return {"success": False, "message": result.stderr.strip() or "pkexec falló en aplicar el perfil"}
-        except subprocess.SubprocessError as exc:
-            return {"success": False, "message": f"Error ejecutando pkexec: {exc}"}
+            command["max_freq_khz"] = int(max_freq_khz)
+        res = self._helper.request(command)
+        if res.get("success") and not res.get("message"):
+            res["message"] = "Perfil aplicado con pkexec"
+        return res
 
 
+# Los nodos sysfs son diminutos: se leen con os.open/os.read (las escrituras van
+# por PowerManager._pwrite_attr) para evitar la capa de IO con buffer de open().
+
 def _safe_read_str(path: str) -> str:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return f.readline().strip()
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            data = os.read(fd, 4096)
+        finally:
+            os.close(fd)
+        return data.decode("utf-8", "replace").partition("\n")[0].strip()
     except Exception:
         return ""
 
 
-def _safe_write_str(path: str, value: str) -> bool:
-    try:
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(value)
-        return True
-    except Exception:
-        return False
-
-
 def _safe_int(value: Optional[str]) -> Optional[int]:
     try:
         return int(value)
@@ -0,0 +1,136 @@
+"""
+privileged_helper.py - Proceso helper privilegiado persistente (pkexec).
+
+Lanza una sola vez `pkexec python helper.py --serve` y reutiliza su stdin/stdout
+para enviar comandos JSON (uno por línea). Así solo la primera escritura paga el
+coste de pkexec + arranque de Python; las siguientes son una ida y vuelta por pipe.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import select
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+class PrivilegedHelper:
+    """
+    Cliente de un helper de scripts/ ejecutado con pkexec en modo --serve.
+    """
+
+    # Los helpers responden con un mensaje corto; una línea más larga indica
+    # un protocolo roto y no se sigue leyendo
+    MAX_REPLY_CHARS = 4096
+
+    def __init__(self, helper_path: Path, pkexec_path: Optional[str],
+                 timeout: float = 3.0, start_timeout: float = 10.0):
+        """
+        Args:
+            helper_path: Script del helper (en scripts/).
+            pkexec_path: Ruta a pkexec (None si no está disponible).
+            timeout: Espera máxima de respuesta con el helper ya en ejecución.
+            start_timeout: Espera máxima de la primera respuesta, que incluye
+                           el arranque y el diálogo de autenticación de pkexec.
+        """
+        self.helper_path = helper_path
+        self._pkexec_path = pkexec_path
+        self._timeout = timeout
+        self._start_timeout = start_timeout
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def request(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Envía un comando al helper (arrancándolo si hace falta) y devuelve su respuesta.
+        """
+        if not self.helper_path.exists():
+            return {"success": False, "message": f"Helper no encontrado: {self.helper_path.name}"}
+        if not self._pkexec_path:
+            return {"success": False, "message": "pkexec no disponible para elevar privilegios"}
+
+        line = json.dumps(command) + "\n"
+        with self._lock:
+            try:
+                starting = self._proc is None or self._proc.poll() is not None
+                proc = self._ensure_started()
+                proc.stdin.write(line)
+                proc.stdin.flush()
+                # Esperar la respuesta con timeout; la primera incluye el diálogo de pkexec
+                timeout = self._start_timeout if starting else self._timeout
+                ready, _, _ = select.select([proc.stdout], [], [], timeout)
+                if not ready:
+                    self._terminate()
+                    return {"success": False, "message": "Tiempo de espera agotado esperando al helper"}
+                reply = proc.stdout.readline(self.MAX_REPLY_CHARS)
+            except (OSError, ValueError) as exc:
+                self._terminate()
+                return {"success": False, "message": f"Error comunicando con el helper: {exc}"}
+
+            if not reply:
+                # El helper terminó (p. ej. autenticación cancelada en pkexec)
+                stderr = self._terminate()
+                return {"success": False, "message": stderr or "pkexec falló o se canceló la autenticación"}
+            if not reply.endswith("\n"):
+                # Respuesta truncada: el resto quedaría en el pipe y desincronizaría la siguiente
+                self._terminate()
+                return {"success": False, "message": "Respuesta demasiado larga del helper"}
+
+        try:
+            result = json.loads(reply)
+        except ValueError:
+            return {"success": False, "message": f"Respuesta inválida del helper: {reply.strip()}"}
+        if not isinstance(result, dict):
+            return {"success": False, "message": "Respuesta inválida del helper"}
+        return result
+
+    def close(self) -> None:
+        """Cierra el helper si está en ejecución."""
+        with self._lock:
+            self._terminate()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        python_bin = sys.executable or "/usr/bin/python3"
+        self._proc = subprocess.Popen(
+            [self._pkexec_path, python_bin, str(self.helper_path), "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        return self._proc
+
+    def _terminate(self) -> str:
+        """Detiene el proceso (si existe) y devuelve lo que haya escrito en stderr."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return ""
+        stderr = ""
+        try:
+            if proc.poll() is None:
+                proc.stdin.close()
+                try:
+                    proc.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait(timeout=1)
+            if proc.stderr:
+                stderr = proc.stderr.read(self.MAX_REPLY_CHARS).strip()
+        except Exception:
+            pass
+        finally:
+            for stream in (proc.stdin, proc.stdout, proc.stderr):
+                try:
+                    if stream:
+                        stream.close()
+                except Exception:
+                    pass
+        return stderr
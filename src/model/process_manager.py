@@ -7,8 +7,12 @@ listar y gestionar procesos del sistema operativo.
 Autor: Project Monitor Team
 """
 
+import threading
+
 import psutil
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+from model.process_table import ProcessTable
 
 
 class ProcessManager:
@@ -20,11 +24,24 @@ class ProcessManager:
     - Terminar procesos dado su PID
     """
     
+    # Atributos leídos de cada proceso en get_process_list:
+    # los estáticos solo se leen la primera vez que se ve un PID
+    STATIC_ATTRS = ['name', 'username']
+    VOLATILE_ATTRS = ['status', 'memory_percent', 'cpu_percent', 'num_threads', 'memory_info']
+    # Campos aceptados como criterio de orden
+    SORT_FIELDS = ('cpu_percent', 'memory_percent', 'pid', 'num_threads', 'name')
+    
+    # Sondeo de kill_process_async: KILL_POLL_ATTEMPTS comprobaciones cada
+    # KILL_POLL_INTERVAL segundos (mismo plazo de 3 s que kill_process)
+    KILL_POLL_INTERVAL = 0.1
+    KILL_POLL_ATTEMPTS = 30
+    
     def __init__(self):
         """
         Inicializa la clase ProcessManager.
         """
-        pass
+        # PID -> (create_time, name, username, name.lower()) de la última lectura
+        self._static_cache: Dict[int, Tuple[float, str, str, str]] = {}
     
     def get_process_list(self, sort_by: str = 'cpu_percent', 
                          descending: bool = True,
@@ -49,53 +66,90 @@ class ProcessManager:
                 - create_time: Tiempo de creación del proceso
                 - num_threads: Número de hilos del proceso
         """
-        processes = []
+        return self.get_process_table(sort_by, descending, limit).to_dicts()
+    
+    def get_process_table(self, sort_by: str = 'cpu_percent',
+                          descending: bool = True,
+                          limit: Optional[int] = None) -> ProcessTable:
+        """
+        Igual que get_process_list, pero devuelve las columnas en un ProcessTable.
         
-        # Iterar sobre todos los procesos
-        for proc in psutil.process_iter(['pid', 'name', 'status', 'memory_percent', 
-                                          'cpu_percent', 'username', 'create_time',
-                                          'num_threads', 'memory_info']):
-            try:
-                # Obtener información del proceso
-                proc_info = proc.info
-                io_counters = None
+        Evita crear un diccionario por proceso; es el formato que usa la
+        tabla de procesos de la GUI.
+        
+        Args:
+            sort_by: Campo por el cual ordenar (ver get_process_list).
+            descending: Si True, ordena de mayor a menor. Por defecto True.
+            limit: Número máximo de procesos a retornar. None para todos.
+        
+        Returns:
+            ProcessTable con los procesos ordenados.
+        """
+        # psutil.process_iter reutiliza los objetos Process entre llamadas
+        # (necesario para que cpu_percent mida desde la lectura anterior).
+        # Lectura secuencial: cada proceso son unas pocas lecturas cortas de
+        # /proc que retienen el GIL, y repartirlas en un pool de hilos resultó
+        # más lento que el bucle simple
+        results = [r for r in map(self._collect_process, psutil.process_iter()) if r is not None]
+        
+        # Refresco incremental: los PIDs que ya no existen salen de la caché
+        self._static_cache = {row[0]: static for row, static in results}
+        
+        table = ProcessTable((row for row, _ in results),
+                             (static[3] for _, static in results))
+        if sort_by not in self.SORT_FIELDS:
+            sort_by = None
+        return table.sorted(sort_by, descending, limit)
+    
+    def _collect_process(self, proc: psutil.Process) -> Optional[Tuple[Tuple, Tuple[float, str, str, str]]]:
+        """
+        Lee la información de un proceso.
+        
+        Returns:
+            Tupla (fila en el orden de ProcessTable.FIELDS, entrada de la caché
+            estática), o None si ya no existe o no es accesible.
+        """
+        try:
+            # Un único oneshot() para los atributos y los contadores de IO:
+            # psutil reutiliza las lecturas de /proc/<pid>/{stat,status}
+            with proc.oneshot():
+                # create_time identifica al proceso (detecta PIDs reutilizados)
+                create_time = proc.create_time()
+                static = self._static_cache.get(proc.pid)
+                if static is None or static[0] != create_time:
+                    info = proc.as_dict(attrs=self.STATIC_ATTRS)
+                    name = info['name'] or 'Unknown'
+                    static = (create_time, name, info['username'] or 'Unknown', name.lower())
+                proc_info = proc.as_dict(attrs=self.VOLATILE_ATTRS)
                 try:
                     io_counters = proc.io_counters()
                 except (psutil.AccessDenied, psutil.NoSuchProcess):
                     io_counters = None
-                
-                process_data = {
-                    'pid': proc_info['pid'],
-                    'name': proc_info['name'] or 'Unknown',
-                    'status': proc_info['status'] or 'Unknown',
-                    'memory_percent': round(proc_info['memory_percent'] or 0, 2),
-                    'cpu_percent': round(proc_info['cpu_percent'] or 0, 2),
-                    'username': proc_info['username'] or 'Unknown',
-                    'create_time': proc_info['create_time'],
-                    'num_threads': proc_info['num_threads'] or 0,
-                    'rss_bytes': proc_info.get('memory_info').rss if proc_info.get('memory_info') else 0,
-                    'vms_bytes': proc_info.get('memory_info').vms if proc_info.get('memory_info') else 0,
-                    'io_read_bytes': io_counters.read_bytes if io_counters else 0,
-                    'io_write_bytes': io_counters.write_bytes if io_counters else 0,
-                }
-                
-                processes.append(process_data)
-                
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                # El proceso ya no existe, no tenemos acceso, o es zombie
-                continue
-        
-        # Ordenar la lista de procesos
-        if sort_by in ['cpu_percent', 'memory_percent', 'pid', 'num_threads']:
-            processes.sort(key=lambda x: x.get(sort_by, 0), reverse=descending)
-        elif sort_by == 'name':
-            processes.sort(key=lambda x: x.get('name', '').lower(), reverse=descending)
-        
-        # Limitar resultados si se especifica
-        if limit is not None:
-            processes = processes[:limit]
-        
-        return processes
+            
+            # Cada campo se resuelve una sola vez (memory_info / io_counters
+            # pueden ser None si el proceso no es accesible)
+            mem = proc_info['memory_info']
+            rss, vms = (mem.rss, mem.vms) if mem is not None else (0, 0)
+            io_read, io_write = ((io_counters.read_bytes, io_counters.write_bytes)
+                                 if io_counters is not None else (0, 0))
+            return (
+                proc.pid,
+                static[1],
+                proc_info['status'] or 'Unknown',
+                round(proc_info['memory_percent'] or 0, 2),
+                round(proc_info['cpu_percent'] or 0, 2),
+                static[2],
+                create_time,
+                proc_info['num_threads'] or 0,
+                rss,
+                vms,
+                io_read,
+                io_write,
+            ), static
+            
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            # El proceso ya no existe, no tenemos acceso, o es zombie
+            return None
     
     def get_process_info(self, pid: int) -> Optional[Dict[str, Any]]:
         """
@@ -142,6 +196,9 @@ class ProcessManager:
         """
         Termina un proceso dado su PID.
         
+        Bloquea hasta 3 segundos esperando a que el proceso termine; desde la
+        interfaz gráfica conviene usar kill_process_async.
+        
         Args:
             pid: ID del proceso a terminar.
             force: Si True, usa SIGKILL (forzado). Si False, usa SIGTERM (graceful).
@@ -152,6 +209,92 @@ class ProcessManager:
                 - message: Mensaje descriptivo del resultado
                 - pid: PID del proceso
         """
+        sent = self._send_signal(pid, force)
+        if isinstance(sent, dict):
+            return sent
+        proc, proc_name, action = sent
+        
+        # Esperar un poco para que el proceso termine
+        try:
+            proc.wait(timeout=3)
+        except psutil.TimeoutExpired:
+            # Si no termina en 3 segundos con SIGTERM, informar
+            if not force:
+                return self._not_terminated_result(pid, proc_name)
+        except Exception:
+            pass
+        
+        return self._terminated_result(pid, proc_name, action)
+    
+    def kill_process_async(self, pid: int, force: bool = False,
+                           on_done: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Envía la señal de terminación y retorna de inmediato, sin esperar al proceso.
+        
+        La comprobación de si el proceso terminó se hace en segundo plano
+        (threading.Timer) y su resultado se entrega a on_done, que se invoca
+        desde ese hilo.
+        
+        Args:
+            pid: ID del proceso a terminar.
+            force: Si True, usa SIGKILL (forzado). Si False, usa SIGTERM (graceful).
+            on_done: Callback opcional con el resultado final (mismo formato
+                     que kill_process).
+        
+        Returns:
+            Diccionario con success=None si la señal se envió (resultado
+            pendiente), o el error correspondiente si no se pudo enviar.
+        """
+        sent = self._send_signal(pid, force)
+        if isinstance(sent, dict):
+            return sent
+        proc, proc_name, action = sent
+        self._schedule_recheck(proc, proc_name, action, force, on_done, self.KILL_POLL_ATTEMPTS)
+        return {
+            'success': None,
+            'message': f"Signal sent to process '{proc_name}' (PID: {pid}).",
+            'pid': pid
+        }
+    
+    def _schedule_recheck(self, proc: psutil.Process, proc_name: str, action: str, force: bool,
+                          on_done: Optional[Callable[[Dict[str, Any]], None]], remaining: int) -> None:
+        timer = threading.Timer(self.KILL_POLL_INTERVAL, self._recheck,
+                                args=(proc, proc_name, action, force, on_done, remaining - 1))
+        timer.daemon = True
+        timer.start()
+    
+    def _recheck(self, proc: psutil.Process, proc_name: str, action: str, force: bool,
+                 on_done: Optional[Callable[[Dict[str, Any]], None]], remaining: int) -> None:
+        """Comprueba si el proceso terminó; reprograma hasta agotar los intentos."""
+        if self._is_alive(proc):
+            if remaining > 0:
+                self._schedule_recheck(proc, proc_name, action, force, on_done, remaining)
+                return
+            result = (self._terminated_result(proc.pid, proc_name, action) if force
+                      else self._not_terminated_result(proc.pid, proc_name))
+        else:
+            result = self._terminated_result(proc.pid, proc_name, action)
+        if on_done is not None:
+            on_done(result)
+    
+    @staticmethod
+    def _is_alive(proc: psutil.Process) -> bool:
+        # is_running() compara create_time, por lo que no confunde un PID reutilizado
+        try:
+            return proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return False
+        except psutil.AccessDenied:
+            return True
+    
+    def _send_signal(self, pid: int, force: bool):
+        """
+        Envía SIGTERM/SIGKILL al proceso.
+        
+        Returns:
+            Tupla (proceso, nombre, acción) si la señal se envió, o el
+            diccionario de error a devolver al llamador.
+        """
         try:
             proc = psutil.Process(pid)
             proc_name = proc.name()
@@ -164,24 +307,7 @@ class ProcessManager:
                 # Terminar gracefully (SIGTERM en Linux)
                 proc.terminate()
                 action = "terminated (SIGTERM)"
-            
-            # Esperar un poco para que el proceso termine
-            try:
-                proc.wait(timeout=3)
-            except psutil.TimeoutExpired:
-                # Si no termina en 3 segundos con SIGTERM, informar
-                if not force:
-                    return {
-                        'success': False,
-                        'message': f"Process '{proc_name}' (PID: {pid}) did not terminate gracefully. Try with force=True.",
-                        'pid': pid
-                    }
-            
-            return {
-                'success': True,
-                'message': f"Process '{proc_name}' (PID: {pid}) was {action} successfully.",
-                'pid': pid
-            }
+            return proc, proc_name, action
             
         except psutil.NoSuchProcess:
             return {
@@ -202,6 +328,22 @@ class ProcessManager:
                 'pid': pid
             }
     
+    @staticmethod
+    def _terminated_result(pid: int, proc_name: str, action: str) -> Dict[str, Any]:
+        return {
+            'success': True,
+            'message': f"Process '{proc_name}' (PID: {pid}) was {action} successfully.",
+            'pid': pid
+        }
+    
+    @staticmethod
+    def _not_terminated_result(pid: int, proc_name: str) -> Dict[str, Any]:
+        return {
+            'success': False,
+            'message': f"Process '{proc_name}' (PID: {pid}) did not terminate gracefully. Try with force=True.",
+            'pid': pid
+        }
+    
     def get_process_count(self) -> Dict[str, int]:
         """
         Obtiene el conteo de procesos por estado.
@@ -234,6 +376,7 @@ class ProcessManager:
             Lista de procesos que coinciden con el criterio de búsqueda.
         """
         matching_processes = []
+        # El término se pasa a minúsculas una sola vez, fuera del bucle
         search_term = name.lower()
         
         for proc in psutil.process_iter(['pid', 'name', 'status', 'memory_percent', 'cpu_percent']):
@@ -0,0 +1,119 @@
+"""
+process_table.py - Listado de procesos en formato de columnas
+
+Este módulo contiene la clase ProcessTable, que guarda un escaneo de procesos
+como columnas paralelas (``array`` para los campos numéricos y tuplas para los
+textos) en lugar de un diccionario por proceso.
+
+Autor: Project Monitor Team
+"""
+
+from array import array
+from typing import Dict, List, Any, Iterable, Optional, Sequence, Tuple
+
+
+class ProcessTable:
+    """
+    Instantánea inmutable de procesos con layout por columnas (SoA).
+
+    Las filas de entrada son tuplas en el orden de FIELDS. Ordenar o filtrar
+    produce una nueva tabla sin tocar la original.
+    """
+
+    FIELDS = (
+        'pid', 'name', 'status', 'memory_percent', 'cpu_percent', 'username',
+        'create_time', 'num_threads', 'rss_bytes', 'vms_bytes',
+        'io_read_bytes', 'io_write_bytes',
+    )
+    # Tipo de cada columna: código de array o None para tuplas de texto
+    TYPECODES = {
+        'pid': 'q', 'name': None, 'status': None, 'memory_percent': 'd',
+        'cpu_percent': 'd', 'username': None, 'create_time': 'd',
+        'num_threads': 'q', 'rss_bytes': 'q', 'vms_bytes': 'q',
+        'io_read_bytes': 'q', 'io_write_bytes': 'q',
+    }
+
+    def __init__(self, rows: Iterable[Tuple] = (), names_lower: Iterable[str] = ()):
+        """
+        Construye la tabla a partir de filas.
+
+        Args:
+            rows: Tuplas con los valores en el orden de FIELDS.
+            names_lower: Nombres en minúsculas (misma longitud que rows),
+                         usados para ordenar y buscar por nombre.
+        """
+        transposed = list(zip(*rows))
+        if not transposed:
+            transposed = [()] * len(self.FIELDS)
+        self._columns: Dict[str, Sequence] = {
+            field: self._make_column(field, values) for field, values in zip(self.FIELDS, transposed)
+        }
+        self._names_lower: Tuple[str, ...] = tuple(names_lower)
+        self._size = len(transposed[0])
+
+    @classmethod
+    def _make_column(cls, field: str, values: Iterable) -> Sequence:
+        typecode = cls.TYPECODES[field]
+        return tuple(values) if typecode is None else array(typecode, values)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, field: str) -> Sequence:
+        """
+        Devuelve la columna de un campo (array o tupla, de solo lectura por convención).
+        """
+        return self._columns[field]
+
+    @property
+    def names_lower(self) -> Tuple[str, ...]:
+        return self._names_lower
+
+    def sorted(self, sort_by: Optional[str], descending: bool = True, limit: Optional[int] = None) -> 'ProcessTable':
+        """
+        Devuelve una tabla ordenada por un campo (y opcionalmente recortada).
+
+        Se ordena una permutación de índices; las columnas se reordenan una sola vez.
+        'name' se ordena sin distinguir mayúsculas; con sort_by None se conserva el orden.
+        """
+        if sort_by == 'name' and self._names_lower:
+            key_column: Optional[Sequence] = self._names_lower
+        elif sort_by in self._columns:
+            key_column = self._columns[sort_by]
+        else:
+            key_column = None
+        indices: List[int] = list(range(self._size))
+        if key_column is not None:
+            indices.sort(key=key_column.__getitem__, reverse=descending)
+        if limit is not None:
+            indices = indices[:limit]
+        return self.take(indices)
+
+    def filter_name(self, term: str) -> 'ProcessTable':
+        """
+        Devuelve las filas cuyo nombre contiene term (sin distinguir mayúsculas).
+        """
+        term = term.lower()
+        return self.take([i for i, name in enumerate(self._names_lower) if term in name])
+
+    def take(self, indices: Sequence[int]) -> 'ProcessTable':
+        """Devuelve una nueva tabla con las filas indicadas, en ese orden."""
+        table = ProcessTable.__new__(ProcessTable)
+        table._columns = {
+            field: self._make_column(field, (col[i] for i in indices))
+            for field, col in self._columns.items()
+        }
+        names = self._names_lower
+        table._names_lower = tuple(names[i] for i in indices) if names else ()
+        table._size = len(indices)
+        return table
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Devuelve una fila como diccionario."""
+        return {field: col[index] for field, col in self._columns.items()}
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Devuelve la tabla como lista de diccionarios (formato de get_process_list)."""
+        fields = self.FIELDS
+        columns = [self._columns[f] for f in fields]
+        return [dict(zip(fields, values)) for values in zip(*columns)]
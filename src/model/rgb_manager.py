@@ -9,7 +9,8 @@ from __future__ import annotations
 
 import json
 import socket
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional, Tuple
 
 
 class RGBManager:
@@ -17,28 +18,52 @@ class RGBManager:
     Cliente mínimo para OpenRGB (si está disponible).
     """
 
+    AVAILABILITY_TTL = 5.0  # segundos que se reutiliza el resultado de is_available
+
     def __init__(self, host: str = "127.0.0.1", port: int = 6742, timeout: float = 1.0):
         self.host = host
         self.port = port
         self.timeout = timeout
+        # (instante monotónico, disponible) del último intento de conexión
+        self._availability: Optional[Tuple[float, bool]] = None
 
     def is_available(self) -> bool:
+        """
+        Indica si el servidor OpenRGB acepta conexiones (para la UI).
+
+        El veredicto se cachea AVAILABILITY_TTL segundos y también se actualiza
+        con el resultado de cada set_preset.
+        """
+        cached = self._availability
+        if cached is not None and time.monotonic() - cached[0] < self.AVAILABILITY_TTL:
+            return cached[1]
         try:
             with socket.create_connection((self.host, self.port), timeout=self.timeout):
-                return True
+                available = True
         except OSError:
-            return False
+            available = False
+        self._set_availability(available)
+        return available
+
+    def _set_availability(self, available: bool) -> None:
+        self._availability = (time.monotonic(), available)
 
     def set_preset(self, preset: str) -> Dict[str, Any]:
         """
         Envia un preset simple. Depende del servidor OpenRGB escuchando.
         """
-        if not self.is_available():
-            return {"success": False, "message": "OpenRGB no disponible"}
-
         payload = {"command": "set_color", "preset": preset}
+        # Una conexión por preset: el servidor delimita el documento JSON por el
+        # cierre de la conexión (EOF), así que no se reutiliza entre envíos.
+        # Si no se puede conectar, el servidor no está disponible
+        try:
+            conn = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        except OSError:
+            self._set_availability(False)
+            return {"success": False, "message": "OpenRGB no disponible"}
+        self._set_availability(True)
         try:
-            with socket.create_connection((self.host, self.port), timeout=self.timeout) as conn:
+            with conn:
                 conn.sendall(json.dumps(payload).encode("utf-8"))
             return {"success": True, "message": f"Preset RGB enviado: {preset}"}
         except Exception as exc:
@@ -9,7 +9,9 @@ Todo es best-effort: si no se puede leer, devuelve None.
 from __future__ import annotations
 
 import os
-from typing import Dict, Any, List, Optional
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
 
 import psutil
 
@@ -17,12 +19,45 @@ import psutil
 class SensorsReader:
     """
     Lee temperaturas y ventiladores desde psutil y /sys.
+
+    Las lecturas se cachean durante ``ttl`` segundos: psutil recorre todos los
+    archivos de /sys/class/hwmon en cada llamada y la vista consulta varias
+    veces por refresco. Los resultados cacheados se comparten; no modificarlos.
     """
 
+    HWMON_BASE = "/sys/class/hwmon"
+    HWMON_INDEX_TTL = 60.0
+    MSI_EC_BASE = "/sys/devices/platform/msi-ec"
+    MSI_EC_ATTRS = ("realtime_temperature", "realtime_fan_speed")
+
+    def __init__(self, ttl: float = 0.5):
+        self._ttl = ttl
+        # (instante monotónico, resultado) de la última lectura
+        self._temp_cache: Optional[Tuple[float, Dict[str, List[Dict[str, Any]]]]] = None
+        self._fan_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        # Ventiladores hwmon descubiertos (ver _get_hwmon_index)
+        self._hwmon_index: Optional[List[Tuple[str, str, Optional[str]]]] = None
+        self._hwmon_index_ts = 0.0
+        # Atributo msi-ec -> [(etiqueta, ruta)] existentes (ver _get_msi_ec_paths)
+        self._msi_ec_paths: Optional[Dict[str, List[Tuple[str, str]]]] = None
+        self._msi_ec_paths_ts = 0.0
+        # Descriptores abiertos de los archivos sysfs que se releen con pread
+        self._read_fds: Dict[str, int] = {}
+        self._fds_lock = threading.Lock()
+
     def get_temperatures(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         Devuelve temperaturas agrupadas por etiqueta.
         """
+        cached = self._temp_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._ttl:
+            return cached[1]
+        temps = self._read_temperatures()
+        self._temp_cache = (now, temps)
+        return temps
+
+    def _read_temperatures(self) -> Dict[str, List[Dict[str, Any]]]:
         temps = {}
         try:
             raw = psutil.sensors_temperatures(fahrenheit=False)
@@ -30,16 +65,15 @@ class SensorsReader:
             return temps
 
         for name, entries in raw.items():
-            temps[name] = []
-            for entry in entries:
-                temps[name].append(
-                    {
-                        "label": entry.label or name,
-                        "current": entry.current,
-                        "high": getattr(entry, "high", None),
-                        "critical": getattr(entry, "critical", None),
-                    }
-                )
+            temps[name] = [
+                {
+                    "label": entry.label or name,
+                    "current": entry.current,
+                    "high": getattr(entry, "high", None),
+                    "critical": getattr(entry, "critical", None),
+                }
+                for entry in entries
+            ]
         # Añadir temperaturas de msi-ec si están disponibles
         msi_temps = self._read_msi_ec_temperatures()
         if msi_temps:
@@ -51,57 +85,158 @@ class SensorsReader:
         """
         Devuelve lista de ventiladores detectados con velocidad RPM y pwm si existe.
         """
-        fans = []
+        cached = self._fan_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._ttl:
+            return cached[1]
+        fans = self._read_fans()
+        self._fan_cache = (now, fans)
+        return fans
+
+    def _read_fans(self) -> List[Dict[str, Any]]:
         try:
             sensor_fans = psutil.sensors_fans()
         except Exception:
             sensor_fans = {}
 
-        for name, entries in sensor_fans.items():
-            for entry in entries:
-                fans.append(
-                    {
-                        "label": entry.label or name,
-                        "rpm": entry.current,
-                        "path": None,
-                        "pwm": None,
-                    }
-                )
+        fans = [
+            {
+                "label": entry.label or name,
+                "rpm": entry.current,
+                "path": None,
+                "pwm": None,
+            }
+            for name, entries in sensor_fans.items()
+            for entry in entries
+        ]
 
-        # Intentar leer /sys/class/hwmon para obtener pwm ajustable
-        hwmon_base = "/sys/class/hwmon"
-        if os.path.isdir(hwmon_base):
-            for hwmon in os.listdir(hwmon_base):
-                hw_path = os.path.join(hwmon_base, hwmon)
-                name_path = os.path.join(hw_path, "name")
-                try:
-                    with open(name_path, "r", encoding="utf-8") as f:
-                        hw_name = f.readline().strip()
-                except Exception:
-                    hw_name = hwmon
-
-                # Mapear fanX_input y pwmX
-                for entry in os.listdir(hw_path):
-                    if entry.startswith("fan") and entry.endswith("_input"):
-                        prefix = entry.split("_")[0]  # fan1
-                        rpm_path = os.path.join(hw_path, entry)
-                        pwm_path = os.path.join(hw_path, f"{prefix.replace('fan', 'pwm')}")
-                        rpm_val = _safe_read_int(rpm_path)
-                        pwm_val = _safe_read_int(pwm_path) if os.path.exists(pwm_path) else None
-                        fans.append(
-                            {
-                                "label": f"{hw_name}-{prefix}",
-                                "rpm": rpm_val,
-                                "path": rpm_path,
-                                "pwm": pwm_val,
-                                "pwm_path": pwm_path if os.path.exists(pwm_path) else None,
-                            }
-                        )
+        # Leer /sys/class/hwmon (rutas ya descubiertas) para obtener pwm ajustable;
+        # todas las lecturas de la pasada van en un solo lote
+        index = self._get_hwmon_index()
+        paths: List[str] = []
+        for _, rpm_path, pwm_path in index:
+            paths.append(rpm_path)
+            if pwm_path:
+                paths.append(pwm_path)
+        values = iter(self._read_ints(paths))
+        for label, rpm_path, pwm_path in index:
+            rpm_val = next(values)
+            fans.append(
+                {
+                    "label": label,
+                    "rpm": rpm_val,
+                    "path": rpm_path,
+                    "pwm": next(values) if pwm_path else None,
+                    "pwm_path": pwm_path,
+                }
+            )
         # Añadir lectura de msi-ec si existe
         msi_fans = self._read_msi_ec_fans()
         fans.extend(msi_fans)
         return fans
 
+    def _get_hwmon_index(self) -> List[Tuple[str, str, Optional[str]]]:
+        """
+        Devuelve (etiqueta, ruta fanX_input, ruta pwmX o None) de cada ventilador hwmon.
+
+        El recorrido de /sys/class/hwmon se hace una vez y se renueva cada
+        HWMON_INDEX_TTL segundos para tolerar dispositivos conectados en caliente.
+        """
+        now = time.monotonic()
+        if self._hwmon_index is not None and now - self._hwmon_index_ts < self.HWMON_INDEX_TTL:
+            return self._hwmon_index
+        index: List[Tuple[str, str, Optional[str]]] = []
+        try:
+            # scandir usa el d_type del kernel: sin stat() extra por entrada
+            with os.scandir(self.HWMON_BASE) as it:
+                hwmons = sorted(entry.path for entry in it)
+        except OSError:
+            hwmons = []
+        for hw_path in hwmons:
+            try:
+                with os.scandir(hw_path) as it:
+                    entries = {entry.name for entry in it}
+            except OSError:
+                continue
+            hw_name = os.path.basename(hw_path)
+            if "name" in entries:
+                try:
+                    with open(os.path.join(hw_path, "name"), "r", encoding="utf-8") as f:
+                        hw_name = f.readline().strip()
+                except Exception:
+                    pass
+
+            # Mapear fanX_input y pwmX (presencia de pwmX por pertenencia al listado)
+            for entry in sorted(entries):
+                if entry.startswith("fan") and entry.endswith("_input"):
+                    prefix = entry.split("_")[0]  # fan1
+                    pwm_name = prefix.replace("fan", "pwm")
+                    index.append(
+                        (
+                            f"{hw_name}-{prefix}",
+                            os.path.join(hw_path, entry),
+                            os.path.join(hw_path, pwm_name) if pwm_name in entries else None,
+                        )
+                    )
+        if self._hwmon_index is not None:
+            # Las rutas pueden haber cambiado: no conservar descriptores antiguos
+            self.close()
+        self._hwmon_index = index
+        self._hwmon_index_ts = now
+        return index
+
+    def _read_ints(self, paths: List[str]) -> List[Optional[int]]:
+        """
+        Lee un lote de archivos sysfs con un entero cada uno.
+
+        Cada archivo se abre una sola vez (os.open ya los marca O_CLOEXEC) y
+        después se relee con pread en el offset 0 (sysfs regenera el valor),
+        con lo que cada lectura es una única syscall en lugar de
+        open+read+close. None si no es legible.
+        """
+        values: List[Optional[int]] = []
+        with self._fds_lock:
+            fds = self._read_fds
+            for path in paths:
+                data = None
+                fd = fds.get(path)
+                if fd is not None:
+                    try:
+                        data = os.pread(fd, 64, 0)
+                    except OSError:
+                        # Descriptor inválido (dispositivo retirado): reabrir una vez
+                        fds.pop(path, None)
+                        _close_quietly(fd)
+                if data is None:
+                    try:
+                        fd = os.open(path, os.O_RDONLY)
+                    except OSError:
+                        values.append(None)
+                        continue
+                    try:
+                        data = os.pread(fd, 64, 0)
+                        fds[path] = fd
+                    except OSError:
+                        _close_quietly(fd)
+                try:
+                    values.append(int(data.split(b"\n", 1)[0]) if data is not None else None)
+                except ValueError:
+                    values.append(None)
+        return values
+
+    def close(self) -> None:
+        """Cierra los descriptores sysfs abiertos por las lecturas en lote."""
+        with self._fds_lock:
+            fds, self._read_fds = self._read_fds, {}
+        for fd in fds.values():
+            _close_quietly(fd)
+
+    def get_pwm(self, pwm_path: str) -> Optional[int]:
+        """
+        Lee el valor PWM actual (0-255) o None si no es legible.
+        """
+        return self._read_ints([pwm_path])[0]
+
     def set_pwm(self, pwm_path: str, value: int) -> Dict[str, Any]:
         """
         Intenta escribir un valor PWM (0-255). Requiere permisos de escritura.
@@ -111,21 +246,44 @@ class SensorsReader:
                 return {"success": False, "message": "PWM fuera de rango (0-255)"}
             with open(pwm_path, "w", encoding="utf-8") as f:
                 f.write(str(int(value)))
+            # El valor pwm cacheado en get_fans ya no es válido
+            self._fan_cache = None
             return {"success": True, "message": f"PWM ajustado a {value}"}
         except PermissionError:
             return {"success": False, "message": "Permiso denegado al escribir PWM"}
         except Exception as exc:
             return {"success": False, "message": f"Error al escribir PWM: {exc}"}
 
+    def _get_msi_ec_paths(self, attr: str) -> List[Tuple[str, str]]:
+        """
+        Devuelve (etiqueta, ruta) de los archivos msi-ec {cpu,gpu}/<attr> presentes.
+
+        Sin el módulo msi-ec cada lectura sería un open() fallido por tick; la
+        presencia se comprueba una vez y se renueva cada HWMON_INDEX_TTL segundos.
+        """
+        now = time.monotonic()
+        if self._msi_ec_paths is None or now - self._msi_ec_paths_ts >= self.HWMON_INDEX_TTL:
+            found: Dict[str, List[Tuple[str, str]]] = {name: [] for name in self.MSI_EC_ATTRS}
+            if os.path.isdir(self.MSI_EC_BASE):
+                for name in self.MSI_EC_ATTRS:
+                    for label in ("cpu", "gpu"):
+                        path = os.path.join(self.MSI_EC_BASE, label, name)
+                        if os.path.exists(path):
+                            found[name].append((label, path))
+            self._msi_ec_paths = found
+            self._msi_ec_paths_ts = now
+        return self._msi_ec_paths.get(attr, [])
+
     def _read_msi_ec_temperatures(self) -> List[Dict[str, Any]]:
         """
         Lee temperaturas desde /sys/devices/platform/msi-ec/{cpu,gpu}/realtime_temperature.
         """
-        base = "/sys/devices/platform/msi-ec"
         results: List[Dict[str, Any]] = []
-        for label in ("cpu", "gpu"):
-            path = os.path.join(base, label, "realtime_temperature")
-            value = _safe_read_int(path)
+        entries = self._get_msi_ec_paths("realtime_temperature")
+        if not entries:
+            return results
+        values = self._read_ints([path for _, path in entries])
+        for (label, _), value in zip(entries, values):
             if value is not None:
                 results.append({"label": f"msi-ec {label}", "current": float(value), "high": None, "critical": None})
         return results
@@ -134,11 +292,12 @@ class SensorsReader:
         """
         Lee velocidad de ventiladores desde /sys/devices/platform/msi-ec/{cpu,gpu}/realtime_fan_speed.
         """
-        base = "/sys/devices/platform/msi-ec"
         fans: List[Dict[str, Any]] = []
-        for label in ("cpu", "gpu"):
-            path = os.path.join(base, label, "realtime_fan_speed")
-            value = _safe_read_int(path)
+        entries = self._get_msi_ec_paths("realtime_fan_speed")
+        if not entries:
+            return fans
+        values = self._read_ints([path for _, path in entries])
+        for (label, path), value in zip(entries, values):
             if value is not None:
                 fans.append(
                     {
@@ -153,9 +312,8 @@ class SensorsReader:
         return fans
 
 
-def _safe_read_int(path: str) -> Optional[int]:
+def _close_quietly(fd: int) -> None:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return int(f.readline().strip())
-    except Exception:
-        return None
+        os.close(fd)
+    except OSError:
+        pass
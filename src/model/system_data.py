@@ -7,10 +7,22 @@ métricas del sistema operativo. Diseñado para ser compatible con Linux.
 Autor: Project Monitor Team
 """
 
+import errno
+import fcntl
+import heapq
+import os
+import re
+import stat
+import struct
+
+from collections import deque
+
 import psutil
+import threading
 import time
 import subprocess
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 
 
 class SystemData:
@@ -25,6 +37,11 @@ class SystemData:
     """
     
     FRAG_CACHE_TTL = 600  # segundos para reutilizar cálculo de fragmentación de disco
+    RAM_FRAG_CACHE_TTL = 1.0  # segundos para reutilizar el índice de fragmentación de RAM
+    PARTITIONS_CACHE_TTL = 30.0  # segundos para reutilizar la lista de particiones
+    RO_USAGE_CACHE_TTL = 60.0  # segundos para reutilizar disk_usage de montajes de solo lectura
+    # Sistemas de archivos virtuales que no interesa medir
+    PSEUDO_FSTYPES = frozenset({'tmpfs', 'devtmpfs', 'squashfs', 'overlay', 'proc', 'sysfs'})
     
     def __init__(self):
         """
@@ -34,8 +51,33 @@ class SystemData:
         """
         # Almacenar valores iniciales de red para calcular diferencias
         self._last_net_io = psutil.net_io_counters()
-        self._last_net_time = time.time()
+        # Reloj monotónico en ns: inmune a saltos del reloj de pared (NTP, cambios de hora)
+        self._last_net_time_ns = time.monotonic_ns()
+        # get_network_metrics actualiza este estado; puede llamarse desde varios hilos
+        self._net_lock = threading.Lock()
+        # Pool persistente para recolectar las categorías de get_all_metrics en paralelo
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="system_data")
         self._disk_frag_cache: Dict[str, Dict[str, Any]] = {}
+        self._ram_frag_cache: Optional[Tuple[float, Optional[float]]] = None
+        self._buddyinfo_fd: Optional[int] = None
+        self._partitions_cache: Optional[Tuple[float, List[Any]]] = None
+        # (dispositivo, punto de montaje) -> (instante monotónico, disk_usage) de montajes 'ro'
+        self._ro_usage_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        # Las cachés de particiones y de disk_usage 'ro' se usan desde el hilo de
+        # monitoreo y desde la GUI (get_storage_snapshot)
+        self._storage_cache_lock = threading.Lock()
+        # Datos de CPU que no cambian durante la ejecución
+        self._core_count = psutil.cpu_count(logical=False)
+        self._logical_count = psutil.cpu_count(logical=True)
+        try:
+            cpu_freq = psutil.cpu_freq()
+        except Exception:
+            cpu_freq = None
+        self._freq_static = (cpu_freq.min, cpu_freq.max) if cpu_freq else (0, 0)
+        # Lectura inicial de cpu_percent: la primera llamada con interval=None
+        # solo fija la referencia y devuelve 0.0
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
     
     def get_cpu_metrics(self) -> Dict[str, Any]:
         """
@@ -49,19 +91,22 @@ class SystemData:
                 - logical_count: Número de núcleos lógicos
                 - frequency: Frecuencia actual de CPU (si está disponible)
         """
-        cpu_percent_total = psutil.cpu_percent(interval=0.1)
-        cpu_percent_per_core = psutil.cpu_percent(interval=0.1, percpu=True)
+        # Lecturas no bloqueantes: psutil mide desde la llamada anterior
+        # (el propio intervalo de monitoreo separa las muestras)
+        cpu_percent_total = psutil.cpu_percent(interval=None)
+        cpu_percent_per_core = psutil.cpu_percent(interval=None, percpu=True)
         cpu_freq = psutil.cpu_freq()
         
         return {
             'total_percent': cpu_percent_total,
             'per_core_percent': cpu_percent_per_core,
-            'core_count': psutil.cpu_count(logical=False),
-            'logical_count': psutil.cpu_count(logical=True),
+            'core_count': self._core_count,
+            'logical_count': self._logical_count,
             'frequency': {
-                'current': cpu_freq.current if cpu_freq else 0,
-                'min': cpu_freq.min if cpu_freq else 0,
-                'max': cpu_freq.max if cpu_freq else 0
+                'current': cpu_freq.current,
+                # min/max se leen una vez en __init__
+                'min': self._freq_static[0],
+                'max': self._freq_static[1]
             } if cpu_freq else None
         }
     
@@ -104,14 +149,17 @@ class SystemData:
         partitions_info = []
         total_used = 0
         total_size = 0
+        now = time.monotonic()
         
-        partitions = psutil.disk_partitions()
-        
-        for partition in partitions:
+        for partition in self._get_partitions():
             try:
-                usage = psutil.disk_usage(partition.mountpoint)
+                usage = self._get_disk_usage(partition, now)
                 
-                fragmentation = self._get_disk_fragmentation_linux(partition.mountpoint, partition.fstype)
+                # Solo ext* admite la medición de fragmentación
+                fragmentation = (
+                    self._get_disk_fragmentation_linux(partition.mountpoint)
+                    if partition.fstype.startswith('ext') else None
+                )
                 
                 partition_data = {
                     'device': partition.device,
@@ -142,6 +190,45 @@ class SystemData:
             }
         }
     
+    def _get_disk_usage(self, partition: Any, now: float) -> Any:
+        """
+        disk_usage de una partición; en montajes de solo lectura el valor casi
+        no cambia y se reutiliza durante RO_USAGE_CACHE_TTL segundos.
+        """
+        if 'ro' not in partition.opts.split(','):
+            return psutil.disk_usage(partition.mountpoint)
+        key = (partition.device, partition.mountpoint)
+        # Mismo lock que _get_partitions (que purga esta caché); statvfs se hace
+        # fuera del lock para no bloquear al otro hilo con un montaje lento
+        with self._storage_cache_lock:
+            cached = self._ro_usage_cache.get(key)
+        if cached is not None and now - cached[0] < self.RO_USAGE_CACHE_TTL:
+            return cached[1]
+        usage = psutil.disk_usage(partition.mountpoint)
+        with self._storage_cache_lock:
+            self._ro_usage_cache[key] = (now, usage)
+        return usage
+    
+    def _get_partitions(self) -> List[Any]:
+        """
+        Particiones montadas (sin sistemas de archivos virtuales), cacheadas
+        durante PARTITIONS_CACHE_TTL segundos: la topología casi nunca cambia.
+        """
+        now = time.monotonic()
+        with self._storage_cache_lock:
+            cached = self._partitions_cache
+            if cached is not None and now - cached[0] < self.PARTITIONS_CACHE_TTL:
+                return cached[1]
+            partitions = [
+                p for p in psutil.disk_partitions(all=False) if p.fstype not in self.PSEUDO_FSTYPES
+            ]
+            self._partitions_cache = (now, partitions)
+            # Descartar entradas de montajes que ya no están
+            current = {(p.device, p.mountpoint) for p in partitions}
+            for key in [k for k in self._ro_usage_cache if k not in current]:
+                del self._ro_usage_cache[key]
+        return partitions
+    
     def get_network_metrics(self) -> Dict[str, Any]:
         """
         Obtiene las métricas de red (bytes enviados y recibidos).
@@ -158,23 +245,24 @@ class SystemData:
                 - upload_speed: Velocidad de subida en bytes/segundo
                 - download_speed: Velocidad de bajada en bytes/segundo
         """
-        current_net_io = psutil.net_io_counters()
-        current_time = time.time()
-        
-        # Calcular el tiempo transcurrido
-        time_delta = current_time - self._last_net_time
-        
-        # Calcular bytes transferidos en el intervalo
-        bytes_sent_delta = current_net_io.bytes_sent - self._last_net_io.bytes_sent
-        bytes_recv_delta = current_net_io.bytes_recv - self._last_net_io.bytes_recv
+        with self._net_lock:
+            current_net_io = psutil.net_io_counters()
+            current_time_ns = time.monotonic_ns()
+            
+            # Calcular el tiempo transcurrido
+            dt_ns = current_time_ns - self._last_net_time_ns
+            
+            # Calcular bytes transferidos en el intervalo
+            bytes_sent_delta = current_net_io.bytes_sent - self._last_net_io.bytes_sent
+            bytes_recv_delta = current_net_io.bytes_recv - self._last_net_io.bytes_recv
+            
+            # Actualizar valores para la próxima llamada
+            self._last_net_io = current_net_io
+            self._last_net_time_ns = current_time_ns
         
-        # Calcular velocidades (bytes por segundo)
-        upload_speed = bytes_sent_delta / time_delta if time_delta > 0 else 0
-        download_speed = bytes_recv_delta / time_delta if time_delta > 0 else 0
-        
-        # Actualizar valores para la próxima llamada
-        self._last_net_io = current_net_io
-        self._last_net_time = current_time
+        # Calcular velocidades (bytes por segundo) con aritmética entera
+        upload_speed = bytes_sent_delta * 1_000_000_000 // dt_ns if dt_ns > 0 else 0
+        download_speed = bytes_recv_delta * 1_000_000_000 // dt_ns if dt_ns > 0 else 0
         
         return {
             'bytes_sent': bytes_sent_delta,
@@ -193,53 +281,96 @@ class SystemData:
         """
         Obtiene todas las métricas del sistema en una sola llamada.
         
+        Las cuatro categorías son independientes (mayormente E/S), así que se
+        recolectan en paralelo: la latencia es la de la más lenta, no la suma.
+        
         Returns:
             Dict con todas las métricas: cpu, ram, storage, network
         """
-        return {
-            'cpu': self.get_cpu_metrics(),
-            'ram': self.get_ram_metrics(),
-            'storage': self.get_storage_metrics(),
-            'network': self.get_network_metrics(),
-            'timestamp': time.time()
+        futures = {
+            'cpu': self._pool.submit(self.get_cpu_metrics),
+            'ram': self._pool.submit(self.get_ram_metrics),
+            'storage': self._pool.submit(self.get_storage_metrics),
+            'network': self._pool.submit(self.get_network_metrics),
         }
+        metrics = {key: future.result() for key, future in futures.items()}
+        metrics['timestamp'] = time.time()
+        return metrics
+    
+    def close(self) -> None:
+        """Libera el pool de hilos de get_all_metrics y el descriptor de buddyinfo."""
+        self._pool.shutdown(wait=False)
+        fd, self._buddyinfo_fd = self._buddyinfo_fd, None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    
+    def _read_buddyinfo(self) -> Optional[bytes]:
+        """
+        Lee /proc/buddyinfo con pread sobre un descriptor que se mantiene abierto
+        (procfs regenera el contenido al leer desde el offset 0).
+        """
+        try:
+            if self._buddyinfo_fd is None:
+                self._buddyinfo_fd = os.open("/proc/buddyinfo", os.O_RDONLY)
+            fd = self._buddyinfo_fd
+            chunks = []
+            offset = 0
+            while True:
+                chunk = os.pread(fd, 4096, offset)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                offset += len(chunk)
+            return b"".join(chunks)
+        except OSError:
+            return None
 
     def _get_ram_fragmentation_linux(self) -> Optional[float]:
         """
         Calcula un índice simple de fragmentación de RAM a partir de /proc/buddyinfo.
         Valor entre 0 (sin fragmentación) y 1 (alta fragmentación). None si no aplica.
         """
-        try:
-            with open("/proc/buddyinfo", "r", encoding="utf-8") as f:
-                lines = f.readlines()
-        except FileNotFoundError:
-            return None
-        except Exception:
-            return None
+        # Valor cacheado brevemente: buddyinfo cambia poco entre ticks
+        now = time.monotonic()
+        cached = self._ram_frag_cache
+        if cached is not None and now - cached[0] < self.RAM_FRAG_CACHE_TTL:
+            return cached[1]
+        value = self._read_ram_fragmentation()
+        self._ram_frag_cache = (now, value)
+        return value
 
-        total_pages = 0
-        largest_block_pages = 0
-
-        for line in lines:
-            parts = line.strip().split()
-            # Formato: Node 0, zone   DMA  1 2 3 4 ... (contadores por orden)
-            counts = [int(x) for x in parts[4:]]  # los primeros 4 tokens son cabecera
-            for order, count in enumerate(counts):
-                pages = (2 ** order)
-                total_pages += count * pages
-                if count > 0:
-                    largest_block_pages = max(largest_block_pages, pages)
+    def _read_ram_fragmentation(self) -> Optional[float]:
+        data = self._read_buddyinfo()
+        if data is None:
+            return None
 
+        # Formato: Node 0, zone   DMA  1 2 3 4 ... (contadores por orden);
+        # los primeros 4 tokens son cabecera: se separan con un único split acotado
+        zones = []
+        for line in data.splitlines():
+            parts = line.split(None, 4)
+            if len(parts) == 5:
+                zones.append(map(int, parts[4].split()))
+        # Sumar primero por orden (todas las zonas juntas) y recorrer los órdenes una vez
+        order_counts = [sum(column) for column in zip(*zones)]
+        total_pages = sum(count << order for order, count in enumerate(order_counts))
         if total_pages == 0:
             return None
+        largest_block_pages = 1 << max(order for order, count in enumerate(order_counts) if count > 0)
 
         fragmentation_index = 1.0 - (largest_block_pages / total_pages)
         return max(0.0, min(fragmentation_index, 1.0))
 
-    def _get_disk_fragmentation_linux(self, mountpoint: str, fstype: str) -> Optional[float]:
+    def _get_disk_fragmentation_linux(self, mountpoint: str) -> Optional[float]:
         """
-        Intenta obtener un puntaje de fragmentación para sistemas ext basados en e4defrag.
-        Devuelve None si no es soportado o si falla la medición.
+        Intenta obtener un puntaje de fragmentación para sistemas ext (el
+        llamador filtra por tipo de sistema de archivos).
+
+        Usa el ioctl FIEMAP sobre una muestra de archivos y, si no está
+        disponible, e4defrag. Devuelve None si no es soportado o si falla la medición.
         """
         # Cachear resultados para evitar costo en cada lectura
         cached = self._disk_frag_cache.get(mountpoint)
@@ -247,36 +378,146 @@ class SystemData:
         if cached and (now - cached.get("ts", 0) < self.FRAG_CACHE_TTL):
             return cached.get("value")
 
-        if not fstype.startswith("ext"):
-            return None
+        # Primero FIEMAP (sin lanzar procesos); e4defrag solo si el ioctl no aplica
+        normalized = _fiemap_fragmentation(mountpoint)
+        if normalized is None:
+            normalized = self._e4defrag_fragmentation(mountpoint)
 
+        self._disk_frag_cache[mountpoint] = {"ts": now, "value": normalized}
+        return normalized
+
+    @staticmethod
+    def _e4defrag_fragmentation(mountpoint: str) -> Optional[float]:
+        """
+        Puntaje de fragmentación (0-1) según `e4defrag -c`, o None si falla.
+        """
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 ["e4defrag", "-c", mountpoint],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=3,
-                check=False,
             )
-            output = result.stdout or result.stderr
+        except (FileNotFoundError, OSError, subprocess.SubprocessError):
+            return None
+
+        # Límite de 3 s: el temporizador mata el proceso y cierra el bucle de lectura
+        timer = threading.Timer(3.0, proc.kill)
+        timer.daemon = True
+        timer.start()
+        score = None
+        try:
+            # Leer línea a línea y cortar en cuanto aparece el puntaje, sin
+            # esperar al resto del listado por archivo
+            for line in proc.stdout:
+                match = _FRAG_SCORE_RE.search(line)
+                if match:
+                    score = float(match.group(1))
+                    break
+        except (OSError, ValueError):
             score = None
-            for line in output.splitlines():
-                if "Fragmentation score" in line:
-                    # ejemplo: Fragmentation score : 12
-                    try:
-                        score_str = line.split(":")[1].strip().split()[0]
-                        score = float(score_str)
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.terminate()
+            try:
+                proc.stdout.close()
+                proc.wait(timeout=1)
+            except (OSError, subprocess.SubprocessError):
+                # No respondió a terminate(): matarlo y recogerlo (sin zombi)
+                proc.kill()
+                proc.wait()
+
+        if score is not None:
+            # Normalizar a 0-1 asumiendo 0-100 como rango típico
+            normalized = max(0.0, min(score / 100.0, 1.0))
+        else:
+            normalized = None
+        return normalized
+
+
+# Línea de resumen de `e4defrag -c`, p. ej. " Fragmentation score             : 12"
+_FRAG_SCORE_RE = re.compile(r"Fragmentation score\s*:\s*(\d+(?:\.\d+)?)")
+
+# FS_IOC_FIEMAP = _IOWR('f', 11, struct fiemap); cabecera de 32 bytes:
+# fm_start, fm_length (u64), fm_flags, fm_mapped_extents, fm_extent_count, fm_reserved (u32)
+_FS_IOC_FIEMAP = 0xC020660B
+_FIEMAP_HEADER = struct.Struct("=QQIIII")
+_FIEMAP_MAX_SCAN = 2000  # entradas de directorio a examinar como máximo
+_FIEMAP_SAMPLE = 32  # archivos más grandes a medir
+_EXT4_MAX_EXTENT = 128 * 1024 * 1024  # bytes que cubre como máximo un extent de ext4
+
+
+def _fiemap_extent_count(path: str) -> Optional[int]:
+    """
+    Número de extents de un archivo (FIEMAP con fm_extent_count=0, solo cuenta).
+
+    Lanza OSError con ENOTTY/EOPNOTSUPP si el sistema de archivos no soporta FIEMAP.
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW | os.O_NONBLOCK)
+    try:
+        buf = bytearray(_FIEMAP_HEADER.pack(0, 0xFFFFFFFFFFFFFFFF, 0, 0, 0, 0))
+        fcntl.ioctl(fd, _FS_IOC_FIEMAP, buf)
+    finally:
+        os.close(fd)
+    return _FIEMAP_HEADER.unpack(buf)[3]
+
+
+def _fiemap_fragmentation(mountpoint: str) -> Optional[float]:
+    """
+    Estima la fragmentación (0-1) de un montaje con FIEMAP sobre sus archivos más grandes.
+
+    Para cada archivo de la muestra compara los extents reales con los mínimos
+    necesarios para su tamaño; el resultado es el exceso ponderado por tamaño.
+    None si no hay archivos medibles o FIEMAP no está soportado.
+    """
+    try:
+        root_dev = os.stat(mountpoint).st_dev
+    except OSError:
+        return None
+
+    # Recorrido acotado (BFS) sin salir del dispositivo del montaje
+    candidates: List[Tuple[int, str]] = []
+    pending = deque([mountpoint])
+    scanned = 0
+    while pending and scanned < _FIEMAP_MAX_SCAN:
+        directory = pending.popleft()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    scanned += 1
+                    if scanned >= _FIEMAP_MAX_SCAN:
                         break
-                    except Exception:
+                    try:
+                        if entry.is_symlink():
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if st.st_dev != root_dev:
                         continue
+                    if stat.S_ISDIR(st.st_mode):
+                        pending.append(entry.path)
+                    elif stat.S_ISREG(st.st_mode) and st.st_size > 0:
+                        candidates.append((st.st_size, entry.path))
+        except OSError:
+            continue
 
-            if score is not None:
-                # Normalizar a 0-1 asumiendo 0-100 como rango típico
-                normalized = max(0.0, min(score / 100.0, 1.0))
-            else:
-                normalized = None
-        except (FileNotFoundError, subprocess.SubprocessError):
-            normalized = None
+    weighted_excess = 0.0
+    measured_size = 0
+    for size, path in heapq.nlargest(_FIEMAP_SAMPLE, candidates):
+        try:
+            extents = _fiemap_extent_count(path)
+        except OSError as exc:
+            if exc.errno in (errno.ENOTTY, errno.EOPNOTSUPP, errno.EINVAL):
+                return None
+            continue
+        if not extents:
+            continue
+        ideal = -(-size // _EXT4_MAX_EXTENT)  # ceil
+        weighted_excess += size * max(0, extents - ideal) / extents
+        measured_size += size
 
-        self._disk_frag_cache[mountpoint] = {"ts": now, "value": normalized}
-        return normalized
+    if measured_size == 0:
+        return None
+    return max(0.0, min(weighted_excess / measured_size, 1.0))
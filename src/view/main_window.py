@@ -6,18 +6,115 @@ disco, red y una tabla básica de procesos. Se conecta al AppController mediante
 un callback thread-safe usando señales Qt.
 """
 
+import contextlib
 import math
 from typing import Dict, Any, Optional, List, Tuple
 
 from PySide6 import QtCore, QtWidgets, QtGui
 from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis, QPieSeries
 
+from formatting import format_bytes
+
+
+_DARK_COLORS = {
+    "bg": "#111827",
+    "text": "#E4E7F1",
+    "group_border": "#243047",
+    "group_title": "#A5B4FC",
+    "progress_bg": "#0B1220",
+    "button_bg": "#1F2A3E",
+    "button_hover": "#243047",
+    "button_border": "#243047",
+    "table_bg": "#0B1220",
+    "table_grid": "#1F2A3E",
+    "table_selection": "#243B53",
+    "header_bg": "#1F2A3E",
+    "status_bg": "#0B1220",
+    "status_text": "#A5B4FC",
+}
+
+_LIGHT_COLORS = {
+    "bg": "#F3F4F6",
+    "text": "#111827",
+    "group_border": "#D1D5DB",
+    "group_title": "#2563EB",
+    "progress_bg": "#E5E7EB",
+    "button_bg": "#E5E7EB",
+    "button_hover": "#D1D5DB",
+    "button_border": "#D1D5DB",
+    "table_bg": "#FFFFFF",
+    "table_grid": "#E5E7EB",
+    "table_selection": "#DBEAFE",
+    "header_bg": "#E5E7EB",
+    "status_bg": "#E5E7EB",
+    "status_text": "#111827",
+}
+
+
+def _build_stylesheet(colors: Dict[str, str]) -> str:
+    """Genera la hoja de estilos Qt para una paleta de colores."""
+    return (
+        f"""
+        QWidget {{ font-family: 'Segoe UI', 'Noto Sans', sans-serif; color: {colors['text']}; background: {colors['bg']}; }}
+        QGroupBox {{ border: 1px solid {colors['group_border']}; border-radius: 8px; margin-top: 8px; padding: 8px 10px 10px 10px; }}
+        QGroupBox::title {{ subcontrol-origin: margin; left: 10px; padding: 0 4px; color: {colors['group_title']}; font-weight: 600; }}
+        QProgressBar {{ border: 1px solid {colors['group_border']}; border-radius: 6px; background: {colors['progress_bg']}; height: 20px; }}
+        QProgressBar::chunk {{ background-color: #5DA9E9; border-radius: 6px; }}
+        QProgressBar[bar="ram"]::chunk {{ background-color: #8CD17D; }}
+        QProgressBar[alert="warn"]::chunk {{ background-color: #E3B341; }}
+        QProgressBar[alert="crit"]::chunk {{ background-color: #E15D5D; }}
+        QPushButton {{ background: {colors['button_bg']}; border: 1px solid {colors['button_border']}; border-radius: 6px; padding: 6px 12px; color: {colors['text']}; }}
+        QPushButton:hover {{ background: {colors['button_hover']}; }}
+        QTableView {{ background: {colors['table_bg']}; gridline-color: {colors['table_grid']}; selection-background-color: {colors['table_selection']}; }}
+        QHeaderView::section {{ background: {colors['header_bg']}; padding: 6px; border: none; }}
+        QStatusBar {{ background: {colors['status_bg']}; color: {colors['status_text']}; }}
+        """
+    )
+
+
+# Las hojas de estilo de ambos temas se generan una sola vez al importar el módulo
+_DARK_QSS = _build_stylesheet(_DARK_COLORS)
+_LIGHT_QSS = _build_stylesheet(_LIGHT_COLORS)
+
+
+@contextlib.contextmanager
+def _signals_blocked(*widgets: QtCore.QObject):
+    """Bloquea las señales de los widgets durante el bloque y restaura su estado previo."""
+    previous = [w.blockSignals(True) for w in widgets]
+    try:
+        yield
+    finally:
+        for widget, was_blocked in zip(widgets, previous):
+            widget.blockSignals(was_blocked)
+
 
 class MonitorWindow(QtWidgets.QMainWindow):
     """
     Ventana principal de la GUI del monitor.
     """
 
+    # Resultado final de una terminación asíncrona (emitido desde otro hilo)
+    process_kill_finished = QtCore.Signal(dict)
+    # Resultado de la lectura de procesos en el QThreadPool (emitido desde otro hilo)
+    process_table_ready = QtCore.Signal(dict)
+    # Lectura de GPU hecha en el QThreadPool (emitido desde otro hilo)
+    gpu_info_ready = QtCore.Signal(dict)
+
+    TICK_MS = 500  # periodo del temporizador único de refresco
+    AUX_REFRESH_MS = 2000  # periodo por defecto de un panel auxiliar sin intervalo configurado
+    # Paneles auxiliares: (clave en aux_refresh_intervals, pestaña, método de refresco)
+    AUX_PANELS = (
+        ("thermals", "thermals", "_refresh_thermals"),
+        ("gpu", "thermals", "_refresh_gpu"),
+        ("power", "control", "_refresh_power"),
+        ("rgb", "control", "_refresh_rgb_status"),
+        ("fan_pwm", "control", "_refresh_fan_pwm_options"),
+        ("msi_ec", "control", "_refresh_msi_ec"),
+    )
+    NET_YMAX_DECAY = 0.9  # factor por refresco con el que se olvida un pico de red pasado
+    NET_YMAX_TOLERANCE = 0.1  # cambio relativo del máximo que justifica reescalar el eje Y de red
+    FRAG_BRUSH_CACHE_SIZE = 256  # el gradiente usa componentes enteras: pocos colores distintos
+
     def __init__(self, controller, config: Optional[Dict[str, Any]] = None):
         super().__init__()
         self._controller = controller
@@ -26,10 +123,18 @@ class MonitorWindow(QtWidgets.QMainWindow):
         self._theme = str(self._config.get("theme", "dark")).lower()
         self._colors = {}
         self._last_storage: Dict[str, Any] = {}
+        # Pestañas secundarias ya construidas (ver _on_tab_changed)
+        self._built_pages: set = set()
+        # La lista de procesos se obtiene fuera del hilo de la UI, de una en una
+        self._pool = QtCore.QThreadPool.globalInstance()
+        self._proc_in_flight = False
+        self._proc_pending = False
+        # La GPU también se lee en el pool: cada lectura puede lanzar nvidia-smi/rocm-smi
+        # (el modelo no sondea por su cuenta; solo se lee cuando el panel lo pide)
+        self._gpu_in_flight = False
         self._init_charts()
         self._build_ui()
-        self._setup_process_refresh_timer()
-        self._setup_aux_refresh_timer()
+        self._setup_tick_timer()
 
     def _build_ui(self) -> None:
         self.setWindowTitle("Project Monitor - Desktop")
@@ -69,6 +174,7 @@ class MonitorWindow(QtWidgets.QMainWindow):
         # RAM
         self.ram_progress = QtWidgets.QProgressBar()
         self.ram_progress.setRange(0, 100)
+        self.ram_progress.setProperty("bar", "ram")
         self.ram_label = QtWidgets.QLabel("Uso: - / -")
         overview_layout.addWidget(QtWidgets.QLabel("RAM"), 1, 0)
         overview_layout.addWidget(self.ram_progress, 1, 1)
@@ -106,6 +212,10 @@ class MonitorWindow(QtWidgets.QMainWindow):
         window_selector_layout.addWidget(self.window_selector)
         window_selector_layout.addStretch()
         charts_layout.addLayout(window_selector_layout)
+        # Agrupa cambios rápidos de ventana: solo se redibuja tras 150 ms sin cambios
+        self._window_debounce = QtCore.QTimer(self)
+        self._window_debounce.setSingleShot(True)
+        self._window_debounce.setInterval(150)
 
         charts_row = QtWidgets.QHBoxLayout()
         charts_row.setSpacing(10)
@@ -114,7 +224,7 @@ class MonitorWindow(QtWidgets.QMainWindow):
         charts_layout.addLayout(charts_row)
 
         dashboard_layout.addWidget(charts_group)
-        tab.addTab(dashboard_page, "Dashboard")
+        self._dashboard_tab_idx = tab.addTab(dashboard_page, "Dashboard")
 
         # Tabla de procesos
         processes_group = QtWidgets.QGroupBox("Procesos (ordenados por CPU)")
@@ -132,13 +242,15 @@ class MonitorWindow(QtWidgets.QMainWindow):
         toolbar_layout.addStretch()
         processes_layout.addLayout(toolbar_layout)
 
-        self.process_table = QtWidgets.QTableWidget(0, 9)
-        self.process_table.setHorizontalHeaderLabels(
-            ["PID", "Nombre", "CPU %", "RAM %", "RSS", "IO Lect", "IO Escr", "Hilos", "Usuario"]
-        )
+        self._process_model = ProcessTableModel(self)
+        self.process_table = QtWidgets.QTableView()
+        self.process_table.setModel(self._process_model)
+        self.process_table.verticalHeader().setVisible(False)
         header = self.process_table.horizontalHeader()
         header.setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
         header.setDefaultAlignment(QtCore.Qt.AlignLeft)
+        # Orden inicial por CPU descendente, como lo entrega el controlador
+        header.setSortIndicator(2, QtCore.Qt.DescendingOrder)
         self.process_table.setSortingEnabled(True)
         self.process_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.process_table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
@@ -151,36 +263,102 @@ class MonitorWindow(QtWidgets.QMainWindow):
         processes_page_layout.addWidget(processes_group)
         tab.addTab(processes_page, "Procesos")
 
+        # Pestañas secundarias: se construyen la primera vez que se visitan
+        self._tabs = tab
+        self._lazy_pages: Dict[int, str] = {}
+        for key, title in (("thermals", "Térmicos / GPU"), ("control", "Control"), ("fragmentation", "Fragmentación")):
+            page = QtWidgets.QWidget()
+            page_layout = QtWidgets.QVBoxLayout(page)
+            page_layout.setContentsMargins(6, 6, 6, 6)
+            page_layout.setSpacing(8)
+            self._lazy_pages[tab.addTab(page, title)] = key
+        # Índice -> clave de cada pestaña secundaria; las ocultas no se refrescan y
+        # quedan en _stale_pages hasta que se vuelven a mostrar
+        self._page_tabs: Dict[int, str] = dict(self._lazy_pages)
+        self._stale_pages: set = set()
+        tab.currentChanged.connect(self._on_tab_changed)
+
+        main_layout.addWidget(tab)
+        self.setCentralWidget(central)
+
+        # Conexiones
+        self.refresh_process_btn.clicked.connect(self.refresh_process_table)
+        self.kill_process_btn.clicked.connect(self._kill_selected_process)
+        self.process_kill_finished.connect(self._on_kill_finished)
+        self.process_table_ready.connect(self._on_process_table_ready)
+        self.gpu_info_ready.connect(self._on_gpu_info_ready)
+        self.process_table.selectionModel().selectionChanged.connect(self._on_process_selection)
+        self.search_input.returnPressed.connect(self.refresh_process_table)
+        self.window_selector.currentIndexChanged.connect(lambda _index: self._window_debounce.start())
+        self._window_debounce.timeout.connect(self._refresh_charts_from_history)
+
+    def _on_tab_changed(self, index: int) -> None:
+        """
+        Construye el contenido de una pestaña secundaria en su primera visita
+        y pone al día la pestaña mostrada si tiene refrescos pendientes.
+        """
+        if index == self._dashboard_tab_idx and self._charts_dirty:
+            self._charts_dirty = False
+            self._refresh_charts_from_history()
+        key = self._lazy_pages.pop(index, None)
+        if key is not None:
+            page = self._tabs.widget(index)
+            getattr(self, f"_build_{key}_page")(page.layout())
+            self._built_pages.add(key)
+        else:
+            key = self._page_tabs.get(index)
+            if key not in self._stale_pages:
+                return
+        self._stale_pages.discard(key)
+        self._refresh_page(key)
+
+    def _visible_page(self) -> Optional[str]:
+        """Clave de la pestaña secundaria mostrada (None en Dashboard/Procesos)."""
+        return self._page_tabs.get(self._tabs.currentIndex())
+
+    def _refresh_page(self, key: str) -> None:
+        """Refresca el contenido de una pestaña secundaria ya construida."""
+        if key == "thermals":
+            self._refresh_thermals()
+            self._refresh_gpu()
+        elif key == "control":
+            self._refresh_power()
+            self._refresh_rgb_status()
+            self._refresh_fan_pwm_options()
+            self._refresh_msi_ec()
+        elif key == "fragmentation":
+            self._update_fragmentation_tab(self._last_storage)
+
+    def _build_thermals_page(self, layout: QtWidgets.QVBoxLayout) -> None:
         # Panel térmico y GPU
         thermals_group = QtWidgets.QGroupBox("Térmicos y GPU")
         thermals_layout = QtWidgets.QGridLayout(thermals_group)
         thermals_layout.setHorizontalSpacing(16)
         thermals_layout.setVerticalSpacing(6)
-        self.temp_list = QtWidgets.QListWidget()
-        self.fan_list = QtWidgets.QListWidget()
-        self.gpu_list = QtWidgets.QListWidget()
+        # Listas de solo lectura sobre QStringListModel: el refresco solo cambia el
+        # modelo si el texto difiere (sin recrear items cada 2 s)
+        self._temp_model = QtCore.QStringListModel(self)
+        self._fan_model = QtCore.QStringListModel(self)
+        self._gpu_model = QtCore.QStringListModel(self)
+        self.temp_list = self._make_list_view(self._temp_model)
+        self.fan_list = self._make_list_view(self._fan_model)
+        self.gpu_list = self._make_list_view(self._gpu_model)
         thermals_layout.addWidget(QtWidgets.QLabel("Temperaturas"), 0, 0)
         thermals_layout.addWidget(self.temp_list, 1, 0)
         thermals_layout.addWidget(QtWidgets.QLabel("Ventiladores"), 0, 1)
         thermals_layout.addWidget(self.fan_list, 1, 1)
         thermals_layout.addWidget(QtWidgets.QLabel("GPU"), 0, 2)
         thermals_layout.addWidget(self.gpu_list, 1, 2)
-        thermals_page = QtWidgets.QWidget()
-        thermals_page_layout = QtWidgets.QVBoxLayout(thermals_page)
-        thermals_page_layout.setContentsMargins(6, 6, 6, 6)
-        thermals_page_layout.setSpacing(8)
-        thermals_page_layout.addWidget(thermals_group)
-        tab.addTab(thermals_page, "Térmicos / GPU")
+        layout.addWidget(thermals_group)
 
+    def _build_control_page(self, layout: QtWidgets.QVBoxLayout) -> None:
         # Panel de energía
         power_group = QtWidgets.QGroupBox("Perfiles de energía")
         power_layout = QtWidgets.QVBoxLayout(power_group)
         self.power_status_label = QtWidgets.QLabel("Gobernador: -")
         power_layout.addWidget(self.power_status_label)
         self.power_profiles_combo = QtWidgets.QComboBox()
-        self.power_profiles_combo.addItem("Selecciona un perfil")
-        for name in self._config.get("power_profiles", {}).keys():
-            self.power_profiles_combo.addItem(name)
+        self.power_profiles_combo.addItems(["Selecciona un perfil", *self._config.get("power_profiles", {})])
         power_buttons_layout = QtWidgets.QHBoxLayout()
         self.apply_power_btn = QtWidgets.QPushButton("Aplicar perfil")
         power_buttons_layout.addWidget(self.power_profiles_combo)
@@ -206,6 +384,9 @@ class MonitorWindow(QtWidgets.QMainWindow):
         self.rgb_off_btn = QtWidgets.QPushButton("Apagar")
         self.rgb_static_btn = QtWidgets.QPushButton("Estático")
         self.rgb_rainbow_btn = QtWidgets.QPushButton("Arcoíris")
+        self.rgb_off_btn.setProperty("rgb_mode", "off")
+        self.rgb_static_btn.setProperty("rgb_mode", "static")
+        self.rgb_rainbow_btn.setProperty("rgb_mode", "rainbow")
         rgb_layout.addWidget(self.rgb_status, 2)
         rgb_layout.addWidget(self.rgb_off_btn)
         rgb_layout.addWidget(self.rgb_static_btn)
@@ -215,9 +396,7 @@ class MonitorWindow(QtWidgets.QMainWindow):
         profiles_group = QtWidgets.QGroupBox("Perfiles por aplicación")
         profiles_layout = QtWidgets.QHBoxLayout(profiles_group)
         self.app_profile_combo = QtWidgets.QComboBox()
-        self.app_profile_combo.addItem("Selecciona perfil")
-        for name in self._config.get("profiles", {}).keys():
-            self.app_profile_combo.addItem(name)
+        self.app_profile_combo.addItems(["Selecciona perfil", *self._config.get("profiles", {})])
         self.apply_app_profile_btn = QtWidgets.QPushButton("Aplicar perfil manual")
         profiles_layout.addWidget(self.app_profile_combo, 2)
         profiles_layout.addWidget(self.apply_app_profile_btn)
@@ -234,6 +413,8 @@ class MonitorWindow(QtWidgets.QMainWindow):
         self.msi_apply_shift_btn = QtWidgets.QPushButton("Aplicar shift mode")
         self.msi_cooler_on_btn = QtWidgets.QPushButton("Cooler Boost ON")
         self.msi_cooler_off_btn = QtWidgets.QPushButton("Cooler Boost OFF")
+        self.msi_cooler_on_btn.setProperty("cooler_boost", "on")
+        self.msi_cooler_off_btn.setProperty("cooler_boost", "off")
         # batería
         self.msi_bat_start = QtWidgets.QSpinBox()
         self.msi_bat_start.setRange(0, 100)
@@ -273,22 +454,31 @@ class MonitorWindow(QtWidgets.QMainWindow):
         msi_layout.addWidget(self.kbd_backlight_slider, 6, 1, 1, 2)
         msi_layout.addWidget(self.kbd_apply_btn, 6, 3)
 
-        control_page = QtWidgets.QWidget()
-        control_layout = QtWidgets.QVBoxLayout(control_page)
-        control_layout.setContentsMargins(6, 6, 6, 6)
-        control_layout.setSpacing(8)
-        control_layout.addWidget(power_group)
-        control_layout.addWidget(fans_group)
-        control_layout.addWidget(rgb_group)
-        control_layout.addWidget(profiles_group)
-        control_layout.addWidget(msi_group)
-        tab.addTab(control_page, "Control")
-
-        # Pestaña de fragmentación
-        frag_page = QtWidgets.QWidget()
-        frag_layout = QtWidgets.QVBoxLayout(frag_page)
-        frag_layout.setContentsMargins(6, 6, 6, 6)
-        frag_layout.setSpacing(8)
+        layout.addWidget(power_group)
+        layout.addWidget(fans_group)
+        layout.addWidget(rgb_group)
+        layout.addWidget(profiles_group)
+        layout.addWidget(msi_group)
+
+        self.apply_power_btn.clicked.connect(self._apply_power_profile)
+        self.apply_pwm_btn.clicked.connect(self._apply_pwm)
+        for btn in (self.rgb_off_btn, self.rgb_static_btn, self.rgb_rainbow_btn):
+            btn.clicked.connect(self._on_rgb_clicked)
+        self.apply_app_profile_btn.clicked.connect(self._apply_app_profile)
+        self.msi_apply_fan_btn.clicked.connect(self._apply_msi_fan_mode)
+        self.msi_apply_shift_btn.clicked.connect(self._apply_msi_shift_mode)
+        self.msi_cooler_on_btn.clicked.connect(self._on_cooler_boost_clicked)
+        self.msi_cooler_off_btn.clicked.connect(self._on_cooler_boost_clicked)
+        self.msi_apply_bat_btn.clicked.connect(self._apply_msi_battery_thresholds)
+        self.msi_webcam_checkbox.stateChanged.connect(self._toggle_msi_webcam)
+        self.msi_webcam_block_checkbox.stateChanged.connect(self._toggle_msi_webcam_block)
+        self.kbd_backlight_slider.valueChanged.connect(self._on_kbd_backlight_changed)
+        self._kbd_apply_timer.timeout.connect(lambda: self._apply_kbd_backlight(show_dialog=False))
+        self.kbd_apply_btn.clicked.connect(lambda: self._apply_kbd_backlight())
+
+    def _build_fragmentation_page(self, layout: QtWidgets.QVBoxLayout) -> None:
+        self._init_fragmentation_charts()
+        self._apply_frag_style()
 
         frag_header = QtWidgets.QHBoxLayout()
         self.frag_refresh_btn = QtWidgets.QPushButton("Refrescar fragmentación")
@@ -297,7 +487,7 @@ class MonitorWindow(QtWidgets.QMainWindow):
         self.frag_hint_label = QtWidgets.QLabel("Colores según fragmentación (verde=ok, rojo=muy fragmentado). Si no hay dato de fragmentación, se usa el % de uso para colorear.")
         self.frag_hint_label.setWordWrap(True)
         frag_header.addWidget(self.frag_hint_label)
-        frag_layout.addLayout(frag_header)
+        layout.addLayout(frag_header)
 
         self.frag_table = QtWidgets.QTableWidget(0, 5)
         self.frag_table.setHorizontalHeaderLabels(["Mount", "FS", "Uso", "% usado", "Frag"])
@@ -306,7 +496,7 @@ class MonitorWindow(QtWidgets.QMainWindow):
         frag_header_widget.setDefaultAlignment(QtCore.Qt.AlignLeft)
         self.frag_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.frag_table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        frag_layout.addWidget(self.frag_table)
+        layout.addWidget(self.frag_table)
 
         frag_toggle_layout = QtWidgets.QHBoxLayout()
         frag_toggle_layout.addStretch()
@@ -320,48 +510,25 @@ class MonitorWindow(QtWidgets.QMainWindow):
         self.frag_chart_group.addButton(self.frag_treemap_btn, 1)
         frag_toggle_layout.addWidget(self.frag_rings_btn)
         frag_toggle_layout.addWidget(self.frag_treemap_btn)
-        frag_layout.addLayout(frag_toggle_layout)
+        layout.addLayout(frag_toggle_layout)
 
         self.frag_stack = QtWidgets.QStackedWidget()
         self.frag_stack.addWidget(self.frag_ring_view)
         self.frag_stack.addWidget(self.frag_treemap)
         self.frag_stack.setCurrentIndex(0)
-        frag_layout.addWidget(self.frag_stack, 1)
-
-        tab.addTab(frag_page, "Fragmentación")
-
-        main_layout.addWidget(tab)
-        self.setCentralWidget(central)
+        layout.addWidget(self.frag_stack, 1)
 
-        # Conexiones
-        self.refresh_process_btn.clicked.connect(self.refresh_process_table)
-        self.kill_process_btn.clicked.connect(self._kill_selected_process)
-        self.process_table.itemSelectionChanged.connect(self._on_process_selection)
-        self.search_input.returnPressed.connect(self.refresh_process_table)
-        self.window_selector.currentIndexChanged.connect(self._refresh_charts_from_history)
-        self.apply_power_btn.clicked.connect(self._apply_power_profile)
-        self.apply_pwm_btn.clicked.connect(self._apply_pwm)
-        self.rgb_off_btn.clicked.connect(lambda: self._apply_rgb("off"))
-        self.rgb_static_btn.clicked.connect(lambda: self._apply_rgb("static"))
-        self.rgb_rainbow_btn.clicked.connect(lambda: self._apply_rgb("rainbow"))
-        self.apply_app_profile_btn.clicked.connect(self._apply_app_profile)
-        self.msi_apply_fan_btn.clicked.connect(self._apply_msi_fan_mode)
-        self.msi_apply_shift_btn.clicked.connect(self._apply_msi_shift_mode)
-        self.msi_cooler_on_btn.clicked.connect(lambda: self._set_msi_cooler_boost("on"))
-        self.msi_cooler_off_btn.clicked.connect(lambda: self._set_msi_cooler_boost("off"))
-        self.msi_apply_bat_btn.clicked.connect(self._apply_msi_battery_thresholds)
-        self.msi_webcam_checkbox.stateChanged.connect(self._toggle_msi_webcam)
-        self.msi_webcam_block_checkbox.stateChanged.connect(self._toggle_msi_webcam_block)
-        self.kbd_backlight_slider.valueChanged.connect(self._on_kbd_backlight_changed)
-        self._kbd_apply_timer.timeout.connect(lambda: self._apply_kbd_backlight(show_dialog=False))
-        self.kbd_apply_btn.clicked.connect(lambda: self._apply_kbd_backlight())
         self.frag_refresh_btn.clicked.connect(self._refresh_fragmentation_tab)
-        self.frag_rings_btn.clicked.connect(lambda: self._set_frag_chart_mode(0))
-        self.frag_treemap_btn.clicked.connect(lambda: self._set_frag_chart_mode(1))
+        self.frag_chart_group.idClicked.connect(self._set_frag_chart_mode)
         self.frag_rings_btn.setChecked(True)
 
     def _init_charts(self) -> None:
         """Inicializa objetos de gráficas y ejes."""
+        # Buffers de QPointF reutilizados por serie (ver _set_series_points)
+        self._series_points: Dict[QLineSeries, List[QtCore.QPointF]] = {}
+        # Máximo de red seguido con decaimiento y el que fijó el rango actual del eje Y
+        self._net_ymax = 0.0
+        self._net_ymax_applied = 0.0
         # Series
         self.cpu_series = QLineSeries(name="CPU %")
         self.ram_series = QLineSeries(name="RAM %")
@@ -379,7 +546,7 @@ class MonitorWindow(QtWidgets.QMainWindow):
         self.cpu_chart.addSeries(self.cpu_series)
         self.cpu_chart.addSeries(self.ram_series)
         self.cpu_x_axis = QValueAxis()
-        self.cpu_x_axis.setTitleText("Tiempo (s)")
+        self.cpu_x_axis.setTitleText("Tiempo (s, 0 = ahora)")
         self.cpu_y_axis = QValueAxis()
         self.cpu_y_axis.setRange(0, 100)
         self.cpu_y_axis.setTitleText("Porcentaje")
@@ -390,7 +557,7 @@ class MonitorWindow(QtWidgets.QMainWindow):
             series.attachAxis(self.cpu_y_axis)
         self.cpu_chart.legend().setVisible(True)
         self.cpu_chart.legend().setAlignment(QtCore.Qt.AlignBottom)
-        self.cpu_chart_view = QChartView(self.cpu_chart)
+        self.cpu_chart_view = CachedChartView(self.cpu_chart)
         self.cpu_chart_view.setRenderHint(QtGui.QPainter.Antialiasing)
 
         # Chart red
@@ -399,7 +566,7 @@ class MonitorWindow(QtWidgets.QMainWindow):
         self.net_chart.addSeries(self.net_up_series)
         self.net_chart.addSeries(self.net_down_series)
         self.net_x_axis = QValueAxis()
-        self.net_x_axis.setTitleText("Tiempo (s)")
+        self.net_x_axis.setTitleText("Tiempo (s, 0 = ahora)")
         self.net_y_axis = QValueAxis()
         self.net_y_axis.setRange(0, 1)
         self.net_y_axis.setTitleText("Velocidad (bytes/s)")
@@ -410,13 +577,17 @@ class MonitorWindow(QtWidgets.QMainWindow):
             series.attachAxis(self.net_y_axis)
         self.net_chart.legend().setVisible(True)
         self.net_chart.legend().setAlignment(QtCore.Qt.AlignBottom)
-        self.net_chart_view = QChartView(self.net_chart)
+        self.net_chart_view = CachedChartView(self.net_chart)
         self.net_chart_view.setRenderHint(QtGui.QPainter.Antialiasing)
 
         theme = QChart.ChartThemeLight if self._theme == "light" else QChart.ChartThemeDark
         self.cpu_chart.setTheme(theme)
         self.net_chart.setTheme(theme)
-        self._init_fragmentation_charts()
+        # Se redibujan en cada tick: sin animaciones ni marcadores por punto
+        for chart in (self.cpu_chart, self.net_chart):
+            chart.setAnimationOptions(QChart.NoAnimation)
+        for series in (self.cpu_series, self.ram_series, self.net_up_series, self.net_down_series):
+            series.setPointsVisible(False)
 
     def _init_fragmentation_charts(self) -> None:
         """Inicializa widgets para la pestaña de fragmentación."""
@@ -424,62 +595,29 @@ class MonitorWindow(QtWidgets.QMainWindow):
         self.frag_ring_chart.setTitle("Uso por partición (color = fragmentación)")
         self.frag_ring_chart.legend().setVisible(True)
         self.frag_ring_chart.legend().setAlignment(QtCore.Qt.AlignRight)
+        # Serie única: sus porciones se reutilizan entre refrescos (ver _populate_frag_ring_chart)
+        self.frag_ring_series = QPieSeries()
+        self.frag_ring_series.setHoleSize(0.4)
+        self.frag_ring_chart.addSeries(self.frag_ring_series)
         self.frag_ring_view = QChartView(self.frag_ring_chart)
         self.frag_ring_view.setRenderHint(QtGui.QPainter.Antialiasing)
 
         self.frag_treemap = FragmentationTreemap()
+        # Pinceles de la tabla reutilizados entre refrescos (clave: rgba o nombre)
+        self._frag_brushes: Dict[Any, QtGui.QBrush] = {}
+        # Datos mostrados en la última reconstrucción (ver _update_fragmentation_tab)
+        self._last_frag_sig: Optional[Tuple] = None
 
     def _apply_style(self) -> None:
         """Aplica el estilo según el tema configurado."""
-        if self._theme == "light":
-            self._colors = {
-                "bg": "#F3F4F6",
-                "text": "#111827",
-                "group_border": "#D1D5DB",
-                "group_title": "#2563EB",
-                "progress_bg": "#E5E7EB",
-                "button_bg": "#E5E7EB",
-                "button_hover": "#D1D5DB",
-                "button_border": "#D1D5DB",
-                "table_bg": "#FFFFFF",
-                "table_grid": "#E5E7EB",
-                "table_selection": "#DBEAFE",
-                "header_bg": "#E5E7EB",
-                "status_bg": "#E5E7EB",
-                "status_text": "#111827",
-            }
-        else:
-            self._colors = {
-                "bg": "#111827",
-                "text": "#E4E7F1",
-                "group_border": "#243047",
-                "group_title": "#A5B4FC",
-                "progress_bg": "#0B1220",
-                "button_bg": "#1F2A3E",
-                "button_hover": "#243047",
-                "button_border": "#243047",
-                "table_bg": "#0B1220",
-                "table_grid": "#1F2A3E",
-                "table_selection": "#243B53",
-                "header_bg": "#1F2A3E",
-                "status_bg": "#0B1220",
-                "status_text": "#A5B4FC",
-            }
-
-        self.setStyleSheet(
-            f"""
-            QWidget {{ font-family: 'Segoe UI', 'Noto Sans', sans-serif; color: {self._colors['text']}; background: {self._colors['bg']}; }}
-            QGroupBox {{ border: 1px solid {self._colors['group_border']}; border-radius: 8px; margin-top: 8px; padding: 8px 10px 10px 10px; }}
-            QGroupBox::title {{ subcontrol-origin: margin; left: 10px; padding: 0 4px; color: {self._colors['group_title']}; font-weight: 600; }}
-            QProgressBar {{ border: 1px solid {self._colors['group_border']}; border-radius: 6px; background: {self._colors['progress_bg']}; height: 20px; }}
-            QProgressBar::chunk {{ background-color: #5DA9E9; border-radius: 6px; }}
-            QPushButton {{ background: {self._colors['button_bg']}; border: 1px solid {self._colors['button_border']}; border-radius: 6px; padding: 6px 12px; color: {self._colors['text']}; }}
-            QPushButton:hover {{ background: {self._colors['button_hover']}; }}
-            QTableWidget {{ background: {self._colors['table_bg']}; gridline-color: {self._colors['table_grid']}; selection-background-color: {self._colors['table_selection']}; }}
-            QHeaderView::section {{ background: {self._colors['header_bg']}; padding: 6px; border: none; }}
-            QStatusBar {{ background: {self._colors['status_bg']}; color: {self._colors['status_text']}; }}
-            """
-        )
+        light = self._theme == "light"
+        self._colors = _LIGHT_COLORS if light else _DARK_COLORS
+        self.setStyleSheet(_LIGHT_QSS if light else _DARK_QSS)
+        if "fragmentation" in self._built_pages:
+            self._apply_frag_style()
+
+    def _apply_frag_style(self) -> None:
+        """Aplica el tema a las gráficas de la pestaña de fragmentación."""
         theme = QChart.ChartThemeLight if self._theme == "light" else QChart.ChartThemeDark
         self.frag_ring_chart.setTheme(theme)
         self.frag_treemap.set_colors(
@@ -487,19 +625,40 @@ class MonitorWindow(QtWidgets.QMainWindow):
             text=self._colors["text"],
             border=self._colors.get("group_border", "#243047"),
         )
-
-    def _setup_process_refresh_timer(self) -> None:
-        """Refresca la tabla de procesos periódicamente."""
-        interval = float(self._config.get("process_refresh_interval", 5.0)) * 1000
-        self._process_timer = QtCore.QTimer(self)
-        self._process_timer.timeout.connect(self.refresh_process_table)
-        self._process_timer.start(int(interval))
-
-    def _setup_aux_refresh_timer(self) -> None:
-        """Refresca datos térmicos, GPU y energía periódicamente."""
-        self._aux_timer = QtCore.QTimer(self)
-        self._aux_timer.timeout.connect(self._refresh_aux_panels)
-        self._aux_timer.start(2000)
+        # Los colores dependen del tema: forzar la siguiente reconstrucción
+        self._last_frag_sig = None
+
+    def _setup_tick_timer(self) -> None:
+        """
+        Crea un único temporizador que reparte el refresco periódico por ticks:
+        gráficas (si llegaron métricas), paneles auxiliares y tabla de procesos.
+        """
+        process_interval = float(self._config.get("process_refresh_interval", 5.0)) * 1000
+        self._process_every = max(1, round(process_interval / self.TICK_MS))
+        # Cada panel auxiliar tiene su propia cadencia (en ticks)
+        intervals = self._config.get("aux_refresh_intervals", {})
+        self._aux_schedule = [
+            (max(1, round(float(intervals.get(name, self.AUX_REFRESH_MS / 1000)) * 1000 / self.TICK_MS)),
+             page, getattr(self, method))
+            for name, page, method in self.AUX_PANELS
+        ]
+        self._tick_n = 0
+        self._charts_dirty = False
+        self._tick = QtCore.QTimer(self)
+        self._tick.timeout.connect(self._on_tick)
+        self._tick.start(self.TICK_MS)
+
+    def _on_tick(self) -> None:
+        """Despacha las tareas periódicas que tocan en este tick."""
+        self._tick_n += 1
+        n = self._tick_n
+        # Con el Dashboard oculto las gráficas quedan pendientes (ver _on_tab_changed)
+        if self._charts_dirty and self._tabs.currentIndex() == self._dashboard_tab_idx:
+            self._charts_dirty = False
+            self._refresh_charts_from_history()
+        self._refresh_aux_panels(n)
+        if n % self._process_every == 0:
+            self.refresh_process_table()
 
     @QtCore.Slot(dict)
     def handle_metrics(self, metrics: Dict[str, Any]) -> None:
@@ -511,16 +670,23 @@ class MonitorWindow(QtWidgets.QMainWindow):
         self._last_storage = storage or {}
 
         cpu_percent = float(cpu.get("total_percent", 0))
-        self.cpu_progress.setValue(int(cpu_percent))
-        self.cpu_progress.setFormat(f"{cpu_percent:.1f}%")
+        ram_percent = float(ram.get("percent", 0))
+        # Las barras se actualizan sin emitir valueChanged (nadie lo escucha)
+        blockers = [QtCore.QSignalBlocker(bar) for bar in (self.cpu_progress, self.ram_progress)]
+        try:
+            self.cpu_progress.setValue(int(cpu_percent))
+            self.cpu_progress.setFormat(f"{cpu_percent:.1f}%")
+            self.ram_progress.setValue(int(ram_percent))
+            self.ram_progress.setFormat(f"{ram_percent:.1f}%")
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+
         self.cpu_label.setText(
             f"Cores: {cpu.get('core_count', '-')}/{cpu.get('logical_count', '-')}"
             f" | Freq: {self._safe_freq(cpu.get('frequency'))}"
         )
 
-        ram_percent = float(ram.get("percent", 0))
-        self.ram_progress.setValue(int(ram_percent))
-        self.ram_progress.setFormat(f"{ram_percent:.1f}%")
         frag = ram.get("fragmentation")
         frag_text = f" | Frag: {frag*100:.1f}%" if frag is not None else ""
         self.ram_label.setText(
@@ -543,70 +709,75 @@ class MonitorWindow(QtWidgets.QMainWindow):
         download = self._format_speed(network.get("download_speed", 0))
         self.network_label.setText(f"Up: {upload} | Down: {download}")
 
-        history_count = len(self._controller.get_metrics_history())
+        history_count = self._controller.get_history_size()
         self.history_label.setText(
             f"Datos: {history_count} | Última lectura: {metrics.get('read_time', '-')}"
         )
-        self._update_fragmentation_tab(self._last_storage)
+        if self._visible_page() == "fragmentation":
+            self._update_fragmentation_tab(self._last_storage)
+        elif "fragmentation" in self._built_pages:
+            self._stale_pages.add("fragmentation")
 
         self.statusBar().showMessage("Métricas actualizadas")
-        self._refresh_charts_from_history()
+        # Las gráficas y los paneles auxiliares se redibujan en el próximo tick
+        self._charts_dirty = True
         self._apply_alerts(cpu_percent, ram_percent)
-        # Refrescar paneles auxiliares cerca del pulso de métricas
-        self._refresh_thermals()
-        self._refresh_gpu()
-        # Refrescar paneles auxiliares menos frecuentemente
-        # (el timer dedicado los actualizará también)
 
     def refresh_process_table(self) -> None:
-        """Solicita la lista de procesos y refresca la tabla."""
-        try:
-            search_term = self.search_input.text().strip().lower()
-            processes = self._controller.get_process_list(sort_by="cpu_percent", limit=self._config.get("process_list_limit"))
-            if search_term:
-                processes = [p for p in processes if search_term in str(p.get("name", "")).lower()]
-        except Exception as exc:
-            self.statusBar().showMessage(f"Error al obtener procesos: {exc}")
+        """
+        Solicita la lista de procesos en segundo plano; la tabla se refresca
+        al llegar process_table_ready.
+        """
+        if self._proc_in_flight:
+            # Se repite al terminar la lectura en curso (p. ej. cambió la búsqueda)
+            self._proc_pending = True
+            return
+        search_term = self.search_input.text().strip().lower()
+        limit = self._config.get("process_list_limit")
+        controller = self._controller
+
+        def fetch():
+            table = controller.get_process_table(sort_by="cpu_percent", limit=limit)
+            return table.filter_name(search_term) if search_term else table
+
+        self._proc_in_flight = True
+        self._pool.start(_CallbackTask(fetch, self.process_table_ready.emit))
+
+    def _on_process_table_ready(self, result: Dict[str, Any]) -> None:
+        self._proc_in_flight = False
+        if self._proc_pending:
+            self._proc_pending = False
+            self.refresh_process_table()
+        if "error" in result:
+            self.statusBar().showMessage(f"Error al obtener procesos: {result['error']}")
             return
 
-        self.process_table.setRowCount(len(processes))
-
-        columns = [
-            ("pid", False),
-            ("name", False),
-            ("cpu_percent", True),
-            ("memory_percent", True),
-            ("rss_bytes", True),
-            ("io_read_bytes", True),
-            ("io_write_bytes", True),
-            ("num_threads", True),
-            ("username", False),
-        ]
-
-        for row, proc in enumerate(processes):
-            for col, (key, is_numeric) in enumerate(columns):
-                value = proc.get(key, "")
-                if key in ("rss_bytes", "io_read_bytes", "io_write_bytes"):
-                    value = self._format_bytes(value)
-                item = QtWidgets.QTableWidgetItem(str(value))
-                if is_numeric:
-                    item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-                self.process_table.setItem(row, col, item)
-
-        self.kill_process_btn.setEnabled(False)
+        self._process_model.update(result["value"])
+        self._on_process_selection()
         self.statusBar().showMessage("Procesos actualizados")
 
     def _kill_selected_process(self) -> None:
         """Termina el proceso seleccionado en la tabla."""
-        row = self.process_table.currentRow()
-        if row < 0:
+        rows = self.process_table.selectionModel().selectedRows()
+        if not rows:
             return
-        pid_item = self.process_table.item(row, 0)
-        if not pid_item:
+        pid = self._process_model.pid(rows[0].row())
+        self._start_kill(pid, force=False)
+
+    def _start_kill(self, pid: int, force: bool) -> None:
+        """Envía la señal sin bloquear la UI; el resultado llega por process_kill_finished."""
+        result = self._controller.kill_process_async(
+            pid, force=force, on_done=lambda res: self.process_kill_finished.emit({**res, "force": force})
+        )
+        if result.get("success") is None:
+            self.kill_process_btn.setEnabled(False)
+            self.statusBar().showMessage(result.get("message", ""))
             return
-        pid = int(pid_item.text())
-        result = self._controller.kill_process(pid, force=False)
-        if not result.get("success"):
+        # La señal no se pudo enviar: se informa igual que un resultado final
+        self._on_kill_finished({**result, "force": force})
+
+    def _on_kill_finished(self, result: Dict[str, Any]) -> None:
+        if not result.get("success") and not result.get("force"):
             choice = QtWidgets.QMessageBox.question(
                 self,
                 "Forzar terminación",
@@ -614,90 +785,111 @@ class MonitorWindow(QtWidgets.QMainWindow):
                 QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
             )
             if choice == QtWidgets.QMessageBox.Yes:
-                result = self._controller.kill_process(pid, force=True)
+                self._start_kill(result.get("pid"), force=True)
+                return
 
         QtWidgets.QMessageBox.information(self, "Resultado", result.get("message", ""))
         self.refresh_process_table()
 
-    def _on_process_selection(self) -> None:
-        self.kill_process_btn.setEnabled(self.process_table.currentRow() >= 0)
+    def _on_process_selection(self, *_args) -> None:
+        self.kill_process_btn.setEnabled(self.process_table.selectionModel().hasSelection())
 
     def closeEvent(self, event) -> None:  # noqa: N802
         """Detiene el monitoreo al cerrar la ventana."""
         try:
+            # Evitar que una lectura de procesos en curso emita sobre la ventana cerrada
+            self._pool.waitForDone(2000)
             self._controller.cleanup()
         finally:
             super().closeEvent(event)
 
     def _refresh_charts_from_history(self) -> None:
         """Actualiza series de gráficas a partir del historial reciente."""
-        history = self._controller.get_metrics_history()
-        if not history:
-            return
-
-        window_seconds = self._selected_window_seconds()
-        latest_ts = history[-1]["timestamp"]
-        recent = [h for h in history if h["timestamp"] >= latest_ts - window_seconds]
-        if not recent:
+        # El buffer localiza el inicio de la ventana por bisección y solo copia esas muestras
+        history = self._controller.get_metrics_history_columns(self._selected_window_seconds())
+        recent_ts = history["timestamp"]
+        if not recent_ts:
             return
 
-        base_time = recent[0]["timestamp"]
-
-        cpu_points = []
-        ram_points = []
-        up_points = []
-        down_points = []
-
-        for entry in recent:
-            x = entry["timestamp"] - base_time
-            cpu_points.append((x, entry.get("cpu_percent", 0)))
-            ram_points.append((x, entry.get("ram_percent", 0)))
-            up_points.append((x, entry.get("network_upload", 0)))
-            down_points.append((x, entry.get("network_download", 0)))
-
-        self._set_series_points(self.cpu_series, cpu_points)
-        self._set_series_points(self.ram_series, ram_points)
-        self._set_series_points(self.net_up_series, up_points)
-        self._set_series_points(self.net_down_series, down_points)
-
-        max_x = max((p[0] for p in cpu_points), default=60.0)
-        self.cpu_x_axis.setRange(0, max_x or 60.0)
-        self.net_x_axis.setRange(0, max_x or 60.0)
-
-        self.cpu_y_axis.setRange(0, 100)
-
-        max_net = max(
-            [p[1] for p in up_points] + [p[1] for p in down_points] + [1]
-        )
-        self.net_y_axis.setRange(0, max_net * 1.2)
+        # Eje X relativo a la muestra más reciente (-ventana ... 0 s): las etiquetas
+        # no crecen con el tiempo de ejecución
+        latest = recent_ts[-1]
+        xs = [ts - latest for ts in recent_ts]
+        up_values = history["network_upload"]
+        down_values = history["network_download"]
+        # Más puntos que píxeles no aportan nada: reducir cada serie al ancho de la vista
+        n_out = max(64, self.cpu_chart_view.viewport().width())
+        cpu_xy = _downsample_lttb(xs, history["cpu_percent"], n_out)
+        ram_xy = _downsample_lttb(xs, history["ram_percent"], n_out)
+        up_xy = _downsample_lttb(xs, up_values, n_out)
+        down_xy = _downsample_lttb(xs, down_values, n_out)
+
+        # Un replace() por serie y los repintados suspendidos hasta terminar:
+        # la vista se redibuja una sola vez con todos los cambios
+        views = (self.cpu_chart_view, self.net_chart_view)
+        for view in views:
+            view.setUpdatesEnabled(False)
+        try:
+            self._set_series_points(self.cpu_series, *cpu_xy)
+            self._set_series_points(self.ram_series, *ram_xy)
+            self._set_series_points(self.net_up_series, *up_xy)
+            self._set_series_points(self.net_down_series, *down_xy)
+
+            # xs es creciente y termina en 0; con una sola muestra se muestran 60 s
+            min_x = xs[0] if xs[0] < 0 else -60.0
+            self.cpu_x_axis.setRange(min_x, 0.0)
+            self.net_x_axis.setRange(min_x, 0.0)
+
+            self.cpu_y_axis.setRange(0, 100)
+
+            # Escala sobre los valores originales: el muestreo no garantiza conservar el pico
+            max_net = max(max(up_values, default=0), max(down_values, default=0), 1)
+            # El pico decae poco a poco y el eje solo se reescala si se aleja más de
+            # un 10 % del aplicado: el 20 % de margen sigue cubriendo los picos nuevos
+            ymax = self._net_ymax = max(self._net_ymax * self.NET_YMAX_DECAY, max_net)
+            applied = self._net_ymax_applied
+            if abs(ymax - applied) > self.NET_YMAX_TOLERANCE * max(applied, 1.0):
+                self._net_ymax_applied = ymax
+                self.net_y_axis.setRange(0, ymax * 1.2)
+        finally:
+            for view in views:
+                view.setUpdatesEnabled(True)
+                view.invalidate()
 
     def _selected_window_seconds(self) -> float:
         """Devuelve la ventana temporal elegida en segundos."""
         mapping = {0: 300, 1: 900, 2: 3600}
         return float(mapping.get(self.window_selector.currentIndex(), 300))
 
-    def _refresh_aux_panels(self) -> None:
-        """Actualiza paneles de sensores, GPU, energía, batería y fan PWM."""
-        self._refresh_thermals()
-        self._refresh_gpu()
-        self._refresh_power()
-        self._refresh_rgb_status()
-        self._refresh_fan_pwm_options()
-        self._refresh_msi_ec()
+    def _refresh_aux_panels(self, tick: int) -> None:
+        """
+        Actualiza los paneles auxiliares a los que les toca en este tick.
+
+        Solo se refresca la pestaña visible; las construidas pero ocultas se
+        marcan pendientes y se actualizan al mostrarse (ver _on_tab_changed).
+        """
+        visible = self._visible_page()
+        for every, page, refresh in self._aux_schedule:
+            if tick % every:
+                continue
+            if page == visible:
+                refresh()
+            elif page in self._built_pages:
+                self._stale_pages.add(page)
 
     def _refresh_thermals(self) -> None:
         temps = self._controller.get_temperatures()
-        self.temp_list.clear()
-        for name, entries in temps.items():
-            for entry in entries:
-                line = f"{entry['label']} {entry['current']:.1f}°C"
-                self.temp_list.addItem(line)
+        temp_lines = [
+            f"{entry['label']} {entry['current']:.1f}°C"
+            for entries in temps.values()
+            for entry in entries
+        ]
 
         fans = self._controller.get_fans()
-        self.fan_list.clear()
         if not fans:
-            self.fan_list.addItem("No se detectaron ventiladores")
+            fan_lines = ["No se detectaron ventiladores"]
         else:
+            fan_lines = []
             for fan in fans:
                 rpm = fan.get("rpm") or 0
                 line = f"{fan.get('label', 'fan')} - {rpm}"
@@ -705,29 +897,56 @@ class MonitorWindow(QtWidgets.QMainWindow):
                     line += " (msi-ec)"
                 else:
                     line += " RPM"
-                self.fan_list.addItem(line)
+                fan_lines.append(line)
 
         bat = self._controller.get_battery_info()
         if bat:
             plug = "AC" if bat.get("plugged") else "Batería"
             secs = bat.get("secs_left")
             remaining = f"{secs//60} min" if secs and secs > 0 else "N/A"
-            self.temp_list.addItem(f"Batería: {bat.get('percent', 0):.0f}% ({plug}) {remaining}")
+            temp_lines.append(f"Batería: {bat.get('percent', 0):.0f}% ({plug}) {remaining}")
+
+        self._set_list_lines(self._temp_model, temp_lines)
+        self._set_list_lines(self._fan_model, fan_lines)
 
     def _refresh_gpu(self) -> None:
-        gpus = self._controller.get_gpu_info()
-        self.gpu_list.clear()
+        """
+        Solicita la lectura de GPU en segundo plano; la lista se actualiza al
+        llegar gpu_info_ready. Es la única capa asíncrona: GPUManager lee bajo
+        demanda. Si ya hay una lectura en curso no se encola otra.
+        """
+        if self._gpu_in_flight:
+            return
+        self._gpu_in_flight = True
+        self._pool.start(_CallbackTask(self._controller.get_gpu_info, self.gpu_info_ready.emit))
+
+    def _on_gpu_info_ready(self, result: Dict[str, Any]) -> None:
+        self._gpu_in_flight = False
+        gpus = result.get("value")
         if not gpus:
-            self.gpu_list.addItem("Sin GPU detectada o comandos no disponibles")
+            self._set_list_lines(self._gpu_model, ["Sin GPU detectada o comandos no disponibles"])
             return
-        for gpu in gpus:
-            line = (
-                f"{gpu.get('vendor')} {gpu.get('name')} | "
-                f"Uso {gpu.get('utilization', 0):.0f}% | "
-                f"VRAM {gpu.get('mem_used_mb', 0):.0f}/{gpu.get('mem_total_mb', 0):.0f} MB | "
-                f"T {gpu.get('temperature', 0):.0f}°C"
-            )
-            self.gpu_list.addItem(line)
+        lines = [
+            f"{gpu.get('vendor')} {gpu.get('name')} | "
+            f"Uso {gpu.get('utilization', 0):.0f}% | "
+            f"VRAM {gpu.get('mem_used_mb', 0):.0f}/{gpu.get('mem_total_mb', 0):.0f} MB | "
+            f"T {gpu.get('temperature', 0):.0f}°C"
+            for gpu in gpus
+        ]
+        self._set_list_lines(self._gpu_model, lines)
+
+    @staticmethod
+    def _make_list_view(model: QtCore.QStringListModel) -> QtWidgets.QListView:
+        view = QtWidgets.QListView()
+        view.setModel(model)
+        view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        return view
+
+    @staticmethod
+    def _set_list_lines(model: QtCore.QStringListModel, lines: List[str]) -> None:
+        """Actualiza una lista solo si su contenido cambió."""
+        if model.stringList() != lines:
+            model.setStringList(lines)
 
     def _refresh_power(self) -> None:
         state = self._controller.get_power_state()
@@ -744,16 +963,17 @@ class MonitorWindow(QtWidgets.QMainWindow):
 
     def _refresh_fan_pwm_options(self) -> None:
         fans = self._controller.get_fans()
-        pwm_fans = [f for f in fans if f.get("pwm_path")]
-        current_items = {self.fan_pwm_combo.itemText(i): i for i in range(self.fan_pwm_combo.count())}
-        # Reset combo if needed
-        self.fan_pwm_combo.blockSignals(True)
-        self.fan_pwm_combo.clear()
-        self.fan_pwm_combo.addItem("Selecciona fan PWM")
-        for fan in pwm_fans:
-            label = fan.get("label", "fan")
-            self.fan_pwm_combo.addItem(label, fan.get("pwm_path"))
-        self.fan_pwm_combo.blockSignals(False)
+        pwm_fans = [(f.get("label", "fan"), f["pwm_path"]) for f in fans if f.get("pwm_path")]
+        combo = self.fan_pwm_combo
+        current = [(combo.itemText(i), combo.itemData(i)) for i in range(1, combo.count())]
+        # Solo se rehace si cambió la lista (así tampoco se pierde la selección)
+        if pwm_fans == current:
+            return
+        with _signals_blocked(combo):
+            combo.clear()
+            combo.addItem("Selecciona fan PWM")
+            for label, pwm_path in pwm_fans:
+                combo.addItem(label, pwm_path)
 
     def _refresh_fragmentation_tab(self) -> None:
         """Refresca los datos de fragmentación bajo demanda."""
@@ -772,43 +992,66 @@ class MonitorWindow(QtWidgets.QMainWindow):
 
     def _update_fragmentation_tab(self, storage: Dict[str, Any]) -> None:
         partitions = storage.get("partitions", []) if storage else []
-        self.frag_table.setRowCount(len(partitions))
-        for row, part in enumerate(partitions):
-            mount = part.get("mountpoint", "?")
-            fstype = part.get("fstype", "-")
-            used = self._format_bytes(part.get("used", 0))
-            total = self._format_bytes(part.get("total", 0))
-            percent = part.get("percent", 0.0) or 0.0
-            frag = part.get("fragmentation")
-            frag_text = "-" if frag is None else f"{frag*100:.1f}%"
-
-            items = [
-                QtWidgets.QTableWidgetItem(mount),
-                QtWidgets.QTableWidgetItem(fstype),
-                QtWidgets.QTableWidgetItem(f"{used} / {total}"),
-                QtWidgets.QTableWidgetItem(f"{percent:.1f}%"),
-                QtWidgets.QTableWidgetItem(frag_text),
-            ]
-            for idx, item in enumerate(items):
-                if idx >= 3:
-                    item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-                self.frag_table.setItem(row, idx, item)
-            color = self._color_for_fragmentation(frag, percent)
-            items[-1].setBackground(QtGui.QBrush(color))
-            dark_text = frag is not None and frag > 0.6
-            items[-1].setForeground(QtGui.QBrush(QtGui.QColor("#0B1220" if dark_text else self._colors.get("text", "#E4E7F1"))))
+        # La fragmentación cambia en minutos: no rehacer tabla y gráficas si nada cambió
+        sig = tuple(
+            (p.get("mountpoint"), p.get("fstype"), p.get("used"), p.get("total"),
+             p.get("percent"), p.get("fragmentation"))
+            for p in partitions
+        )
+        if sig == self._last_frag_sig:
+            return
+        self._last_frag_sig = sig
+        table = self.frag_table
+        # setRowCount conserva las filas existentes: solo se crean items para filas nuevas
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(len(partitions))
+            for row, part in enumerate(partitions):
+                mount = part.get("mountpoint", "?")
+                fstype = part.get("fstype", "-")
+                used = self._format_bytes(part.get("used", 0))
+                total = self._format_bytes(part.get("total", 0))
+                percent = part.get("percent", 0.0) or 0.0
+                frag = part.get("fragmentation")
+                frag_text = "-" if frag is None else f"{frag*100:.1f}%"
+
+                texts = (mount, fstype, f"{used} / {total}", f"{percent:.1f}%", frag_text)
+                for idx, text in enumerate(texts):
+                    item = table.item(row, idx)
+                    if item is None:
+                        item = QtWidgets.QTableWidgetItem(text)
+                        if idx >= 3:
+                            item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+                        table.setItem(row, idx, item)
+                    elif item.text() != text:
+                        item.setText(text)
+                # item es ahora la celda de la columna Frag (la última)
+                color = self._color_for_fragmentation(frag, percent)
+                item.setBackground(self._frag_brush(color))
+                dark_text = frag is not None and frag > 0.6
+                item.setForeground(self._frag_brush("#0B1220" if dark_text else self._colors.get("text", "#E4E7F1")))
+        finally:
+            table.setUpdatesEnabled(True)
 
         # Gráficos
         self._populate_frag_ring_chart(partitions)
         self._populate_frag_treemap(partitions)
 
-    def _populate_frag_ring_chart(self, partitions: List[Dict[str, Any]]) -> None:
-        self.frag_ring_chart.removeAllSeries()
-        series = QPieSeries()
-        series.setHoleSize(0.4)
+    def _frag_brush(self, color: Any) -> QtGui.QBrush:
+        """Devuelve un QBrush cacheado para un QColor o un color con nombre."""
+        key = color if isinstance(color, str) else color.rgba()
+        brush = self._frag_brushes.get(key)
+        if brush is None:
+            if len(self._frag_brushes) >= self.FRAG_BRUSH_CACHE_SIZE:
+                self._frag_brushes.clear()
+            brush = self._frag_brushes[key] = QtGui.QBrush(QtGui.QColor(color))
+        return brush
 
+    def _populate_frag_ring_chart(self, partitions: List[Dict[str, Any]]) -> None:
         # ordenar por uso para un colorido más claro
         sorted_parts = sorted(partitions, key=lambda p: p.get("used", 0), reverse=True)
+        label_visible = len(sorted_parts) <= 8
+        entries = []
         for part in sorted_parts:
             used = part.get("used", 0) or 0
             if used <= 0:
@@ -817,15 +1060,25 @@ class MonitorWindow(QtWidgets.QMainWindow):
             label = part.get("mountpoint", "?")
             frag_text = "-" if frag is None else f"{frag*100:.1f}%"
             percent = part.get("percent", 0.0) or 0.0
-            slice_obj = series.append(f"{label} ({percent:.1f}%, frag {frag_text})", used)
-            slice_obj.setLabelVisible(len(sorted_parts) <= 8)
-            slice_obj.setColor(self._color_for_fragmentation(frag, percent))
-        if not series.slices():
-            series.append("Sin datos", 1)
-            series.slices()[-1].setColor(QtGui.QColor(self._colors.get("group_border", "#243047")))
-        self.frag_ring_chart.addSeries(series)
-        self.frag_ring_chart.legend().setVisible(True)
-        self.frag_ring_chart.legend().setAlignment(QtCore.Qt.AlignRight)
+            entries.append((f"{label} ({percent:.1f}%, frag {frag_text})", used,
+                            self._color_for_fragmentation(frag, percent), label_visible))
+        if not entries:
+            entries.append(("Sin datos", 1, QtGui.QColor(self._colors.get("group_border", "#243047")), False))
+
+        # Reutilizar las porciones existentes por posición; crear o quitar solo la diferencia
+        series = self.frag_ring_series
+        slices = series.slices()
+        for extra in slices[len(entries):]:
+            series.remove(extra)
+        for idx, (label, value, color, visible) in enumerate(entries):
+            if idx < len(slices):
+                slice_obj = slices[idx]
+                slice_obj.setLabel(label)
+                slice_obj.setValue(value)
+            else:
+                slice_obj = series.append(label, value)
+            slice_obj.setLabelVisible(visible)
+            slice_obj.setColor(color)
 
     def _populate_frag_treemap(self, partitions: List[Dict[str, Any]]) -> None:
         items = []
@@ -846,29 +1099,15 @@ class MonitorWindow(QtWidgets.QMainWindow):
 
     def _color_for_fragmentation(self, frag: Optional[float], pct_used: Optional[float] = None) -> QtGui.QColor:
         """Devuelve color de gradiente verde->amarillo->rojo según fragmentación.
-        Si no hay fragmentación, usa un gradiente azulado según % usado."""
-        if frag is None:
-            if pct_used is None:
-                return QtGui.QColor("#6B7280") if self._theme == "light" else QtGui.QColor("#4B5563")
-            val = max(0.0, min(1.0, float(pct_used) / 100.0))
-            # Azul claro a azul profundo según uso
-            r = int(96 + (20 - 96) * val)
-            g = int(165 + (50 - 165) * val)
-            b = int(250 + (120 - 250) * val)
-            return QtGui.QColor(r, g, b)
-        val = max(0.0, min(1.0, float(frag)))
-        # 0-0.5: verde a amarillo, 0.5-1: amarillo a rojo
-        if val <= 0.5:
-            t = val / 0.5
-            r = int(34 + (234 - 34) * t)   # 34->234
-            g = int(197 + (179 - 197) * t)  # 197->179
-            b = int(94 + (8 - 94) * t)     # 94->8
-        else:
-            t = (val - 0.5) / 0.5
-            r = int(234 + (239 - 234) * t)  # 234->239
-            g = int(179 + (68 - 179) * t)   # 179->68
-            b = int(8 + (68 - 8) * t)       # 8->68
-        return QtGui.QColor(r, g, b)
+        Si no hay fragmentación, usa un gradiente azulado según % usado.
+
+        Las entradas se acotan y cuantizan a centésimas / % entero para leer el
+        color de una tabla precalculada (ver _fragmentation_color); el QColor
+        devuelto es compartido.
+        """
+        frag_q = -1 if frag is None else round(max(0.0, min(1.0, float(frag))) * 100)
+        pct_q = -1 if pct_used is None else round(max(0.0, min(100.0, float(pct_used))))
+        return _fragmentation_color(frag_q, pct_q, self._theme == "light")
 
     def _apply_power_profile(self) -> None:
         name = self.power_profiles_combo.currentText()
@@ -887,6 +1126,10 @@ class MonitorWindow(QtWidgets.QMainWindow):
         res = self._controller.set_fan_pwm(pwm_path, value)
         QtWidgets.QMessageBox.information(self, "PWM", res.get("message", ""))
 
+    def _on_rgb_clicked(self) -> None:
+        """Slot común de los botones RGB: el preset va en la propiedad rgb_mode."""
+        self._apply_rgb(self.sender().property("rgb_mode"))
+
     def _apply_rgb(self, preset: str) -> None:
         res = self._controller.set_rgb_preset(preset)
         QtWidgets.QMessageBox.information(self, "RGB", res.get("message", ""))
@@ -899,7 +1142,8 @@ class MonitorWindow(QtWidgets.QMainWindow):
         QtWidgets.QMessageBox.information(self, "Perfil", res.get("message", ""))
 
     def _refresh_msi_ec(self) -> None:
-        info = self._controller.get_msi_ec_info()
+        # Una sola pasada por sysfs para todo el panel (ver get_msi_ec_snapshot)
+        info = self._controller.get_msi_ec_snapshot()
         if not info.get("available"):
             self.msi_status_label.setText("MSI-EC no detectado")
             self._kbd_apply_timer.stop()
@@ -932,7 +1176,7 @@ class MonitorWindow(QtWidgets.QMainWindow):
         self._fill_combo(self.msi_shift_combo, shift_modes, info.get("shift_mode"))
 
         # Batería
-        bat = self._controller.get_msi_battery_info()
+        bat = info.get("battery")
         if bat:
             try:
                 self.msi_bat_start.setValue(int(bat.get("start_threshold") or 0))
@@ -941,18 +1185,15 @@ class MonitorWindow(QtWidgets.QMainWindow):
                 pass
 
         # Webcam
-        self.msi_webcam_checkbox.blockSignals(True)
-        self.msi_webcam_block_checkbox.blockSignals(True)
-        self.msi_webcam_checkbox.setChecked((info.get("webcam") or "").lower() == "on")
-        self.msi_webcam_block_checkbox.setChecked((info.get("webcam_block") or "").lower() == "on")
-        self.msi_webcam_checkbox.blockSignals(False)
-        self.msi_webcam_block_checkbox.blockSignals(False)
+        with _signals_blocked(self.msi_webcam_checkbox, self.msi_webcam_block_checkbox):
+            self.msi_webcam_checkbox.setChecked((info.get("webcam") or "").lower() == "on")
+            self.msi_webcam_block_checkbox.setChecked((info.get("webcam_block") or "").lower() == "on")
 
         # Backlight
         try:
             self._kbd_apply_timer.stop()
             self._kbd_backlight_sync = True
-            current_kbd = int(self._controller.get_keyboard_backlight() or 0)
+            current_kbd = int(info.get("kbd_backlight") or 0)
             self.kbd_backlight_slider.setValue(current_kbd)
             self._update_kbd_backlight_label(applied=True)
         except Exception:
@@ -978,13 +1219,21 @@ class MonitorWindow(QtWidgets.QMainWindow):
             widget.setEnabled(True)
 
     def _fill_combo(self, combo: QtWidgets.QComboBox, options: list, current: Optional[str]) -> None:
-        combo.blockSignals(True)
-        combo.clear()
-        for opt in options:
-            combo.addItem(opt)
-        if current and current in options:
-            combo.setCurrentText(current)
-        combo.blockSignals(False)
+        existing = [combo.itemText(i) for i in range(combo.count())]
+        options = list(options)
+        with _signals_blocked(combo):
+            if existing != options:
+                if len(existing) == len(options):
+                    # Mismo número de opciones: renombrar en sitio sin recrear items
+                    for i, (old, new) in enumerate(zip(existing, options)):
+                        if old != new:
+                            combo.setItemText(i, new)
+                else:
+                    combo.clear()
+                    combo.addItems(options)
+            # Con las mismas opciones solo se sincroniza la selección
+            if current and current in options and combo.currentText() != current:
+                combo.setCurrentText(current)
 
     def _apply_msi_fan_mode(self) -> None:
         mode = self.msi_fan_combo.currentText()
@@ -1002,6 +1251,10 @@ class MonitorWindow(QtWidgets.QMainWindow):
         QtWidgets.QMessageBox.information(self, "MSI-EC", res.get("message", ""))
         self._refresh_msi_ec()
 
+    def _on_cooler_boost_clicked(self) -> None:
+        """Slot común de Cooler Boost ON/OFF (propiedad cooler_boost del botón)."""
+        self._set_msi_cooler_boost(self.sender().property("cooler_boost"))
+
     def _set_msi_cooler_boost(self, value: str) -> None:
         res = self._controller.set_msi_cooler_boost(value)
         QtWidgets.QMessageBox.information(self, "MSI-EC", res.get("message", ""))
@@ -1049,11 +1302,7 @@ class MonitorWindow(QtWidgets.QMainWindow):
 
     @staticmethod
     def _format_bytes(bytes_value: float) -> str:
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if abs(bytes_value) < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} PB"
+        return format_bytes(bytes_value)
 
     @staticmethod
     def _safe_freq(freq_info: Optional[Dict[str, Any]]) -> str:
@@ -1062,26 +1311,37 @@ class MonitorWindow(QtWidgets.QMainWindow):
         current = freq_info.get("current")
         return f"{current:.0f} MHz" if current else "-"
 
-    @staticmethod
-    def _set_series_points(series: QLineSeries, points: List[Tuple[float, float]]) -> None:
-        """Reemplaza puntos de una serie de forma segura."""
-        series.replace([QtCore.QPointF(x, y) for x, y in points])
+    def _set_series_points(self, series: QLineSeries, xs: List[float], ys: List[float]) -> None:
+        """
+        Reemplaza todos los puntos de una serie en una sola llamada.
+
+        Los QPointF de cada serie se reutilizan entre refrescos (solo se crean
+        nuevos cuando crece el número de puntos; si hay menos, el buffer se
+        recorta en sitio en lugar de pasar una copia recortada).
+        """
+        buf = self._series_points.setdefault(series, [])
+        n = len(xs)
+        if len(buf) < n:
+            buf.extend(QtCore.QPointF() for _ in range(n - len(buf)))
+        elif len(buf) > n:
+            del buf[n:]
+        for pt, x, y in zip(buf, xs, ys):
+            pt.setX(x)
+            pt.setY(y)
+        # Sin señales bloqueadas: pointsReplaced es lo que redibuja la serie en la gráfica
+        series.replace(buf)
 
     def _format_speed(self, bytes_per_sec: float) -> str:
         """Formatea velocidad en bytes/s a unidades humanas."""
-        for unit in ["B/s", "KB/s", "MB/s", "GB/s"]:
-            if abs(bytes_per_sec) < 1024.0:
-                return f"{bytes_per_sec:.1f} {unit}"
-            bytes_per_sec /= 1024.0
-        return f"{bytes_per_sec:.1f} TB/s"
+        return format_bytes(bytes_per_sec, suffix="/s")
 
     def _apply_alerts(self, cpu_percent: float, ram_percent: float) -> None:
         """Aplica colores y mensajes de alerta según umbrales configurados."""
         cpu_level = self._level_for_value(cpu_percent, "cpu")
         ram_level = self._level_for_value(ram_percent, "ram")
 
-        self._apply_bar_style(self.cpu_progress, cpu_level, default_color="#5DA9E9")
-        self._apply_bar_style(self.ram_progress, ram_level, default_color="#8CD17D")
+        self._apply_bar_style(self.cpu_progress, cpu_level)
+        self._apply_bar_style(self.ram_progress, ram_level)
 
         message_parts = []
         if cpu_level == "crit":
@@ -1106,23 +1366,317 @@ class MonitorWindow(QtWidgets.QMainWindow):
             return "warn"
         return "ok"
 
-    def _apply_bar_style(self, bar: QtWidgets.QProgressBar, level: str, default_color: str) -> None:
-        colors = {"ok": default_color, "warn": "#E3B341", "crit": "#E15D5D"}
-        color = colors.get(level, default_color)
-        bar.setStyleSheet(
-            f"""
-            QProgressBar {{
-                border: 1px solid {self._colors.get('group_border', '#243047')};
-                border-radius: 6px;
-                background: {self._colors.get('progress_bg', '#0B1220')};
-                height: 20px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 6px;
-            }}
-            """
+    @staticmethod
+    def _apply_bar_style(bar: QtWidgets.QProgressBar, level: str) -> None:
+        """
+        Colorea la barra según el nivel de alerta mediante la propiedad dinámica
+        'alert' (reglas en la hoja de estilos); solo se repule si el nivel cambia.
+        """
+        if bar.property("alert") == level:
+            return
+        bar.setProperty("alert", level)
+        style = bar.style()
+        style.unpolish(bar)
+        style.polish(bar)
+        bar.update()
+
+
+def _frag_gradient_color(val: float) -> QtGui.QColor:
+    """Verde -> amarillo (0-0.5) -> rojo (0.5-1) según la fragmentación."""
+    if val <= 0.5:
+        t = val / 0.5
+        r = int(34 + (234 - 34) * t)   # 34->234
+        g = int(197 + (179 - 197) * t)  # 197->179
+        b = int(94 + (8 - 94) * t)     # 94->8
+    else:
+        t = (val - 0.5) / 0.5
+        r = int(234 + (239 - 234) * t)  # 234->239
+        g = int(179 + (68 - 179) * t)   # 179->68
+        b = int(8 + (68 - 8) * t)       # 8->68
+    return QtGui.QColor(r, g, b)
+
+
+def _usage_gradient_color(val: float) -> QtGui.QColor:
+    """Azul claro a azul profundo según el uso (0-1)."""
+    r = int(96 + (20 - 96) * val)
+    g = int(165 + (50 - 165) * val)
+    b = int(250 + (120 - 250) * val)
+    return QtGui.QColor(r, g, b)
+
+
+# Tablas de colores por centésima de fragmentación y por % usado entero:
+# los QColor se crean una vez y se comparten entre tabla, anillos y treemap
+_FRAG_COLOR_LUT = tuple(_frag_gradient_color(i / 100.0) for i in range(101))
+_USAGE_COLOR_LUT = tuple(_usage_gradient_color(i / 100.0) for i in range(101))
+_NO_DATA_COLORS = {False: QtGui.QColor("#4B5563"), True: QtGui.QColor("#6B7280")}
+
+
+def _fragmentation_color(frag_q: int, pct_q: int, light: bool) -> QtGui.QColor:
+    """
+    Color de fragmentación para entradas cuantizadas (consulta en tabla).
+
+    Args:
+        frag_q: Fragmentación en centésimas (0-100) o -1 si no hay dato.
+        pct_q: Porcentaje usado entero (0-100) o -1 si no hay dato.
+        light: Tema claro (solo afecta al gris sin datos).
+    """
+    if frag_q >= 0:
+        return _FRAG_COLOR_LUT[frag_q]
+    if pct_q >= 0:
+        return _USAGE_COLOR_LUT[pct_q]
+    return _NO_DATA_COLORS[light]
+
+
+def _downsample_lttb(xs: List[float], ys: List[float], n_out: int) -> Tuple[List[float], List[float]]:
+    """
+    Reduce una serie a n_out puntos con Largest-Triangle-Three-Buckets (LTTB).
+
+    Conserva el primer y el último punto; de cada cubeta intermedia elige el
+    punto que forma el triángulo de mayor área con el punto elegido anterior
+    y el promedio de la cubeta siguiente, lo que mantiene picos y valles.
+    """
+    n = len(xs)
+    if n_out < 3 or n <= n_out:
+        return xs, ys
+    out_x = [xs[0]]
+    out_y = [ys[0]]
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        # Promedio de la cubeta siguiente (la última es el punto final)
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / count
+        avg_y = sum(ys[next_start:next_end]) / count
+
+        ax = xs[a]
+        ay = ys[a]
+        best_area = -1.0
+        best = a
+        for j in range(int(i * every) + 1, next_start):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+        out_x.append(xs[best])
+        out_y.append(ys[best])
+        a = best
+    out_x.append(xs[-1])
+    out_y.append(ys[-1])
+    return out_x, out_y
+
+
+class ProcessTableModel(QtCore.QAbstractTableModel):
+    """
+    Modelo de la tabla de procesos respaldado por un ProcessTable (columnas).
+
+    Los textos se formatean bajo demanda en data(). update() mantiene cada PID
+    en su fila y solo notifica las filas que cambian, se agregan o se quitan.
+    """
+
+    # (campo de ProcessTable, título, numérico)
+    COLUMNS = (
+        ("pid", "PID", False),
+        ("name", "Nombre", False),
+        ("cpu_percent", "CPU %", True),
+        ("memory_percent", "RAM %", True),
+        ("rss_bytes", "RSS", True),
+        ("io_read_bytes", "IO Lect", True),
+        ("io_write_bytes", "IO Escr", True),
+        ("num_threads", "Hilos", True),
+        ("username", "Usuario", False),
+    )
+    BYTE_FIELDS = frozenset({"rss_bytes", "io_read_bytes", "io_write_bytes"})
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._table = None  # ProcessTable en el orden visible
+        self._columns: List[Any] = []
+        self._byte_text: Dict[Tuple[int, int], str] = {}
+        self._sort: Optional[Tuple[str, bool]] = None  # (campo, descendente)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() or self._table is None else len(self._table)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section: int, orientation, role=QtCore.Qt.DisplayRole):  # noqa: N802
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole and 0 <= section < len(self.COLUMNS):
+            return self.COLUMNS[section][1]
+        return None
+
+    def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        key, _, is_numeric = self.COLUMNS[index.column()]
+        if role == QtCore.Qt.DisplayRole:
+            value = self._columns[index.column()][index.row()]
+            if key not in self.BYTE_FIELDS:
+                return str(value)
+            # Los repintados sin cambio de datos reutilizan el texto ya formateado
+            cell = (index.row(), index.column())
+            text = self._byte_text.get(cell)
+            if text is None:
+                text = self._byte_text[cell] = MonitorWindow._format_bytes(value)
+            return text
+        if role == QtCore.Qt.TextAlignmentRole and is_numeric:
+            return QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter
+        return None
+
+    def pid(self, row: int) -> int:
+        """PID de la fila visible indicada."""
+        return self._columns[0][row]
+
+    def sort(self, column: int, order=QtCore.Qt.AscendingOrder) -> None:
+        if not 0 <= column < len(self.COLUMNS):
+            return
+        self._sort = (self.COLUMNS[column][0], order == QtCore.Qt.DescendingOrder)
+        if self._table is not None:
+            self._reorder(self._table.sorted(*self._sort))
+
+    def update(self, table) -> None:
+        """Reemplaza el contenido por un nuevo escaneo conservando la fila de cada PID."""
+        if self._table is None or not len(self._table):
+            self.beginResetModel()
+            self._set_table(table.sorted(*self._sort) if self._sort else table)
+            self.endResetModel()
+            return
+
+        new_pids = table.column("pid")
+        new_index = {pid: i for i, pid in enumerate(new_pids)}
+
+        # Quitar procesos que ya no están, por tramos contiguos y de abajo hacia arriba
+        gone = [row for row, pid in enumerate(self._table.column("pid")) if pid not in new_index]
+        for first, last in reversed(_contiguous_runs(gone)):
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            self._set_table(self._table.take([i for i in range(len(self._table)) if not first <= i <= last]))
+            self.endRemoveRows()
+
+        # Actualizar los que siguen en su fila y notificar solo las filas con cambios
+        survivors = [new_index[pid] for pid in self._table.column("pid")]
+        before = self._columns
+        self._set_table(table.take(survivors))
+        changed = [
+            row for row in range(len(survivors))
+            if any(old[row] != new[row] for old, new in zip(before, self._columns))
+        ]
+        last_col = len(self.COLUMNS) - 1
+        for first, last in _contiguous_runs(changed):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_col))
+
+        # Agregar procesos nuevos al final
+        present = set(self._table.column("pid"))
+        added = [i for i, pid in enumerate(new_pids) if pid not in present]
+        if added:
+            first = len(survivors)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(added) - 1)
+            self._set_table(table.take(survivors + added))
+            self.endInsertRows()
+
+        if self._sort:
+            self._reorder(self._table.sorted(*self._sort))
+
+    def _reorder(self, table) -> None:
+        """Aplica un nuevo orden de filas moviendo también selección e índices persistentes."""
+        self.layoutAboutToBeChanged.emit()
+        old_pids = self._table.column("pid")
+        new_row = {pid: row for row, pid in enumerate(table.column("pid"))}
+        persistent = self.persistentIndexList()
+        self._set_table(table)
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(new_row[old_pids[idx.row()]], idx.column()) for idx in persistent],
         )
+        self.layoutChanged.emit()
+
+    def _set_table(self, table) -> None:
+        self._table = table
+        self._columns = [table.column(key) for key, _, _ in self.COLUMNS]
+        self._byte_text = {}
+
+
+def _contiguous_runs(rows: List[int]) -> List[Tuple[int, int]]:
+    """Agrupa índices ordenados en tramos (primero, último) consecutivos."""
+    runs: List[Tuple[int, int]] = []
+    for row in rows:
+        if runs and runs[-1][1] == row - 1:
+            runs[-1] = (runs[-1][0], row)
+        else:
+            runs.append((row, row))
+    return runs
+
+
+class _CallbackTask(QtCore.QRunnable):
+    """
+    Tarea de QThreadPool que ejecuta fn y entrega el resultado a on_done.
+
+    on_done recibe {"value": ...} o {"error": str} y se invoca desde el hilo
+    del pool; se usa con Signal.emit para volver al hilo de la UI.
+    """
+
+    def __init__(self, fn, on_done):
+        super().__init__()
+        self._fn = fn
+        self._on_done = on_done
+
+    def run(self) -> None:
+        try:
+            result = {"value": self._fn()}
+        except Exception as exc:
+            result = {"error": str(exc)}
+        self._on_done(result)
+
+
+class CachedChartView(QChartView):
+    """
+    QChartView que pinta la gráfica desde un QPixmap cacheado.
+
+    La escena solo se rasteriza de nuevo cuando cambia (datos, ejes, leyenda)
+    o cambia el tamaño; el resto de repintados (exposición, tooltips, ventanas
+    superpuestas) se resuelven copiando el pixmap.
+    """
+
+    def __init__(self, chart: QChart) -> None:
+        super().__init__(chart)
+        self._cache = QtGui.QPixmap()
+        self._dirty = True
+        # Pocos elementos que cambian en cada tick: el árbol BSP solo añade coste
+        self.scene().setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
+        self.setRubberBand(QChartView.NoRubberBand)
+        self.scene().changed.connect(self.invalidate)
+
+    def invalidate(self, *_args) -> None:
+        """Marca la caché como obsoleta y programa un repintado."""
+        self._dirty = True
+        self.viewport().update()
+
+    def resizeEvent(self, event) -> None:  # noqa: N802
+        self._dirty = True
+        super().resizeEvent(event)
+
+    def paintEvent(self, event) -> None:  # noqa: N802
+        viewport = self.viewport()
+        dpr = viewport.devicePixelRatioF()
+        size = viewport.size() * dpr
+        if self._dirty or self._cache.size() != size:
+            self._cache = QtGui.QPixmap(size)
+            self._cache.setDevicePixelRatio(dpr)
+            self._cache.fill(viewport.palette().color(viewport.backgroundRole()))
+            painter = QtGui.QPainter(self._cache)
+            painter.setRenderHints(self.renderHints())
+            rect = viewport.rect()
+            self.scene().render(painter, QtCore.QRectF(rect), self.mapToScene(rect).boundingRect())
+            painter.end()
+            self._dirty = False
+        painter = QtGui.QPainter(viewport)
+        painter.drawPixmap(0, 0, self._cache)
+        painter.end()
+
+
+# Rellenos (color, trazado), trazado de contornos y (rectángulo, texto) de un treemap
+_TreemapLayout = Tuple[List[Tuple[QtGui.QColor, QtGui.QPainterPath]], QtGui.QPainterPath, List[Tuple[QtCore.QRectF, str]]]
 
 
 class FragmentationTreemap(QtWidgets.QWidget):
@@ -1134,40 +1688,74 @@ class FragmentationTreemap(QtWidgets.QWidget):
         self._bg = QtGui.QColor("#111827")
         self._text = QtGui.QColor("#E4E7F1")
         self._border = QtGui.QColor("#243047")
+        # Rellenos agrupados por color, contorno y textos ya calculados; se rehace
+        # en set_data y al redimensionar
+        self._layout: Optional[_TreemapLayout] = None
         self.setMinimumHeight(260)
 
     def set_colors(self, bg: str, text: str, border: str) -> None:
         self._bg = QtGui.QColor(bg)
         self._text = QtGui.QColor(text)
         self._border = QtGui.QColor(border)
+        self._layout = None
         self.update()
 
     def set_data(self, items: List[Dict[str, Any]]) -> None:
         self._items = items or []
+        self._layout = None
         self.update()
 
+    def resizeEvent(self, event) -> None:  # noqa: N802
+        self._layout = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event) -> None:  # noqa: N802
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
         painter.fillRect(self.rect(), self._bg)
 
-        data = [i for i in self._items if i.get("value", 0) > 0]
-        if not data:
+        if self._layout is None:
+            self._layout = self._build_layout()
+        fills, borders, texts = self._layout
+        if not texts:
             painter.setPen(self._text)
             painter.drawText(self.rect(), QtCore.Qt.AlignCenter, "Sin datos de fragmentación")
             return
 
-        rects = self._layout_rows(data, QtCore.QRectF(self.rect()))
-        for rect, item in rects:
+        # Tres pasadas en lugar de tres cambios de estado por partición:
+        # un drawPath por color, un único contorno y después los textos
+        painter.setPen(QtCore.Qt.NoPen)
+        for color, path in fills:
+            painter.setBrush(color)
+            painter.drawPath(path)
+        painter.setBrush(QtCore.Qt.NoBrush)
+        painter.setPen(QtGui.QPen(self._border, 1))
+        painter.drawPath(borders)
+        painter.setPen(self._text)
+        flags = QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop
+        for rect, text in texts:
+            painter.drawText(rect, flags, text)
+
+    def _build_layout(self) -> _TreemapLayout:
+        """Agrupa rellenos por color, contornos y textos de las particiones para el tamaño actual."""
+        fills: Dict[int, Tuple[QtGui.QColor, QtGui.QPainterPath]] = {}
+        borders = QtGui.QPainterPath()
+        texts: List[Tuple[QtCore.QRectF, str]] = []
+        data = [i for i in self._items if i.get("value", 0) > 0]
+        if not data:
+            return [], borders, texts
+        for rect, item in self._layout_rows(data, QtCore.QRectF(self.rect())):
             color = item.get("color") or self._border
-            painter.fillRect(rect.adjusted(1, 1, -1, -1), color)
-            painter.setPen(QtGui.QPen(self._border, 1))
-            painter.drawRect(rect.adjusted(0.5, 0.5, -0.5, -0.5))
-            painter.setPen(self._text)
+            entry = fills.get(color.rgba())
+            if entry is None:
+                entry = fills[color.rgba()] = (color, QtGui.QPainterPath())
+            entry[1].addRect(rect.adjusted(1, 1, -1, -1))
+            borders.addRect(rect.adjusted(0.5, 0.5, -0.5, -0.5))
             frag = item.get("frag")
             frag_text = "-" if frag is None else f"{frag*100:.1f}%"
             text = f"{item.get('label', '?')} {item.get('percent', 0.0):.1f}% | Frag {frag_text}"
-            painter.drawText(rect.adjusted(6, 6, -6, -6), QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop, text)
+            texts.append((rect.adjusted(6, 6, -6, -6), text))
+        return list(fills.values()), borders, texts
 
     def _layout_rows(self, items: List[Dict[str, Any]], rect: QtCore.QRectF) -> List[Tuple[QtCore.QRectF, Dict[str, Any]]]:
         """Distribuye las particiones en filas proporcionadas por su peso."""